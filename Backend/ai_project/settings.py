@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 import os
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 # Load environment variables from .env file
 load_dotenv()
@@ -83,13 +84,130 @@ WSGI_APPLICATION = 'ai_project.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# DATABASE_PROFILE selects how SQLite connections are set up:
+# - development: SQLite's defaults (rollback journal) and a new connection
+#   per request.
+# - production: WAL journaling, so requests keep reading while populate_news
+#   or analyze_sentiments write. Writers take the lock when their transaction
+#   starts and wait up to busy_timeout for it instead of failing, and
+#   connections are reused across requests. For threaded WSGI servers.
+# - production-asgi: the same pragmas with a connection per request, since
+#   Django cannot reuse connections across async requests.
+# journal_mode is stored in the database file, so switching back to
+# development needs `PRAGMA journal_mode=DELETE` run once.
+SQLITE_TUNED_OPTIONS = {
+    'init_command': ';'.join([
+        'PRAGMA journal_mode=WAL',
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA busy_timeout=5000',
+        'PRAGMA mmap_size=268435456',
+        'PRAGMA cache_size=-20000',
+    ]),
+    'transaction_mode': 'IMMEDIATE',
+}
+
+SQLITE_PROFILES = {
+    'development': {},
+    'production': {
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': SQLITE_TUNED_OPTIONS,
+    },
+    'production-asgi': {
+        'OPTIONS': SQLITE_TUNED_OPTIONS,
+    },
+}
+
+DATABASE_PROFILE = os.getenv('DATABASE_PROFILE', 'development')
+if DATABASE_PROFILE not in SQLITE_PROFILES:
+    raise ImproperlyConfigured(
+        f"DATABASE_PROFILE must be one of: {', '.join(SQLITE_PROFILES)}"
+    )
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        **SQLITE_PROFILES[DATABASE_PROFILE],
+    }
+}
+
+# Set NEWS_DATABASE_NAME to keep the news store (News, NewsSentimentHistory,
+# NewsBuzz) in a database file of its own. Ingestion and scoring then take
+# its write lock rather than the one quote updates and stock reads wait on.
+# api.routers.NewsRouter places the models; migrate each database with
+# `migrate` and `migrate --database news`.
+NEWS_DATABASE = 'news'
+NEWS_DATABASE_NAME = os.getenv('NEWS_DATABASE_NAME')
+if NEWS_DATABASE_NAME:
+    DATABASES[NEWS_DATABASE] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / NEWS_DATABASE_NAME,
+        **SQLITE_PROFILES[DATABASE_PROFILE],
+    }
+
+DATABASE_ROUTERS = ['api.routers.NewsRouter']
+
+
+# Columnar, memory-mapped copy of PriceHistory used for range and analytics reads
+PRICE_STORE_DIR = Path(os.getenv('PRICE_STORE_DIR', BASE_DIR / 'price_store'))
+
+# Days of articles the News table keeps. `archive_news` rolls older ones into
+# NewsSentimentHistory and moves them to gzipped monthly files under
+# NEWS_ARCHIVE_DIR, served by /news/archive. 0 keeps every article in News.
+NEWS_RETENTION_DAYS = int(os.getenv('NEWS_RETENTION_DAYS', '90'))
+NEWS_ARCHIVE_DIR = Path(os.getenv('NEWS_ARCHIVE_DIR', BASE_DIR / 'news_archive'))
+
+
+# Cache
+# The response cache must be shared by every worker and by management commands
+# (which fire invalidations), so the default backend is file based. Set
+# CACHE_BACKEND=locmem for a single-process development server.
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'file')
+
+if CACHE_BACKEND == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'api-responses',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.getenv('CACHE_DIR', str(BASE_DIR / 'cache')),
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
     }
+
+# Seconds each read endpoint's response may be served from the cache
+RESPONSE_CACHE_TTLS = {
+    'stocks': 60,
+    'news': 60,
+    'newsSearch': 60,
+    'newsArchive': 3600,
+    'newsBuzz': 300,
+    'sentimentMovers': 300,
+    'topMovers': 300,
+    'stock-details': 300,
 }
 
+# Per-worker admission limits for endpoints that wait on providers. Past
+# `concurrency` in-flight requests, up to `queue` more wait at most `timeout`
+# seconds for a slot; the rest get the last good response for their query
+# (kept for `stale` seconds) or a 503 with Retry-After.
+ADMISSION_LIMITS = {
+    'topMovers': {'concurrency': 1, 'queue': 0, 'timeout': 0, 'stale': 86400},
+    'stock-details': {'concurrency': 8, 'queue': 16, 'timeout': 5, 'stale': 86400},
+    'stock-details-batch': {'concurrency': 2, 'queue': 4, 'timeout': 5},
+    'news': {'concurrency': 8, 'queue': 32, 'timeout': 5, 'stale': 3600},
+    'price-history': {'concurrency': 4, 'queue': 8, 'timeout': 5},
+}
+
+# Half-life, in hours, of an article's weight in Stock.sentiment_score
+SENTIMENT_HALF_LIFE_HOURS = float(os.getenv('SENTIMENT_HALF_LIFE_HOURS', '48'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -135,7 +253,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -1,5 +1,6 @@
 from django.contrib import admin
-from api.models import Stock, News, PriceHistory, NewsSentimentHistory
+from api.models import Stock, News, PriceHistory, PriceHistoryGap, NewsSentimentHistory
+from api.services.news_search import NewsSearchService
 
 
 @admin.register(Stock)
@@ -16,6 +17,13 @@ class NewsAdmin(admin.ModelAdmin):
     search_fields = ['ticker', 'title', 'content']
     readonly_fields = ['id']
 
+    def get_search_results(self, request, queryset, search_term):
+        # Title, content and ticker all go through the FTS5 index rather
+        # than LIKE '%...%' scans of the whole table.
+        if not search_term:
+            return queryset, False
+        return NewsSearchService().filter(queryset, search_term), False
+
 
 @admin.register(PriceHistory)
 class PriceHistoryAdmin(admin.ModelAdmin):
@@ -24,9 +32,25 @@ class PriceHistoryAdmin(admin.ModelAdmin):
     search_fields = ['stock__ticker']
 
 
+@admin.register(PriceHistoryGap)
+class PriceHistoryGapAdmin(admin.ModelAdmin):
+    list_display = ['stock', 'date', 'checked_at']
+    list_filter = ['date', 'stock']
+    search_fields = ['stock__ticker']
+
+
 @admin.register(NewsSentimentHistory)
 class NewsSentimentHistoryAdmin(admin.ModelAdmin):
     list_display = ['stock', 'date', 'bullish_count', 'bearish_count', 'neutral_count', 'total_news']
     list_filter = ['date', 'stock']
     search_fields = ['stock__ticker']
+    # Rollups may live in another database than Stock (api.routers), so the
+    # changelist must not join them.
+    list_select_related = []
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term:
+            return queryset, False
+        stock_ids = Stock.objects.filter(ticker__icontains=search_term.strip()).values_list('id', flat=True)
+        return queryset.filter(stock_id__in=list(stock_ids)), False
 
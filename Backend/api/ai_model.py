@@ -48,6 +48,39 @@ def predict_sentiment(text, max_length=512):
         return "Neutral"
 
 
+def predict_sentiments(texts, max_length=512, batch_size=16):
+    # One padded forward pass per batch_size texts instead of one per text.
+    labels = ["Neutral"] * len(texts)
+    indexed = [(i, text) for i, text in enumerate(texts) if text and text.strip()]
+    if not indexed:
+        return labels
+    
+    try:
+        tokenizer, model = _load_model()
+        
+        for start in range(0, len(indexed), batch_size):
+            chunk = indexed[start:start + batch_size]
+            inputs = tokenizer(
+                [text for _, text in chunk],
+                return_tensors="pt",
+                truncation=True,
+                padding=True,
+                max_length=max_length
+            )
+            
+            with torch.no_grad():
+                outputs = model(**inputs)
+                predicted = torch.argmax(outputs.logits, dim=1).tolist()
+            
+            for (i, _), predicted_class in zip(chunk, predicted):
+                labels[i] = LABEL_MAP.get(predicted_class, "Neutral")
+    
+    except Exception as e:
+        print(f"Error in batch sentiment prediction: {str(e)}")
+    
+    return labels
+
+
 if __name__ == "__main__":
     test_headlines = [
         "Apple reports strong Q4 revenue beating expectations",
@@ -3,6 +3,7 @@ from django.core.management.base import BaseCommand
 from django.db.models import Q, Count
 from api.models import News
 from api.services.sentiment_service import SentimentService
+from api.services.news_ingestion import NewsIngestionService
 
 
 class Command(BaseCommand):
@@ -82,6 +83,7 @@ class Command(BaseCommand):
         success_count = 0
         error_count = 0
         updated_count = 0
+        ingestion_service = NewsIngestionService()
         
         for i in range(0, total_count, batch_size):
             batch = news_queryset[i:i + batch_size]
@@ -93,6 +95,7 @@ class Command(BaseCommand):
                 f'({len(batch)} articles)...'
             )
             
+            scored_news = []
             for news in batch:
                 try:
                     processed_count += 1
@@ -118,7 +121,7 @@ class Command(BaseCommand):
                     
                     news.sentiment = sentiment
                     news.sentiment_analyzed = True
-                    news.save(update_fields=['sentiment', 'sentiment_analyzed'])
+                    scored_news.append(news)
                     
                     success_count += 1
                     if sentiment_changed or not news.sentiment_analyzed:
@@ -145,6 +148,9 @@ class Command(BaseCommand):
                         )
                     )
             
+            # One bulk write per batch; rollups for the touched days follow
+            ingestion_service.save_sentiments(scored_news)
+            
             self.stdout.write('')
             self.stdout.write(
                 f'  Batch {batch_num} complete: '
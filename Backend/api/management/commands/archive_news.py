@@ -0,0 +1,78 @@
+import time
+from io import StringIO
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, router
+from api.models import News
+from api.services.news_archive import news_archive
+from api.services.news_retention import NewsRetentionService
+
+
+class Command(BaseCommand):
+    help = 'Move articles older than NEWS_RETENTION_DAYS from the News table to the compressed archive'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help=f'Days of articles to keep in News (default: NEWS_RETENTION_DAYS, {settings.NEWS_RETENTION_DAYS})',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=NewsRetentionService.BATCH_SIZE,
+            help=f'Articles archived per transaction (default: {NewsRetentionService.BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report what would be archived (optional)',
+        )
+        parser.add_argument(
+            '--vacuum',
+            action='store_true',
+            help='VACUUM the database afterwards to shrink the file, and rebuild the search index (optional)',
+        )
+
+    def handle(self, *args, **options):
+        days = options['days']
+        if days is not None and days <= 0:
+            raise CommandError('--days must be a positive number of days')
+        
+        service = NewsRetentionService()
+        cutoff = service.cutoff(days)
+        if cutoff is None:
+            self.stdout.write(self.style.WARNING('NEWS_RETENTION_DAYS is 0; every article is kept in News'))
+            return
+        
+        self.stdout.write(f'Archiving articles published before {cutoff.date()}...')
+        start = time.perf_counter()
+        result = service.archive(cutoff, batch_size=options['batch_size'], dry_run=options['dry_run'])
+        
+        if options['dry_run']:
+            self.stdout.write(
+                f"Would archive {result['articles']} articles "
+                f"({result['tickers']} tickers, {result['days']} stock-days)"
+            )
+            return
+        
+        if options['vacuum']:
+            self.stdout.write('Running VACUUM...')
+            with connections[router.db_for_write(News)].cursor() as cursor:
+                cursor.execute('VACUUM')
+            # VACUUM may renumber the rowids the search index is keyed on.
+            call_command('rebuild_news_search', stdout=StringIO())
+        
+        archive = news_archive.stats()
+        self.stdout.write(self.style.SUCCESS('=' * 60))
+        self.stdout.write(self.style.SUCCESS('Archive Complete!'))
+        self.stdout.write(f"  Articles archived: {result['articles']}")
+        self.stdout.write(f"  Stock-days rolled up: {result['days']}")
+        self.stdout.write(f"  Articles kept in News: {News.objects.count()}")
+        self.stdout.write(
+            f"  Archive: {archive['files']} files in {archive['months']} months, "
+            f"{archive['bytes'] / 1024 / 1024:.1f} MB"
+        )
+        self.stdout.write(f'  Time: {time.perf_counter() - start:.1f}s')
+        self.stdout.write(self.style.SUCCESS('=' * 60))
@@ -0,0 +1,148 @@
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand, CommandError
+from django.test import AsyncClient, Client
+from api.models import Stock, FetchLease
+from api.services.price_store import price_store
+from api.services.response_cache import history_updated
+from api.services.stock_api_service import StockAPIService
+
+
+class Command(BaseCommand):
+    help = 'Compare /stock-details throughput on blocking worker threads and on the ASGI event loop with a slow provider'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=32,
+            help='Concurrent requests, each for a ticker that needs a quote and history fetch (default: 32)',
+        )
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=4,
+            help='Worker threads for the blocking run, as in a threaded WSGI server (default: 4)',
+        )
+        parser.add_argument(
+            '--delay',
+            type=float,
+            default=0.5,
+            help='Seconds each simulated provider call takes (default: 0.5)',
+        )
+
+    def handle(self, *args, **options):
+        count = options['requests']
+        threads = options['threads']
+        delay = options['delay']
+
+        self.provider_calls = 0
+        original_root = price_store.root
+        original_key = os.environ.get('ALPHA_VANTAGE_API_KEY')
+        price_store.root = type(original_root)(tempfile.mkdtemp())
+        # The simulated provider answers in the Yahoo Finance format.
+        os.environ['ALPHA_VANTAGE_API_KEY'] = 'demo'
+
+        blocking_tickers = [f'ZAWSGI{i}' for i in range(count)]
+        async_tickers = [f'ZAASGI{i}' for i in range(count)]
+        failures = []
+
+        self.stdout.write(
+            f'{count} requests for /stock-details, each making 2 provider calls of {delay}s'
+        )
+        try:
+            with mock.patch.object(StockAPIService, '_aget_json', self._slow_provider(delay)):
+                self._seed(blocking_tickers + async_tickers)
+
+                start = time.perf_counter()
+                statuses = self._run_blocking(blocking_tickers, threads)
+                blocking_time = time.perf_counter() - start
+                failures += self._check('blocking', statuses)
+
+                start = time.perf_counter()
+                statuses = async_to_sync(self._run_async)(async_tickers)
+                async_time = time.perf_counter() - start
+                failures += self._check('async', statuses)
+        finally:
+            Stock.objects.filter(ticker__in=blocking_tickers + async_tickers).delete()
+            FetchLease.objects.filter(key__startswith='ZA').delete()
+            history_updated(blocking_tickers + async_tickers)
+            price_store.root = original_root
+            if original_key is None:
+                os.environ.pop('ALPHA_VANTAGE_API_KEY', None)
+            else:
+                os.environ['ALPHA_VANTAGE_API_KEY'] = original_key
+
+        if failures:
+            raise CommandError('\n'.join(failures))
+
+        self.stdout.write(
+            f'  {threads} blocking worker threads: {blocking_time:.2f}s '
+            f'({count / blocking_time:.1f} req/s)'
+        )
+        self.stdout.write(
+            f'  ASGI event loop:             {async_time:.2f}s '
+            f'({count / async_time:.1f} req/s, {blocking_time / async_time:.1f}x)'
+        )
+        self.stdout.write(f'  Provider calls: {self.provider_calls}')
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _seed(self, tickers):
+        # No quote and no history, so every request has to go to the provider.
+        Stock.objects.bulk_create([
+            Stock(ticker=ticker, company_full_name=f'{ticker} Corporation')
+            for ticker in tickers
+        ])
+
+    def _slow_provider(self, delay):
+        command = self
+
+        async def fetch(service, url, params, client=None):
+            command.provider_calls += 1
+            await asyncio.sleep(delay)
+            now = int(time.time())
+            timestamps = [now - 86400 * day for day in range(45, 0, -1)]
+            return {
+                'chart': {
+                    'result': [{
+                        'meta': {
+                            'regularMarketPrice': 101.5,
+                            'previousClose': 100.0,
+                            'regularMarketVolume': 1_000_000,
+                        },
+                        'timestamp': timestamps,
+                        'indicators': {'quote': [{
+                            'close': [100.0 + i for i in range(len(timestamps))],
+                            'volume': [1000] * len(timestamps),
+                        }]},
+                    }]
+                }
+            }
+        return fetch
+
+    def _run_blocking(self, tickers, threads):
+        # Each request holds its worker thread until the view returns, as
+        # with a synchronous view under a threaded WSGI server.
+        def fetch(ticker):
+            return Client().get('/stock-details', {'ticker': ticker}).status_code
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            return list(executor.map(fetch, tickers))
+
+    async def _run_async(self, tickers):
+        client = AsyncClient()
+        responses = await asyncio.gather(*[
+            client.get('/stock-details', {'ticker': ticker}) for ticker in tickers
+        ])
+        return [response.status_code for response in responses]
+
+    def _check(self, label, statuses):
+        failed = [code for code in statuses if code != 200]
+        if failed:
+            return [f'{label}: {len(failed)} of {len(statuses)} requests failed (status {failed[0]})']
+        return []
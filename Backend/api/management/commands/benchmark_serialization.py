@@ -0,0 +1,110 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import router, transaction
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from api.models import Stock, News
+from api.renderers import FastJSONRenderer
+from api.serializers.row_serializers import row_serializer
+from api.serializers.stock_serializers import NewsSerializer, StockSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Time the fast /news and /stocks serialization against the DRF serializers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=500,
+            help='Number of seeded news articles and stocks (default: 500)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20,
+            help='Timed runs per path; the fastest is reported (default: 20)',
+        )
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        iterations = options['iterations']
+
+        try:
+            with transaction.atomic(), transaction.atomic(using=router.db_for_write(News)):
+                self._seed(rows)
+                self._run(iterations)
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _seed(self, count):
+        self.stdout.write(f'Seeding {count} stocks and {count} news articles...')
+        Stock.objects.bulk_create([
+            Stock(
+                ticker=f'ZB{i:04d}',
+                company_full_name=f'Bench Company {i} \u2013 Holdings',
+                current_price=Decimal(100 + i) / 7 if i % 5 else None,
+                change_in_day=Decimal(i % 13 - 6) / 3,
+                sentiment_score=(i % 201) - 100 if i % 4 else None
+            )
+            for i in range(count)
+        ])
+
+        now = timezone.now()
+        News.objects.bulk_create([
+            News(
+                ticker=f'ZB{i % 50:04d}',
+                title=f'Headline {i} \u2014 \u201cquoted\u201d \u00fcn\u00efc\u00f6d\u00e9 \u2028 separator',
+                content='Lorem ipsum dolor sit amet. ' * 40,
+                source='Bench Wire',
+                author=f'Reporter {i}' if i % 3 else None,
+                date=now - timedelta(minutes=7 * i, microseconds=i),
+                link=f'https://example.com/bench/{i}',
+                sentiment=['Bullish', 'Bearish', 'Neutral', None][i % 4],
+                sentiment_analyzed=i % 4 != 3
+            )
+            for i in range(count)
+        ])
+
+    def _run(self, iterations):
+        news = News.objects.filter(ticker__startswith='ZB').order_by('-date', '-id')
+        stocks = Stock.objects.filter(ticker__startswith='ZB')
+
+        cases = [
+            ('/news', NewsSerializer, news, None),
+            ('/news?view=summary', NewsSerializer, news, tuple(NewsSerializer.SUMMARY_FIELDS)),
+            ('/stocks', StockSerializer, stocks, None),
+        ]
+
+        for label, serializer_class, queryset, fields in cases:
+            kwargs = {'fields': list(fields)} if fields else {}
+            rows = row_serializer(serializer_class, fields)
+
+            def drf_path():
+                return JSONRenderer().render(serializer_class(queryset.all(), many=True, **kwargs).data)
+
+            def fast_path():
+                return FastJSONRenderer().render(rows.serialize(queryset.values(*rows.sources)))
+
+            drf_time = self._best_of(drf_path, iterations)
+            fast_time = self._best_of(fast_path, iterations)
+            self.stdout.write(
+                f'{label}: {len(fast_path())} bytes, '
+                f'DRF {drf_time * 1000:.1f}ms, fast {fast_time * 1000:.1f}ms '
+                f'({drf_time / fast_time:.1f}x)'
+            )
+
+    def _best_of(self, fn, iterations):
+        best = float('inf')
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return best
@@ -0,0 +1,246 @@
+import multiprocessing
+import random
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import timedelta
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
+from api.models import News, Stock
+from api.routers import news_database
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure read latency on copies of the database while a large news ingestion runs, for each '
+        'DATABASE_PROFILE, with News in the same database file as Stock or in its own'
+    )
+
+    LAYOUTS = ['shared', 'split']
+    REQUESTS = ['/news', '/stocks', 'quote update']
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--articles',
+            type=int,
+            default=20000,
+            help='Articles the simulated ingestion writes (default: 20000)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Articles per write transaction, as in populate_news (default: 200)',
+        )
+        parser.add_argument(
+            '--readers',
+            type=int,
+            default=4,
+            help='Concurrent reader processes, each acting as a server worker (default: 4)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=0.05,
+            help='Seconds each reader waits between requests, so that readers do not just compete for CPU (default: 0.05)',
+        )
+        parser.add_argument(
+            '--profiles',
+            type=str,
+            default=','.join(settings.SQLITE_PROFILES),
+            help='Comma-separated profiles to compare (default: all)',
+        )
+        parser.add_argument(
+            '--layouts',
+            type=str,
+            default=','.join(self.LAYOUTS),
+            help='Comma-separated layouts: shared (one file) and/or split (News in its own file) (default: both)',
+        )
+
+    def handle(self, *args, **options):
+        profiles = [p.strip() for p in options['profiles'].split(',') if p.strip()]
+        unknown = [p for p in profiles if p not in settings.SQLITE_PROFILES]
+        if unknown:
+            raise CommandError(f"Unknown profile(s): {', '.join(unknown)}")
+        layouts = [layout.strip() for layout in options['layouts'].split(',') if layout.strip()]
+        unknown = [layout for layout in layouts if layout not in self.LAYOUTS]
+        if unknown:
+            raise CommandError(f"Unknown layout(s): {', '.join(unknown)}")
+        if 'shared' in layouts and news_database() != 'default':
+            raise CommandError('News is already in its own database; only the split layout can be measured')
+
+        self.articles = options['articles']
+        self.batch_size = options['batch_size']
+        self.readers = options['readers']
+        self.interval = options['interval']
+        self.tickers = list(Stock.objects.values_list('ticker', flat=True)[:50]) or ['AAPL']
+
+        workdir = Path(tempfile.mkdtemp())
+        self.stdout.write(
+            f'Ingesting {self.articles} articles in batches of {self.batch_size}, '
+            f'with {self.readers} readers querying /news and /stocks and refreshing quotes'
+        )
+        try:
+            for profile in profiles:
+                for layout in layouts:
+                    self._run_profile(profile, layout, workdir)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        self.stdout.write(self.style.SUCCESS('Benchmark complete'))
+
+    def _run_profile(self, profile, layout, workdir):
+        alias = f'benchmark_{profile}'
+        aliases = {alias: 'default'}
+        news_alias = alias
+        if layout == 'split':
+            news_alias = f'benchmark_{profile}_news'
+            aliases[news_alias] = news_database()
+
+        for target, source in aliases.items():
+            path = workdir / f'{target}.sqlite3'
+            self._copy_database(source, path)
+            config = dict(connections[source].settings_dict, NAME=str(path), OPTIONS={})
+            config.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+            config.update(settings.SQLITE_PROFILES[profile])
+            connections.settings[target] = config
+
+        try:
+            idle = self._read_for(alias, news_alias, None, rounds=100)[0]
+
+            # Readers are processes, like server workers, so that they do not
+            # compete with the writer for the GIL.
+            context = multiprocessing.get_context('fork')
+            stop = context.Event()
+            results = context.Queue()
+            readers = [
+                context.Process(target=lambda: results.put(self._read_for(alias, news_alias, stop)))
+                for _ in range(self.readers)
+            ]
+            connections.close_all()
+            for reader in readers:
+                reader.start()
+            start = time.perf_counter()
+            write_errors = self._ingest(news_alias)
+            write_time = time.perf_counter() - start
+            stop.set()
+            results = [results.get() for _ in readers]
+            for reader in readers:
+                reader.join()
+        finally:
+            for target in aliases:
+                connections[target].close()
+                del connections.settings[target]
+
+        self.stdout.write(f'\n{profile}, {layout}:')
+        for name in self.REQUESTS:
+            latencies = [latency for result in results for latency in result[0][name]]
+            errors = sum(result[1][name] for result in results)
+            self.stdout.write(f'  {name + ":":<14} idle:        {self._summary(idle[name])}')
+            self.stdout.write(f'  {"":<14} during load: {self._summary(latencies)}; {errors} failed')
+        self.stdout.write(
+            f'  ingestion: {write_time:.2f}s ({self.articles / write_time:.0f} articles/s), '
+            f'{write_errors} failed batches'
+        )
+
+    def _copy_database(self, source_alias, path):
+        # The backup API copies a consistent snapshot even while the server writes.
+        source = sqlite3.connect(connections[source_alias].settings_dict['NAME'])
+        target = sqlite3.connect(path)
+        try:
+            source.backup(target)
+            # journal_mode is stored in the file; start every profile from the default.
+            target.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            target.close()
+            source.close()
+
+    def _read_for(self, alias, news_alias, stop, rounds=None):
+        # Each round is a request to /news, one to /stocks and a quote
+        # refresh, as /stock-details makes, each followed by the
+        # end-of-request connection handling for CONN_MAX_AGE.
+        requests = {
+            '/news': (news_alias, lambda: list(
+                News.objects.using(news_alias).filter(date__gte=since).order_by('-date').values(
+                    'id', 'ticker', 'title', 'date', 'sentiment'
+                )[:20]
+            )),
+            '/stocks': (alias, lambda: list(
+                Stock.objects.using(alias).order_by('ticker').values('ticker', 'current_price')[:50]
+            )),
+            'quote update': (alias, lambda: self._update_quote(alias)),
+        }
+        latencies = {name: [] for name in requests}
+        errors = {name: 0 for name in requests}
+        since = timezone.now() - timedelta(days=7)
+        done = 0
+        try:
+            while (stop is None or not stop.is_set()) and (rounds is None or done < rounds):
+                for name, (db, request) in requests.items():
+                    start = time.perf_counter()
+                    try:
+                        request()
+                    except Exception:
+                        errors[name] += 1
+                    else:
+                        latencies[name].append(time.perf_counter() - start)
+                    connections[db].close_if_unusable_or_obsolete()
+                done += 1
+                if stop is not None:
+                    time.sleep(self.interval)
+        finally:
+            connections[news_alias].close()
+            connections[alias].close()
+        return latencies, errors
+
+    def _update_quote(self, alias):
+        ticker = random.choice(self.tickers)
+        with transaction.atomic(using=alias):
+            Stock.objects.using(alias).filter(ticker=ticker).update(updated_at=timezone.now())
+
+    def _ingest(self, alias):
+        # Inserts like populate_news, then scores each batch like
+        # analyze_sentiments, one transaction per step.
+        errors = 0
+        now = timezone.now()
+        try:
+            for offset in range(0, self.articles, self.batch_size):
+                rows = [
+                    News(
+                        ticker=self.tickers[i % len(self.tickers)],
+                        title=f'Benchmark article {i} on quarterly results and guidance',
+                        content='Shares moved after the company reported results and updated its outlook. ' * 8,
+                        source='benchmark',
+                        date=now - timedelta(minutes=i),
+                        link=f'https://benchmark.invalid/{uuid.uuid4().hex}'
+                    )
+                    for i in range(offset, min(offset + self.batch_size, self.articles))
+                ]
+                try:
+                    with transaction.atomic(using=alias):
+                        News.objects.using(alias).bulk_create(rows)
+                    for news in rows:
+                        news.sentiment = 'Neutral'
+                        news.sentiment_analyzed = True
+                    with transaction.atomic(using=alias):
+                        News.objects.using(alias).bulk_update(rows, ['sentiment', 'sentiment_analyzed'])
+                except Exception:
+                    errors += 1
+        finally:
+            connections[alias].close()
+        return errors
+
+    def _summary(self, latencies):
+        if len(latencies) < 2:
+            return 'not enough reads'
+        percentiles = statistics.quantiles(latencies, n=100)
+        return (
+            f'p50 {percentiles[49] * 1000:.1f}ms, p95 {percentiles[94] * 1000:.1f}ms, '
+            f'p99 {percentiles[98] * 1000:.1f}ms, max {max(latencies) * 1000:.1f}ms'
+        )
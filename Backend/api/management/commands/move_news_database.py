@@ -0,0 +1,80 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from api.models import News, NewsBuzz, NewsSentimentHistory
+from api.routers import news_database
+
+
+class Command(BaseCommand):
+    help = 'Copy the news store (News, NewsSentimentHistory, NewsBuzz) from the default database into NEWS_DATABASE_NAME'
+
+    MODELS = [News, NewsSentimentHistory, NewsBuzz]
+    # api_news_fts and its triggers, created in the default database by 0008.
+    SEARCH_INDEX_SQL = [
+        'DROP TRIGGER IF EXISTS api_news_fts_insert',
+        'DROP TRIGGER IF EXISTS api_news_fts_delete',
+        'DROP TRIGGER IF EXISTS api_news_fts_update',
+        'DROP TABLE IF EXISTS api_news_fts',
+    ]
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--drop-source',
+            action='store_true',
+            help='Drop the copied tables and the search index from the default database afterwards (optional)',
+        )
+
+    def handle(self, *args, **options):
+        target = news_database()
+        if target == 'default':
+            raise CommandError('Set NEWS_DATABASE_NAME first; the news store is in the default database')
+
+        source_tables = set(connections['default'].introspection.table_names())
+        target_tables = set(connections[target].introspection.table_names())
+        for model in self.MODELS:
+            table = model._meta.db_table
+            if table not in source_tables:
+                raise CommandError(f'{table} does not exist in the default database; nothing to move')
+            if table not in target_tables:
+                raise CommandError(f'{table} does not exist in {target}; run `migrate --database {target}` first')
+            if model.objects.exists():
+                raise CommandError(f'{table} in {target} is not empty; refusing to copy over it')
+
+        source_path = str(connections['default'].settings_dict['NAME'])
+        self.stdout.write(f'Copying the news store from {source_path}...')
+        start = time.perf_counter()
+
+        connection = connections[target]
+        copied = {}
+        with connection.cursor() as cursor:
+            cursor.execute('ATTACH DATABASE %s AS source', [source_path])
+            try:
+                # One transaction: the news database gets every table or none.
+                # The search index triggers index each article as it is copied.
+                with transaction.atomic(using=target):
+                    for model in self.MODELS:
+                        table = model._meta.db_table
+                        columns = ', '.join(
+                            connection.ops.quote_name(field.column) for field in model._meta.concrete_fields
+                        )
+                        cursor.execute(f'INSERT INTO main.{table} ({columns}) SELECT {columns} FROM source.{table}')
+                        copied[table] = cursor.rowcount
+            finally:
+                cursor.execute('DETACH DATABASE source')
+
+        for table, count in copied.items():
+            self.stdout.write(f'  {table}: {count} rows')
+
+        if options['drop_source']:
+            self.stdout.write('Dropping the copied tables from the default database...')
+            with connections['default'].cursor() as cursor:
+                for sql in self.SEARCH_INDEX_SQL:
+                    cursor.execute(sql)
+                for model in self.MODELS:
+                    cursor.execute(f'DROP TABLE IF EXISTS {model._meta.db_table}')
+
+        self.stdout.write(self.style.SUCCESS('=' * 60))
+        self.stdout.write(self.style.SUCCESS('News Store Moved!'))
+        self.stdout.write(f'  Database: {connections[target].settings_dict["NAME"]}')
+        self.stdout.write(f'  Time: {time.perf_counter() - start:.1f}s')
+        self.stdout.write(self.style.SUCCESS('=' * 60))
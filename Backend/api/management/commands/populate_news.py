@@ -4,6 +4,7 @@ from django.utils import timezone
 from datetime import datetime, timedelta
 from api.models import Stock, News
 from api.services.news_service import NewsService
+from api.services.news_ingestion import NewsIngestionService
 
 
 class Command(BaseCommand):
@@ -55,6 +56,7 @@ class Command(BaseCommand):
         skip_existing = options['skip_existing']
         
         news_service = NewsService()
+        ingestion_service = NewsIngestionService()
         
         self.stdout.write('Starting to fetch news for stocks...')
         self.stdout.write(f'Using {delay}s delay between API calls to respect rate limits')
@@ -137,28 +139,8 @@ class Command(BaseCommand):
                             self.stdout.write(self.style.ERROR(f'Failed after {max_retries} attempts'))
                 
                 if news_articles:
-                    saved_count = 0
-                    for article in news_articles:
-                        try:
-                            # Save news to database (avoid duplicates by link)
-                            news, created = News.objects.update_or_create(
-                                link=article['link'],
-                                defaults={
-                                    'ticker': article['ticker'],
-                                    'title': article['title'],
-                                    'content': article['content'],
-                                    'source': article['source'],
-                                    'author': article.get('author'),
-                                    'date': article['date'],
-                                    'sentiment': article.get('sentiment'),
-                                    'sentiment_analyzed': article.get('sentiment') is not None
-                                }
-                            )
-                            if created:
-                                saved_count += 1
-                        except Exception as e:
-                            # Skip duplicate or invalid entries
-                            continue
+                    # Upsert by link, then refresh rollups for the affected days
+                    saved_count = ingestion_service.save_articles(news_articles)
                     
                     total_news_fetched += len(news_articles)
                     total_news_saved += saved_count
@@ -3,6 +3,7 @@ from django.core.management.base import BaseCommand
 from api.models import Stock
 from api.services.stock_api_service import StockAPIService
 from api.services.news_service import NewsService
+from api.services.response_cache import quote_updated
 
 
 class Command(BaseCommand):
@@ -96,6 +97,8 @@ class Command(BaseCommand):
                         }
                     )
                     
+                    quote_updated([ticker])
+                    
                     if created:
                         created_count += 1
                         self.stdout.write(self.style.SUCCESS(f'✓ Created'))
@@ -0,0 +1,34 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import connections, router
+from api.models import News
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index (api_news_fts) from the News table'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--optimize',
+            action='store_true',
+            help='Only merge the index segments, without rebuilding (optional)',
+        )
+
+    def handle(self, *args, **options):
+        # The index is keyed on api_news rowids. Rebuild it after a VACUUM or
+        # a restore, both of which may renumber them.
+        command = 'optimize' if options['optimize'] else 'rebuild'
+        connection = connections[router.db_for_write(News)]
+        
+        self.stdout.write(f'Running FTS5 {command} on api_news_fts...')
+        start = time.perf_counter()
+        with connection.cursor() as cursor:
+            cursor.execute('INSERT INTO api_news_fts(api_news_fts) VALUES (%s)', [command])
+            cursor.execute('SELECT COUNT(*) FROM api_news')
+            article_count = cursor.fetchone()[0]
+        
+        self.stdout.write(self.style.SUCCESS('=' * 60))
+        self.stdout.write(self.style.SUCCESS('Search Index Updated!'))
+        self.stdout.write(f'  Articles indexed: {article_count}')
+        self.stdout.write(f'  Time: {time.perf_counter() - start:.1f}s')
+        self.stdout.write(self.style.SUCCESS('=' * 60))
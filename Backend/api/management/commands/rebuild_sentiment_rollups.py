@@ -0,0 +1,44 @@
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from api.models import NewsSentimentHistory
+from api.services.sentiment_rollup import SentimentRollupService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild daily sentiment rollups (NewsSentimentHistory) from the News table'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ticker',
+            type=str,
+            help='Rebuild rollups for a specific ticker only (optional)',
+        )
+        parser.add_argument(
+            '--since',
+            type=str,
+            help='Only rebuild days on or after this date, YYYY-MM-DD (optional)',
+        )
+
+    def handle(self, *args, **options):
+        specific_ticker = options.get('ticker')
+        since = options.get('since')
+        
+        if since:
+            try:
+                since = datetime.strptime(since, '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('--since must be formatted as YYYY-MM-DD')
+        
+        if specific_ticker:
+            specific_ticker = specific_ticker.upper()
+            self.stdout.write(f'Filtering by ticker: {specific_ticker}')
+        
+        self.stdout.write('Rebuilding daily sentiment rollups...')
+        
+        refreshed = SentimentRollupService().rebuild(ticker=specific_ticker, since=since)
+        
+        self.stdout.write(self.style.SUCCESS('=' * 60))
+        self.stdout.write(self.style.SUCCESS('Rebuild Complete!'))
+        self.stdout.write(f'  (stock, day) rows refreshed: {refreshed}')
+        self.stdout.write(f'  Total rollup rows: {NewsSentimentHistory.objects.count()}')
+        self.stdout.write(self.style.SUCCESS('=' * 60))
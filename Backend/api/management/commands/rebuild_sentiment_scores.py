@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.conf import settings
+from api.services.sentiment_score import SentimentScoreService
+
+
+class Command(BaseCommand):
+    help = 'Recompute Stock.sentiment_score from every analyzed news article'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ticker',
+            type=str,
+            help='Recompute the score for a specific ticker only (optional)',
+        )
+        parser.add_argument(
+            '--half-life',
+            type=float,
+            help=f'Half-life in hours (default: SENTIMENT_HALF_LIFE_HOURS = {settings.SENTIMENT_HALF_LIFE_HOURS})',
+        )
+
+    def handle(self, *args, **options):
+        specific_ticker = options.get('ticker')
+        half_life = options.get('half_life')
+        
+        service = SentimentScoreService(half_life_hours=half_life)
+        self.stdout.write(
+            f'Recomputing sentiment scores (half-life: {service.half_life_seconds / 3600:g}h)...'
+        )
+        
+        updated = service.rebuild(ticker=specific_ticker.upper() if specific_ticker else None)
+        
+        self.stdout.write(self.style.SUCCESS(f'Updated {updated} stock(s)'))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from api.models import NewsBuzz
+from api.services.buzz_index import BuzzIndexService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the news buzz index for every ticker (run daily, after midnight)'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Refreshing news buzz index from daily rollups...')
+        
+        refreshed = BuzzIndexService().refresh()
+        
+        self.stdout.write(self.style.SUCCESS(f'Refreshed {refreshed} ticker(s)'))
+        for period in BuzzIndexService.PERIODS:
+            count = NewsBuzz.objects.filter(period=period, news_count__gt=0).count()
+            self.stdout.write(f'  {period}: {count} ticker(s) with news')
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from api.models import Stock
+from api.services.price_store import price_store
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the columnar price store from the PriceHistory table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--ticker',
+            type=str,
+            help='Rebuild the store for a specific ticker only (optional)',
+        )
+
+    def handle(self, *args, **options):
+        specific_ticker = options.get('ticker')
+
+        if specific_ticker:
+            stocks = Stock.objects.filter(ticker=specific_ticker.upper())
+            if not stocks.exists():
+                self.stdout.write(self.style.ERROR(f'Stock {specific_ticker} not found in database'))
+                return
+        else:
+            stocks = Stock.objects.filter(price_history__isnull=False).distinct().order_by('ticker')
+
+        self.stdout.write(f'Writing price store files to {price_store.root}')
+
+        synced_count = 0
+        for stock in stocks:
+            price_store.sync_from_db(stock)
+            series = price_store.load(stock.ticker)
+            synced_count += 1
+            self.stdout.write(f'  {stock.ticker}: {len(series) if series is not None else 0} bars')
+
+        self.stdout.write(self.style.SUCCESS(f'Synced {synced_count} stock(s)'))
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.9 on 2026-10-19 11:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_fetchlease'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PriceHistoryGap',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('checked_at', models.DateTimeField(auto_now=True)),
+                ('stock', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='price_history_gaps', to='api.stock')),
+            ],
+            options={
+                'ordering': ['-date'],
+                'unique_together': {('stock', 'date')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-19 11:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_pricehistorygap'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stock',
+            name='history_backfilled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
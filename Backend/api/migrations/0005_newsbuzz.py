@@ -0,0 +1,29 @@
+# Generated by Django 5.2.9 on 2026-10-19 11:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_stock_history_backfilled_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NewsBuzz',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ticker', models.CharField(max_length=10)),
+                ('period', models.CharField(choices=[('1d', '1d'), ('7d', '7d'), ('30d', '30d')], max_length=3)),
+                ('news_count', models.IntegerField(default=0)),
+                ('prior_count', models.IntegerField(default=0)),
+                ('velocity', models.FloatField(default=0.0)),
+                ('as_of', models.DateField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['period', '-news_count'], name='api_newsbuz_period_01d00f_idx')],
+                'unique_together': {('ticker', 'period')},
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.9 on 2026-10-19 11:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_newsbuzz'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stock',
+            name='sentiment_decayed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='stock',
+            name='sentiment_weight_total',
+            field=models.FloatField(default=0.0),
+        ),
+        migrations.AddField(
+            model_name='stock',
+            name='sentiment_weighted_sum',
+            field=models.FloatField(default=0.0),
+        ),
+    ]
@@ -0,0 +1,65 @@
+from django.db import migrations
+
+
+# External-content FTS5 index over News: the text stays in api_news and the
+# index maps api_news rowids to tokens. Triggers keep it in step with every
+# write, including bulk_create upserts (an UPDATE) and sentiment-only
+# bulk_updates (skipped, since they do not touch indexed columns).
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE api_news_fts USING fts5(
+        title, content, ticker,
+        content='api_news',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER api_news_fts_insert AFTER INSERT ON api_news BEGIN
+        INSERT INTO api_news_fts(rowid, title, content, ticker)
+        VALUES (new.rowid, new.title, new.content, new.ticker);
+    END
+    """,
+    """
+    CREATE TRIGGER api_news_fts_delete AFTER DELETE ON api_news BEGIN
+        INSERT INTO api_news_fts(api_news_fts, rowid, title, content, ticker)
+        VALUES ('delete', old.rowid, old.title, old.content, old.ticker);
+    END
+    """,
+    """
+    CREATE TRIGGER api_news_fts_update AFTER UPDATE OF title, content, ticker ON api_news BEGIN
+        INSERT INTO api_news_fts(api_news_fts, rowid, title, content, ticker)
+        VALUES ('delete', old.rowid, old.title, old.content, old.ticker);
+        INSERT INTO api_news_fts(rowid, title, content, ticker)
+        VALUES (new.rowid, new.title, new.content, new.ticker);
+    END
+    """,
+    "INSERT INTO api_news_fts(api_news_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS api_news_fts_insert',
+    'DROP TRIGGER IF EXISTS api_news_fts_delete',
+    'DROP TRIGGER IF EXISTS api_news_fts_update',
+    'DROP TABLE IF EXISTS api_news_fts',
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'sqlite':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_news_updated_at'),
+    ]
+
+    operations = [
+        # The hint routes the index to whichever database holds News.
+        migrations.RunPython(_run(CREATE_SQL), _run(DROP_SQL), hints={'model_name': 'news'}),
+    ]
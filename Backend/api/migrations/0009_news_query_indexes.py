@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_news_search'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='news',
+            name='api_news_sentime_8f0989_idx',
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['ticker', 'sentiment', '-date'], name='news_ticker_sentiment_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['sentiment', '-date'], name='news_sentiment_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['-date'], name='news_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(condition=models.Q(('sentiment_analyzed', False), ('sentiment__isnull', True), _connector='OR'), fields=['-date'], name='news_pending_sentiment_idx'),
+        ),
+    ]
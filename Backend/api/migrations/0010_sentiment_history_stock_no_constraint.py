@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_news_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='newssentimenthistory',
+            name='stock',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='sentiment_history', to='api.stock'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_sentiment_history_stock_no_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['updated_at'], name='news_updated_at_idx'),
+        ),
+    ]
@@ -9,8 +9,13 @@ class Stock(models.Model):
     current_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     change_in_day = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
     sentiment_score = models.IntegerField(null=True, blank=True)
+    # Recency-weighted sums behind sentiment_score, decayed to sentiment_decayed_at
+    sentiment_weighted_sum = models.FloatField(default=0.0)
+    sentiment_weight_total = models.FloatField(default=0.0)
+    sentiment_decayed_at = models.DateTimeField(null=True, blank=True)
     market_cap = models.BigIntegerField(null=True, blank=True)
     volume = models.BigIntegerField(null=True, blank=True)
+    history_backfilled_at = models.DateTimeField(null=True, blank=True)
     updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -38,13 +43,24 @@ class News(models.Model):
     link = models.URLField(max_length=500, unique=True, db_index=True)
     sentiment = models.CharField(max_length=10, choices=SENTIMENT_CHOICES, null=True, blank=True)
     sentiment_analyzed = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         ordering = ['-date']
         indexes = [
             models.Index(fields=['ticker', '-date']),
-            models.Index(fields=['sentiment']),
+            models.Index(fields=['ticker', 'sentiment', '-date'], name='news_ticker_sentiment_idx'),
+            models.Index(fields=['sentiment', '-date'], name='news_sentiment_date_idx'),
+            models.Index(fields=['-date'], name='news_date_idx'),
+            # Only the articles analyze_sentiments still has to score.
+            models.Index(
+                fields=['-date'],
+                condition=models.Q(sentiment_analyzed=False) | models.Q(sentiment__isnull=True),
+                name='news_pending_sentiment_idx'
+            ),
+            # The /events feed's poll for articles written by other processes.
+            models.Index(fields=['updated_at'], name='news_updated_at_idx'),
         ]
 
     def __str__(self):
@@ -68,8 +84,28 @@ class PriceHistory(models.Model):
         return f"{self.stock.ticker} - {self.date} - ${self.price}"
 
 
+class PriceHistoryGap(models.Model):
+    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name='price_history_gaps')
+    date = models.DateField()
+    checked_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date']
+        unique_together = ['stock', 'date']
+
+    def __str__(self):
+        return f"{self.stock.ticker} - {self.date} - no bar"
+
+
 class NewsSentimentHistory(models.Model):
-    stock = models.ForeignKey(Stock, on_delete=models.CASCADE, related_name='sentiment_history')
+    # May live in another database than Stock (api.routers), so there is no
+    # constraint and no cascade.
+    stock = models.ForeignKey(
+        Stock,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='sentiment_history'
+    )
     date = models.DateField()
     bullish_count = models.IntegerField(default=0)
     bearish_count = models.IntegerField(default=0)
@@ -86,3 +122,36 @@ class NewsSentimentHistory(models.Model):
     def __str__(self):
         return f"{self.stock.ticker} - {self.date} - Bullish: {self.bullish_count}, Bearish: {self.bearish_count}"
 
+
+
+class NewsBuzz(models.Model):
+    PERIOD_CHOICES = [
+        ('1d', '1d'),
+        ('7d', '7d'),
+        ('30d', '30d'),
+    ]
+
+    ticker = models.CharField(max_length=10)
+    period = models.CharField(max_length=3, choices=PERIOD_CHOICES)
+    news_count = models.IntegerField(default=0)
+    prior_count = models.IntegerField(default=0)
+    velocity = models.FloatField(default=0.0)
+    as_of = models.DateField()
+
+    class Meta:
+        unique_together = ['ticker', 'period']
+        indexes = [
+            models.Index(fields=['period', '-news_count']),
+        ]
+
+    def __str__(self):
+        return f"{self.ticker} - {self.period} - {self.news_count} articles"
+
+
+class FetchLease(models.Model):
+    key = models.CharField(max_length=64, unique=True)
+    owner = models.CharField(max_length=32)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.key} - {self.owner} until {self.expires_at}"
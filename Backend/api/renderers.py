@@ -0,0 +1,30 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class FastJSONRenderer(JSONRenderer):
+    # Same bytes as JSONRenderer for compact UTF-8 output, encoded by orjson.
+    # Types orjson would format differently (datetimes, Decimal, numpy) fall
+    # through to DRF's encoder; pretty-printing keeps the stdlib path.
+
+    OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=self.OPTIONS)
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class EventStreamRenderer(FastJSONRenderer):
+    # Lets EventSource clients (Accept: text/event-stream) pass content
+    # negotiation. The stream itself is written by the view; this only
+    # renders error responses, as a single JSON body.
+
+    media_type = 'text/event-stream'
+    format = 'event-stream'
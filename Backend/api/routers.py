@@ -0,0 +1,37 @@
+from django.conf import settings
+
+
+# The news store: News and the tables derived from it, written by every
+# ingestion and scoring run.
+NEWS_MODELS = {'news', 'newssentimenthistory', 'newsbuzz'}
+
+
+def news_database() -> str:
+    return settings.NEWS_DATABASE if settings.NEWS_DATABASE in settings.DATABASES else 'default'
+
+
+class NewsRouter:
+    # Puts the news store in settings.NEWS_DATABASE when DATABASES defines it,
+    # and everything else in 'default'. Without it both are 'default'. No
+    # query may join across the two: NewsSentimentHistory.stock has no
+    # database constraint and is read by stock_id.
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label == 'api' and model._meta.model_name in NEWS_MODELS:
+            return news_database()
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        return self.db_for_read(model, **hints)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        if obj1._meta.app_label == 'api' and obj2._meta.app_label == 'api':
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db not in ('default', news_database()):
+            return None
+        if app_label == 'api' and model_name in NEWS_MODELS:
+            return db == news_database()
+        return db == 'default'
@@ -0,0 +1,70 @@
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+# Fields whose DRF representation of a DB value is the value itself.
+PASSTHROUGH_FIELDS = (serializers.CharField, serializers.BooleanField, serializers.IntegerField)
+
+
+def _uuid(value):
+    return str(value)
+
+
+def _datetime(value):
+    # DateTimeField.to_representation with ISO 8601 output.
+    tz = timezone.get_current_timezone()
+    if timezone.is_naive(value):
+        value = timezone.make_aware(value, tz)
+    value = value.astimezone(tz).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+class RowSerializer:
+    # Produces what a DRF serializer would, but from .values() rows. The
+    # serializer's fields are inspected once; per row it is a dict lookup and
+    # at most one conversion per field. Fields without a fast conversion use
+    # the DRF field's own to_representation, so the output stays identical.
+
+    def __init__(self, serializer_class, fields: Optional[Tuple[str, ...]] = None):
+        declared = serializer_class(fields=fields).fields if fields else serializer_class().fields
+        self.columns = []
+        for name, field in declared.items():
+            if field.source == '*' or '.' in field.source:
+                raise ValueError(f'{serializer_class.__name__}.{name} is not a plain column')
+            self.columns.append((name, field.source, self._converter(field)))
+
+    @property
+    def sources(self) -> List[str]:
+        return [source for _, source, _ in self.columns]
+
+    def serialize(self, rows: Iterable[Dict]) -> List[Dict]:
+        columns = self.columns
+        data = []
+        for row in rows:
+            item = {}
+            for name, source, convert in columns:
+                value = row[source]
+                item[name] = convert(value) if convert is not None and value is not None else value
+            data.append(item)
+        return data
+
+    @staticmethod
+    def _converter(field):
+        if isinstance(field, serializers.UUIDField) and field.uuid_format == 'hex_verbose':
+            return _uuid
+        if isinstance(field, serializers.DateTimeField):
+            if getattr(field, 'format', api_settings.DATETIME_FORMAT) == ISO_8601 and not hasattr(field, 'timezone'):
+                return _datetime
+        elif isinstance(field, PASSTHROUGH_FIELDS):
+            return None
+        return field.to_representation
+
+
+@lru_cache(maxsize=64)
+def row_serializer(serializer_class, fields: Optional[Tuple[str, ...]] = None) -> RowSerializer:
+    return RowSerializer(serializer_class, fields)
@@ -11,6 +11,7 @@ class TopMoverSerializer(serializers.Serializer):
 class NewsBuzzSerializer(serializers.Serializer):
     ticker = serializers.CharField()
     score = serializers.DecimalField(max_digits=10, decimal_places=6)
+    velocity = serializers.FloatField(required=False)
     companyFullName = serializers.CharField(source='company_full_name')
 
 
@@ -44,9 +45,41 @@ class NewsSerializer(serializers.ModelSerializer):
     sentiment = serializers.CharField(allow_null=True, required=False)
     sentimentAnalyzed = serializers.BooleanField(source='sentiment_analyzed', required=False)
     
+    # What list screens render; `content` is fetched per article on demand.
+    SUMMARY_FIELDS = ['id', 'ticker', 'title', 'source', 'author', 'date', 'link', 'sentiment', 'sentimentAnalyzed']
+    
     class Meta:
         model = News
         fields = ['id', 'ticker', 'title', 'content', 'source', 'author', 'date', 'link', 'sentiment', 'sentimentAnalyzed']
+    
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+    
+    @classmethod
+    def requested_fields(cls, query_params):
+        # `fields=a,b` wins over `view=summary`; None means the full article.
+        if query_params.get('fields'):
+            fields = ['id'] + [f.strip() for f in query_params['fields'].split(',') if f.strip()]
+            unknown = set(fields) - set(cls.Meta.fields)
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+            return list(dict.fromkeys(fields))
+        
+        view = query_params.get('view', 'full')
+        if view == 'summary':
+            return cls.SUMMARY_FIELDS
+        if view != 'full':
+            raise ValueError('Invalid view. Use full or summary')
+        return None
+    
+    @classmethod
+    def model_fields(cls, fields):
+        # Columns to load for the requested fields; date is always needed for ordering and cursors.
+        declared = cls().fields
+        return list(dict.fromkeys([declared[name].source for name in fields] + ['date']))
 
 
 class SentimentResponseSerializer(serializers.Serializer):
@@ -78,4 +111,22 @@ class StockDetailsSerializer(serializers.Serializer):
     pricesHistory = serializers.ListField(child=serializers.FloatField())
     newsSentiment = NewsSentimentHistorySerializer()
     recentNews = NewsSerializer(many=True)
+    
+    def __init__(self, *args, news_fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if news_fields is not None:
+            self.fields['recentNews'] = NewsSerializer(many=True, fields=news_fields)
+
 
+
+class PricePointSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    price = serializers.FloatField()
+
+
+class PriceHistoryResponseSerializer(serializers.Serializer):
+    ticker = serializers.CharField()
+    range = serializers.CharField()
+    method = serializers.CharField()
+    totalPoints = serializers.IntegerField()
+    points = PricePointSerializer(many=True)
@@ -0,0 +1,227 @@
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import Dict, Optional
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+from api.services.response_cache import response_cache
+
+
+class _Waiter:
+
+    def __init__(self, event: Optional[threading.Event] = None, loop=None):
+        self.event = event
+        self.loop = loop
+        self.future = loop.create_future() if loop else None
+        self.granted = False
+
+    def wake(self):
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self):
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class Limiter:
+    # At most `concurrency` requests hold a slot at once. Up to `queue_size`
+    # more wait, in arrival order, for at most `timeout` seconds; anything
+    # beyond that is turned away at once. A released slot is handed straight
+    # to the oldest waiter, so a newcomer cannot overtake the queue. Blocking
+    # callers wait on an Event, async callers on a future of their own loop,
+    # so a queued async request holds no thread.
+
+    DEFAULT_RETRY_AFTER = 5
+    MAX_RETRY_AFTER = 120
+
+    def __init__(self, endpoint: str, concurrency: int, queue: int = 0, timeout: float = 0.0):
+        self.endpoint = endpoint
+        self.concurrency = concurrency
+        self.queue_size = queue
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._active = 0
+        self._waiters = deque()
+        self._held_seconds = 0.0
+        self._stats = {'admitted': 0, 'queued': 0, 'rejected': 0, 'timedOut': 0, 'servedStale': 0}
+
+    def acquire(self) -> bool:
+        admitted, waiter = self._enter(lambda: _Waiter(event=threading.Event()))
+        if waiter is None:
+            return admitted
+        waiter.event.wait(self.timeout)
+        return self._settle(waiter)
+
+    async def aacquire(self) -> bool:
+        loop = asyncio.get_running_loop()
+        admitted, waiter = self._enter(lambda: _Waiter(loop=loop))
+        if waiter is None:
+            return admitted
+        try:
+            await asyncio.wait_for(waiter.future, self.timeout)
+        except asyncio.TimeoutError:
+            pass
+        except asyncio.CancelledError:
+            # The client went away while queued; pass on a slot it was just given.
+            if self._settle(waiter):
+                self.release()
+            raise
+        return self._settle(waiter)
+
+    def release(self, held_seconds: Optional[float] = None):
+        with self._lock:
+            if held_seconds is not None:
+                self._held_seconds = held_seconds if not self._held_seconds else (
+                    0.8 * self._held_seconds + 0.2 * held_seconds
+                )
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                try:
+                    waiter.wake()
+                except RuntimeError:
+                    # The waiter's event loop has shut down.
+                    continue
+                waiter.granted = True
+                return
+            self._active -= 1
+
+    def retry_after(self) -> int:
+        # Roughly how long until the requests ahead of a new one have finished.
+        with self._lock:
+            if not self._held_seconds:
+                return self.DEFAULT_RETRY_AFTER
+            rounds = (len(self._waiters) + self.concurrency) / self.concurrency
+            return max(1, min(self.MAX_RETRY_AFTER, math.ceil(self._held_seconds * rounds)))
+
+    def count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(
+                self._stats,
+                concurrency=self.concurrency,
+                queueSize=self.queue_size,
+                active=self._active,
+                waiting=len(self._waiters),
+                avgSeconds=round(self._held_seconds, 3)
+            )
+
+    def _enter(self, make_waiter):
+        with self._lock:
+            if self._active < self.concurrency and not self._waiters:
+                self._active += 1
+                self._stats['admitted'] += 1
+                return True, None
+            if self.timeout <= 0 or len(self._waiters) >= self.queue_size:
+                self._stats['rejected'] += 1
+                return False, None
+            waiter = make_waiter()
+            self._waiters.append(waiter)
+            self._stats['queued'] += 1
+            return False, waiter
+
+    def _settle(self, waiter: _Waiter) -> bool:
+        # Wake-up and timeout can race; whichever takes the lock first decides.
+        with self._lock:
+            if waiter.granted:
+                self._stats['admitted'] += 1
+                return True
+            self._waiters.remove(waiter)
+            self._stats['timedOut'] += 1
+            return False
+
+
+class AdmissionControl:
+    # One Limiter per endpoint in settings.ADMISSION_LIMITS. Limits are per
+    # worker process, like the server's own worker and connection limits.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._limiters = {}
+
+    def limiter(self, endpoint: str) -> Optional[Limiter]:
+        config = settings.ADMISSION_LIMITS.get(endpoint)
+        if config is None:
+            return None
+        with self._lock:
+            limiter = self._limiters.get(endpoint)
+            if limiter is None:
+                limiter = Limiter(
+                    endpoint,
+                    concurrency=config['concurrency'],
+                    queue=config.get('queue', 0),
+                    timeout=config.get('timeout', 0)
+                )
+                self._limiters[endpoint] = limiter
+            return limiter
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {endpoint: limiter.stats() for endpoint, limiter in limiters.items()}
+
+
+admission = AdmissionControl()
+
+
+def shed_load(endpoint: str):
+    # For view methods taking (self, request, ...). Goes under
+    # @cached_response, so cache hits never wait for a slot. A request that
+    # is not admitted gets the endpoint's last good response for the same
+    # query, if the response cache kept one, and a 503 otherwise; both carry
+    # Retry-After, which also keeps the stale copy out of the cache.
+    def rejected(limiter, request):
+        retry_after = str(limiter.retry_after())
+        data = response_cache.get_stale(endpoint, request.query_params)
+        if data is not None:
+            limiter.count('servedStale')
+            return Response(data, status=status.HTTP_200_OK, headers={
+                'Retry-After': retry_after,
+                'X-Served-Stale': 'true'
+            })
+        return Response(
+            {'error': f'Too many {endpoint} requests in progress, retry in {retry_after}s'},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={'Retry-After': retry_after}
+        )
+
+    def decorator(view_method):
+        if iscoroutinefunction(view_method):
+            @wraps(view_method)
+            async def async_wrapper(self, request, *args, **kwargs):
+                limiter = admission.limiter(endpoint)
+                if limiter is None:
+                    return await view_method(self, request, *args, **kwargs)
+                if not await limiter.aacquire():
+                    return await sync_to_async(rejected)(limiter, request)
+                start = time.monotonic()
+                try:
+                    return await view_method(self, request, *args, **kwargs)
+                finally:
+                    limiter.release(time.monotonic() - start)
+            return async_wrapper
+
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            limiter = admission.limiter(endpoint)
+            if limiter is None:
+                return view_method(self, request, *args, **kwargs)
+            if not limiter.acquire():
+                return rejected(limiter, request)
+            start = time.monotonic()
+            try:
+                return view_method(self, request, *args, **kwargs)
+            finally:
+                limiter.release(time.monotonic() - start)
+        return wrapper
+    return decorator
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional
+from django.core.cache import cache
+from django.db.models import Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from api.models import NewsBuzz, NewsSentimentHistory, Stock
+from api.services.single_flight import single_flight
+
+
+class BuzzIndexService:
+    # Per-ticker article counts for each buzz window and the window before it,
+    # derived from the daily rollups. Ingestion refreshes the touched tickers;
+    # when the day rolls over every row is recomputed once (ensure_current).
+
+    PERIODS = {'1d': 1, '7d': 7, '30d': 30}
+    AS_OF_CACHE_KEY = 'buzz-index:as-of'
+
+    def refresh(self, tickers: Optional[Iterable[str]] = None) -> int:
+        today = timezone.localdate()
+        longest = max(self.PERIODS.values())
+
+        rollups = NewsSentimentHistory.objects.filter(date__gte=today - timedelta(days=2 * longest + 1))
+        # Rollups may live in another database than Stock, so they are
+        # matched to tickers by stock_id rather than joined.
+        stocks = Stock.objects.all()
+        if tickers is not None:
+            tickers = set(tickers)
+            if not tickers:
+                return 0
+            stocks = stocks.filter(ticker__in=tickers)
+        ticker_of = dict(stocks.values_list('id', 'ticker'))
+        if tickers is not None:
+            rollups = rollups.filter(stock_id__in=list(ticker_of))
+
+        sums = {}
+        for period, days in self.PERIODS.items():
+            start = today - timedelta(days=days)
+            prior_start = start - timedelta(days=days + 1)
+            sums[f'current_{period}'] = Coalesce(Sum('total_news', filter=Q(date__gte=start)), 0)
+            sums[f'prior_{period}'] = Coalesce(
+                Sum('total_news', filter=Q(date__gte=prior_start, date__lt=start)), 0
+            )
+
+        rows = []
+        seen = set()
+        for counts in rollups.values('stock_id').annotate(**sums).order_by():
+            ticker = ticker_of.get(counts['stock_id'])
+            if ticker is None:
+                continue
+            seen.add(ticker)
+            for period in self.PERIODS:
+                current = counts[f'current_{period}']
+                prior = counts[f'prior_{period}']
+                rows.append(NewsBuzz(
+                    ticker=ticker,
+                    period=period,
+                    news_count=current,
+                    prior_count=prior,
+                    velocity=round((current - prior) / max(prior, 1), 6),
+                    as_of=today
+                ))
+
+        if rows:
+            NewsBuzz.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['ticker', 'period'],
+                update_fields=['news_count', 'prior_count', 'velocity', 'as_of']
+            )
+
+        stale = NewsBuzz.objects.exclude(ticker__in=seen)
+        if tickers is not None:
+            stale = stale.filter(ticker__in=tickers)
+        stale.delete()
+
+        if tickers is None:
+            cache.set(self.AS_OF_CACHE_KEY, today, None)
+        return len(seen)
+
+    def ensure_current(self):
+        today = timezone.localdate()
+        if cache.get(self.AS_OF_CACHE_KEY) == today:
+            return
+
+        if NewsBuzz.objects.filter(as_of__lt=today).exists() or not NewsBuzz.objects.exists():
+            single_flight.do('*', 'buzz-index', lambda: self.refresh())
+        else:
+            cache.set(self.AS_OF_CACHE_KEY, today, None)
+
+    def top(self, period: str, limit: int) -> List[Dict]:
+        self.ensure_current()
+
+        entries = list(NewsBuzz.objects.filter(
+            period=period,
+            news_count__gt=0
+        ).order_by('-news_count', 'ticker')[:limit])
+        if not entries:
+            return []
+
+        names = dict(Stock.objects.filter(
+            ticker__in=[entry.ticker for entry in entries]
+        ).values_list('ticker', 'company_full_name'))
+
+        max_news_count = entries[0].news_count
+        return [
+            {
+                'ticker': entry.ticker,
+                'score': round(min(entry.news_count / max(max_news_count, 10.0), 0.999999), 6),
+                'velocity': entry.velocity,
+                'company_full_name': names.get(entry.ticker) or f'{entry.ticker} Corporation'
+            }
+            for entry in entries
+        ]
@@ -0,0 +1,44 @@
+import hashlib
+from datetime import datetime
+from typing import Iterable, NamedTuple, Optional
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
+
+
+class Validators(NamedTuple):
+    # No Last-Modified: deletes (archive_news) can leave the newest timestamp
+    # where it was, so only the ETag, which covers the counts, is reliable.
+    etag: str
+
+
+def validators_for(endpoint: str, query_string: str, watermark: Iterable) -> Validators:
+    # A watermark is a handful of cheap aggregates over the rows a response is
+    # built from (row count, newest updated_at, ...). Any write that changes
+    # the payload moves at least one of them.
+    watermark = list(watermark)
+    parts = [endpoint, query_string] + [
+        value.isoformat() if isinstance(value, datetime) else str(value) for value in watermark
+    ]
+    return Validators(quote_etag(hashlib.sha1('|'.join(parts).encode()).hexdigest()[:32]))
+
+
+def is_conditional(request) -> bool:
+    return 'HTTP_IF_NONE_MATCH' in request.META
+
+
+def not_modified(request, validators: Optional[Validators]):
+    if validators is None:
+        return None
+    response = get_conditional_response(request, etag=validators.etag)
+    if response is not None:
+        add_validators(response, validators)
+    return response
+
+
+def add_validators(response, validators: Optional[Validators]):
+    if validators is None:
+        return response
+    response['ETag'] = validators.etag
+    # Let clients keep the body but revalidate it on every refresh.
+    patch_cache_control(response, no_cache=True)
+    return response
@@ -0,0 +1,271 @@
+import asyncio
+import json
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import timedelta
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple
+from django.db import DatabaseError, close_old_connections, connections
+from django.utils import timezone
+from api.models import News
+from api.serializers.stock_serializers import NewsSerializer, StockSerializer
+
+
+class Event(NamedTuple):
+    id: str
+    seq: int
+    type: str
+    ticker: str
+    sentiment: Optional[str]
+    data: str
+
+
+class Subscription:
+
+    def __init__(self, loop, matches: Callable[[Event], bool], queue_size: int):
+        self.loop = loop
+        self.matches = matches
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def notify(self, event: Event):
+        # Runs on the publisher's thread.
+        self.loop.call_soon_threadsafe(self.deliver, event)
+
+    def deliver(self, event: Event):
+        # Runs on the subscriber's event loop.
+        if self.overflowed or not self.matches(event):
+            return
+        try:
+            self.queue.put_nowait(event)
+        except (asyncio.QueueFull, queue.Full):
+            # A client this far behind resyncs instead of holding memory.
+            self.overflowed = True
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except (asyncio.QueueEmpty, queue.Empty):
+                    break
+            self.queue.put_nowait(None)
+
+
+class BlockingSubscription(Subscription):
+    # For a stream iterated by a WSGI worker thread, which blocks on the
+    # queue instead of awaiting it. Publishers deliver directly.
+
+    def __init__(self, matches: Callable[[Event], bool], queue_size: int):
+        self.loop = None
+        self.matches = matches
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.overflowed = False
+        self._lock = threading.Lock()
+
+    def notify(self, event: Event):
+        with self._lock:
+            self.deliver(event)
+
+
+class EventStream:
+    # In-process pub/sub for the /events SSE endpoint. Publishers are the
+    # ingestion, scoring and quote-refresh paths and may run on any thread;
+    # each subscriber is an asyncio queue drained by one streaming response.
+    # The last REPLAY_SIZE events are kept so a reconnecting client can
+    # resume from its Last-Event-ID. Ids carry a per-process epoch, so an id
+    # from before a restart (or from another worker) is detected as a gap.
+
+    REPLAY_SIZE = 1000
+    QUEUE_SIZE = 1000
+
+    def __init__(self):
+        self.epoch = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._buffer = deque(maxlen=self.REPLAY_SIZE)
+        self._subscribers = set()
+
+    @property
+    def last_event_id(self) -> str:
+        return f'{self.epoch}-{self._seq}'
+
+    def publish(self, event_type: str, ticker: str, data: dict, sentiment: Optional[str] = None):
+        with self._lock:
+            self._seq += 1
+            event = Event(f'{self.epoch}-{self._seq}', self._seq, event_type, ticker, sentiment, json.dumps(data))
+            self._buffer.append(event)
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription.notify(event)
+            except RuntimeError:
+                # The subscriber's loop has shut down.
+                self.unsubscribe(subscription)
+
+    def subscribe(self, matches: Callable[[Event], bool], last_event_id: Optional[str] = None,
+                  blocking: bool = False) -> Tuple[Subscription, Optional[List[Event]]]:
+        # Returns the events after last_event_id, or None if some of them are
+        # no longer buffered. Registering and reading the buffer under one
+        # lock means no event is both replayed and delivered, or neither.
+        if blocking:
+            subscription = BlockingSubscription(matches, self.QUEUE_SIZE)
+        else:
+            subscription = Subscription(asyncio.get_running_loop(), matches, self.QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(subscription)
+            replay = self._replay(last_event_id)
+        if replay is not None:
+            replay = [event for event in replay if matches(event)]
+        return subscription, replay
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def mark_gap(self):
+        # Some events were never published, e.g. while nobody was subscribed:
+        # a client resuming from an earlier id gets stream.reset.
+        with self._lock:
+            self._seq += 1
+            self._buffer.clear()
+
+    def _replay(self, last_event_id: Optional[str]) -> Optional[List[Event]]:
+        if not last_event_id:
+            return []
+        epoch, _, seq = last_event_id.partition('-')
+        if epoch != self.epoch or not seq.isdigit() or int(seq) > self._seq:
+            return None
+
+        seq = int(seq)
+        oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+        if seq < oldest - 1:
+            return None
+        return [event for event in self._buffer if event.seq > seq]
+
+
+event_stream = EventStream()
+
+
+class NewsEventFeed:
+    # populate_news and analyze_sentiments write News from their own
+    # processes, where nobody is subscribed. While this process has
+    # subscribers, a thread polls News.updated_at and publishes the articles
+    # that changed since the last poll: news.created if they were also
+    # created since, news.scored if they are scored. Articles written in
+    # this process are skipped, as their events were published directly.
+    # Polls reach LAG_SECONDS back for writes that committed late.
+
+    POLL_SECONDS = 2
+    LAG_SECONDS = 5
+    BATCH_SIZE = 500
+
+    def __init__(self, stream: EventStream):
+        self.stream = stream
+        self._lock = threading.Lock()
+        self._thread = None
+        self._wanted = False
+        self._mark = None
+        self._seen = {}
+
+    def start(self):
+        # Called before subscribing. Writes made while the feed was stopped
+        # were never published, so a restart is a gap.
+        with self._lock:
+            self._wanted = True
+            if self._thread is not None:
+                return
+            self._mark = timezone.now()
+            self._seen = {}
+            self._thread = threading.Thread(target=self._run, name='news-event-feed', daemon=True)
+            self._thread.start()
+        self.stream.mark_gap()
+
+    def skip(self, news_items: Iterable[News]):
+        # Keyed by link: an upserted article keeps its stored id, not the
+        # one on the instance.
+        with self._lock:
+            if self._thread is None:
+                return
+            for news in news_items:
+                self._seen[(news.link, news.updated_at)] = news.updated_at
+
+    def poll(self) -> int:
+        now = timezone.now()
+        since = self._mark - timedelta(seconds=self.LAG_SECONDS)
+        rows = list(News.objects.filter(updated_at__gt=since).only(
+            *NewsSerializer.model_fields(NewsSerializer.SUMMARY_FIELDS), 'updated_at', 'created_at'
+        ).order_by('updated_at')[:self.BATCH_SIZE])
+
+        with self._lock:
+            known = {link for link, updated_at in self._seen}
+            fresh = [news for news in rows if (news.link, news.updated_at) not in self._seen]
+            for news in rows:
+                self._seen[(news.link, news.updated_at)] = news.updated_at
+            self._mark = rows[-1].updated_at if len(rows) == self.BATCH_SIZE else now
+            horizon = self._mark - timedelta(seconds=self.LAG_SECONDS)
+            self._seen = {key: updated_at for key, updated_at in self._seen.items() if updated_at > horizon}
+
+        created = {news.link for news in fresh if news.created_at > since and news.link not in known}
+        news_created([news for news in fresh if news.link in created])
+        news_sentiment_changed([news for news in fresh if news.link not in created and news.sentiment_analyzed])
+        return len(fresh)
+
+    def _run(self):
+        try:
+            while True:
+                time.sleep(self.POLL_SECONDS)
+                with self._lock:
+                    if not self._wanted and not self.stream.subscriber_count():
+                        self._thread = None
+                        return
+                    self._wanted = False
+                close_old_connections()
+                try:
+                    self.poll()
+                except DatabaseError as e:
+                    print(f"Error polling news events: {str(e)}")
+        finally:
+            connections.close_all()
+
+
+news_event_feed = NewsEventFeed(event_stream)
+
+
+def news_written(news_items: Iterable):
+    # Every article written in this process, whether or not it publishes an
+    # event, so the news feed does not publish it again.
+    news_event_feed.skip(news_items)
+
+
+def news_created(news_items: Iterable):
+    # With nobody subscribed nothing is serialized, and the dropped events
+    # are a gap for clients that resume later.
+    news_items = list(news_items)
+    if not event_stream.subscriber_count():
+        if news_items:
+            event_stream.mark_gap()
+        return
+    for news in news_items:
+        data = NewsSerializer(news, fields=NewsSerializer.SUMMARY_FIELDS).data
+        event_stream.publish('news.created', news.ticker, data, news.sentiment if news.sentiment_analyzed else None)
+
+
+def news_sentiment_changed(news_items: Iterable):
+    news_items = list(news_items)
+    if not event_stream.subscriber_count():
+        if news_items:
+            event_stream.mark_gap()
+        return
+    for news in news_items:
+        data = NewsSerializer(news, fields=['id', 'ticker', 'sentiment', 'sentimentAnalyzed']).data
+        event_stream.publish('news.scored', news.ticker, data, news.sentiment)
+
+
+def stock_quotes_updated(stocks: Iterable):
+    for stock in stocks:
+        event_stream.publish('stock.quote_updated', stock.ticker, StockSerializer(stock).data)
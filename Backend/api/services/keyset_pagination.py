@@ -0,0 +1,84 @@
+import base64
+import json
+import uuid
+from typing import List
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPaginator:
+    # Newest-first pages over (date, id). A cursor holds the (date, id) of
+    # the row a page starts after and the direction to read in, so every
+    # page is a range scan from that key, however deep it is. The id breaks
+    # ties between articles published in the same second.
+
+    MAX_PAGE_SIZE = 100
+
+    def __init__(self, cursor: str, page_size: int):
+        self.page_size = max(1, min(page_size, self.MAX_PAGE_SIZE))
+        self.position = None
+        self.reverse = False
+        if cursor:
+            self.position, self.reverse = self.decode(cursor)
+        self.next = None
+        self.prev = None
+
+    @property
+    def is_first_page(self) -> bool:
+        return self.position is None
+
+    def page_queryset(self, queryset):
+        # One row past the page tells whether another page follows.
+        if self.position:
+            date, row_id = self.position
+            # The plain date bound is redundant but lets the (ticker, -date)
+            # index seek straight to the cursor; SQLite cannot derive a
+            # range from the OR on its own.
+            if self.reverse:
+                queryset = queryset.filter(date__gte=date).filter(Q(date__gt=date) | Q(date=date, id__gt=row_id))
+            else:
+                queryset = queryset.filter(date__lte=date).filter(Q(date__lt=date) | Q(date=date, id__lt=row_id))
+
+        ordering = ('date', 'id') if self.reverse else ('-date', '-id')
+        return queryset.order_by(*ordering)[:self.page_size + 1]
+
+    def paginate(self, queryset) -> List:
+        # Takes a .values() queryset that includes date and id.
+        rows = list(self.page_queryset(queryset))
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if self.reverse:
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, not self.is_first_page
+
+        self.next = self.encode(rows[-1], reverse=False) if rows and has_next else None
+        self.prev = self.encode(rows[0], reverse=True) if rows and has_prev else None
+        return rows
+
+    def envelope(self, results) -> dict:
+        return {'results': results, 'next': self.next, 'prev': self.prev}
+
+    @staticmethod
+    def encode(row, reverse: bool) -> str:
+        payload = json.dumps({'d': row['date'].isoformat(), 'i': row['id'].hex, 'r': int(reverse)})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode(cursor: str):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            date = parse_datetime(payload['d'])
+            row_id = uuid.UUID(hex=payload['i'])
+            reverse = bool(payload.get('r'))
+        except (ValueError, KeyError, TypeError):
+            raise InvalidCursor('Invalid cursor')
+        if date is None:
+            raise InvalidCursor('Invalid cursor')
+        return (date, row_id), reverse
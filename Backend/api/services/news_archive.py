@@ -0,0 +1,111 @@
+import gzip
+import os
+import tempfile
+import uuid
+from collections import defaultdict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+import orjson
+from django.conf import settings
+from django.utils import timezone
+
+
+# Layout: <root>/<YYYY-MM>/<written at>-<random>.jsonl.gz, one JSON article
+# per line with the News column names. A month holds the articles published
+# in it (local time); each archive run adds one file per month it touched.
+# Files are written once and never changed, so backups only copy new files.
+ARCHIVE_FIELDS = ['id', 'ticker', 'title', 'content', 'source', 'author', 'date', 'link',
+                  'sentiment', 'sentiment_analyzed']
+
+
+class NewsArchiveStore:
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.NEWS_ARCHIVE_DIR)
+
+    def month_of(self, when: datetime) -> str:
+        return timezone.localtime(when).strftime('%Y-%m')
+
+    def write(self, rows: Iterable[Dict]) -> int:
+        by_month = defaultdict(list)
+        for row in rows:
+            by_month[self.month_of(row['date'])].append(row)
+
+        stamp = timezone.now().strftime('%Y%m%dT%H%M%S')
+        for month, month_rows in by_month.items():
+            directory = self.root / month
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(fileobj=raw, mode='wb') as fh:
+                    for row in month_rows:
+                        fh.write(orjson.dumps({field: self._encode(row[field]) for field in ARCHIVE_FIELDS}))
+                        fh.write(b'\n')
+                os.replace(tmp_path, directory / f'{stamp}-{uuid.uuid4().hex[:8]}.jsonl.gz')
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+        return sum(len(month_rows) for month_rows in by_month.values())
+
+    def read(self, tickers: Iterable[str] = (), sentiment: Optional[str] = None,
+             start: Optional[datetime] = None, end: Optional[datetime] = None,
+             limit: Optional[int] = None) -> List[Dict]:
+        # Newest first, in the shape of News.objects.values(). Months are read
+        # whole, newest first, until `limit` articles have matched.
+        tickers = set(tickers)
+        first = self.month_of(start) if start else None
+        last = self.month_of(end) if end else None
+
+        results = []
+        for month in self.months():
+            if (last and month > last) or (first and month < first):
+                continue
+            # A run interrupted between writing and deleting archives its
+            # batch again on the next run.
+            matched = {}
+            for row in self._rows(month):
+                if tickers and row['ticker'] not in tickers:
+                    continue
+                if sentiment and row['sentiment'] != sentiment:
+                    continue
+                row['date'] = datetime.fromisoformat(row['date'])
+                if (start and row['date'] < start) or (end and row['date'] >= end):
+                    continue
+                row['id'] = uuid.UUID(row['id'])
+                matched[row['id']] = row
+            results.extend(sorted(matched.values(), key=lambda row: (row['date'], row['id']), reverse=True))
+            if limit is not None and len(results) >= limit:
+                return results[:limit]
+        return results
+
+    def months(self) -> List[str]:
+        if not self.root.is_dir():
+            return []
+        return sorted((entry.name for entry in self.root.iterdir() if entry.is_dir()), reverse=True)
+
+    def stats(self) -> Dict:
+        files = list(self.root.glob('*/*.jsonl.gz')) if self.root.is_dir() else []
+        return {
+            'months': len(self.months()),
+            'files': len(files),
+            'bytes': sum(path.stat().st_size for path in files),
+        }
+
+    def _rows(self, month: str) -> Iterator[Dict]:
+        for path in sorted((self.root / month).glob('*.jsonl.gz')):
+            with gzip.open(path, 'rb') as fh:
+                for line in fh:
+                    yield orjson.loads(line)
+
+    @staticmethod
+    def _encode(value):
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        return value
+
+
+news_archive = NewsArchiveStore()
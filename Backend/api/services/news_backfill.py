@@ -0,0 +1,56 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
+from django.core.cache import cache
+from django.db import connections
+from api.services.news_ingestion import NewsIngestionService
+from api.services.news_service import NewsService
+
+
+class NewsBackfillService:
+    # Provider fetches for thin news feeds run on a small thread pool instead
+    # of the request. The job's state lives in the shared cache so that every
+    # process sees it: 'pending' while a worker fetches (bounded by
+    # PENDING_TIMEOUT in case the worker dies), then 'done' for COOLDOWN so a
+    # ticker the provider has nothing more for is not refetched on every
+    # request. Ingestion invalidates the cached /news responses, so the
+    # client's retry is served the new articles from the DB.
+
+    PENDING_TIMEOUT = 60
+    COOLDOWN = 600
+    RETRY_AFTER = 3
+
+    def __init__(self, max_workers: int = 2):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='news-backfill')
+
+    def request(self, tickers: Iterable[str], limit: int, sentiment: Optional[str] = None,
+                time_period: Optional[str] = None) -> bool:
+        pending = False
+        for ticker in tickers:
+            key = self._key(ticker, sentiment, time_period)
+            if cache.add(key, 'pending', self.PENDING_TIMEOUT):
+                self.executor.submit(self._run, key, ticker, limit, sentiment, time_period)
+                pending = True
+            elif cache.get(key) == 'pending':
+                pending = True
+        return pending
+
+    def _run(self, key, ticker, limit, sentiment, time_period):
+        try:
+            external_news = NewsService().get_news_for_ticker(
+                ticker,
+                limit=limit,
+                sentiment=sentiment,
+                time_period=time_period
+            )
+            NewsIngestionService().save_articles(external_news)
+        except Exception as e:
+            print(f"Error backfilling news for {ticker}: {str(e)}")
+        finally:
+            cache.set(key, 'done', self.COOLDOWN)
+            connections.close_all()
+
+    def _key(self, ticker, sentiment, time_period):
+        return f"news-backfill:{ticker}:{sentiment or '-'}:{time_period or '-'}"
+
+
+news_backfill = NewsBackfillService()
@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from django.utils import timezone
+from api.models import News
+from api.services.buzz_index import BuzzIndexService
+from api.services.event_stream import news_created, news_sentiment_changed, news_written
+from api.services.news_retention import NewsRetentionService
+from api.services.response_cache import news_ingested, news_scored
+from api.services.sentiment_rollup import SentimentRollupService
+from api.services.sentiment_score import SentimentScoreService
+
+
+class NewsIngestionService:
+    # Every write to News goes through here so the derived data (daily
+    # rollups, buzz index, Stock.sentiment_score, cached payloads) is updated
+    # for exactly the affected tickers.
+
+    ARTICLE_FIELDS = ['ticker', 'title', 'content', 'source', 'author', 'date', 'sentiment', 'sentiment_analyzed']
+    # content may be empty, but not missing.
+    REQUIRED_FIELDS = ['ticker', 'title', 'source', 'date', 'link']
+    SENTIMENTS = {choice for choice, _ in News.SENTIMENT_CHOICES}
+
+    def __init__(self):
+        self.rollups = SentimentRollupService()
+        self.buzz_index = BuzzIndexService()
+        self.sentiment_scores = SentimentScoreService()
+        self.retention = NewsRetentionService()
+
+    def save_articles(self, articles: Iterable[Dict]) -> int:
+        # Articles older than the retention horizon would reopen days whose
+        # rollups are final, so they are not stored. Invalid ones are skipped
+        # rather than failing the bulk write for the whole batch.
+        cutoff = self.retention.cutoff()
+        by_link = {}
+        for article in articles:
+            if self._is_valid(article) and not self.retention.is_expired(article['date'], cutoff):
+                by_link[article['link']] = article
+        if not by_link:
+            return 0
+
+        stored = {
+            values[0]: values[1:]
+            for values in News.objects.filter(link__in=list(by_link)).values_list('link', *self.ARTICLE_FIELDS)
+        }
+
+        rows = [
+            News(
+                link=link,
+                ticker=article['ticker'],
+                title=article['title'],
+                content=article['content'],
+                source=article['source'],
+                author=article.get('author'),
+                date=article['date'],
+                sentiment=article.get('sentiment'),
+                sentiment_analyzed=article.get('sentiment') is not None
+            )
+            for link, article in by_link.items()
+        ]
+        # Re-fetched articles that did not change are left alone, so their
+        # updated_at (and the ETags derived from it) stays put.
+        rows = [
+            news for news in rows
+            if stored.get(news.link) != tuple(getattr(news, field) for field in self.ARTICLE_FIELDS)
+        ]
+        if not rows:
+            return 0
+
+        News.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['link'],
+            update_fields=self.ARTICLE_FIELDS + ['updated_at']
+        )
+
+        previous = [self._scored(stored.get(news.link)) for news in rows]
+        tickers = self._articles_changed(rows, previous)
+        self.buzz_index.refresh({news.ticker for news in rows})
+        news_ingested(tickers)
+        news_written(rows)
+        news_created([news for news in rows if news.link not in stored])
+        return len(set(by_link) - set(stored))
+
+    def save_sentiments(self, news_items: List[News]) -> int:
+        if not news_items:
+            return 0
+
+        previous = {
+            news_id: (ticker, date, sentiment if analyzed else None)
+            for news_id, ticker, date, sentiment, analyzed in News.objects.filter(
+                id__in=[news.id for news in news_items]
+            ).values_list('id', 'ticker', 'date', 'sentiment', 'sentiment_analyzed')
+        }
+
+        now = timezone.now()
+        for news in news_items:
+            news.updated_at = now
+        News.objects.bulk_update(news_items, ['sentiment', 'sentiment_analyzed', 'updated_at'])
+        tickers = self._articles_changed(news_items, [previous.get(news.id) for news in news_items])
+        news_scored(tickers)
+        news_written(news_items)
+        news_sentiment_changed([
+            news for news in news_items
+            if news.sentiment_analyzed and (previous.get(news.id) or (None,) * 3)[2] != news.sentiment
+        ])
+        return len(news_items)
+
+    def _is_valid(self, article: Dict) -> bool:
+        if any(not article.get(field) for field in self.REQUIRED_FIELDS) or article.get('content') is None:
+            return False
+        if not isinstance(article['date'], datetime):
+            return False
+        if article.get('sentiment') is not None and article['sentiment'] not in self.SENTIMENTS:
+            return False
+        for field in ('ticker', 'title', 'source', 'author', 'link'):
+            value = article.get(field)
+            if value is not None and len(value) > News._meta.get_field(field).max_length:
+                return False
+        return True
+
+    def _scored(self, values: Optional[Tuple]) -> Optional[Tuple]:
+        if values is None:
+            return None
+        fields = dict(zip(self.ARTICLE_FIELDS, values))
+        return fields['ticker'], fields['date'], fields['sentiment'] if fields['sentiment_analyzed'] else None
+
+    def _articles_changed(self, news_items: List[News], previous: List[Optional[Tuple]]) -> Set[str]:
+        keys = self.rollups.keys_for(news_items)
+        contributions = []
+        for news, before in zip(news_items, previous):
+            after = (news.ticker, news.date, news.sentiment if news.sentiment_analyzed else None)
+            if before == after:
+                continue
+            if before is not None:
+                keys.add(self.rollups.day_key(before[0], before[1]))
+                if before[2]:
+                    contributions.append((before[0], before[1], before[2], -1))
+            if after[2]:
+                contributions.append((after[0], after[1], after[2], 1))
+
+        cutoff = self.retention.cutoff()
+        if cutoff:
+            keys = {key for key in keys if key[1] >= cutoff.date()}
+        self.rollups.refresh(keys)
+        self.sentiment_scores.apply(contributions)
+        return {news.ticker for news in news_items} | {key[0] for key in keys}
@@ -0,0 +1,71 @@
+from datetime import datetime, time, timedelta
+from typing import Dict, Optional
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from api.models import News
+from api.services.news_archive import ARCHIVE_FIELDS, NewsArchiveStore, news_archive
+from api.services.response_cache import news_archived
+from api.services.sentiment_rollup import SentimentRollupService
+
+
+class NewsRetentionService:
+    # News holds the last NEWS_RETENTION_DAYS days, counted in whole local
+    # days. Older articles are counted into NewsSentimentHistory one final
+    # time, written to the archive and deleted, a batch per transaction.
+    # Nothing may recount those days afterwards, as News no longer holds
+    # them: ingestion drops articles older than the horizon and does not
+    # refresh rollups for days past it.
+
+    BATCH_SIZE = 5000
+
+    def __init__(self, store: Optional[NewsArchiveStore] = None):
+        self.store = store or news_archive
+        self.rollups = SentimentRollupService()
+
+    def cutoff(self, days: Optional[int] = None) -> Optional[datetime]:
+        days = settings.NEWS_RETENTION_DAYS if days is None else days
+        if days <= 0:
+            return None
+        first_day = timezone.localdate() - timedelta(days=days)
+        return timezone.make_aware(datetime.combine(first_day, time.min))
+
+    def is_expired(self, when: datetime, cutoff: Optional[datetime] = None) -> bool:
+        cutoff = cutoff or self.cutoff()
+        if cutoff is None:
+            return False
+        if timezone.is_naive(when):
+            when = timezone.make_aware(when)
+        return when < cutoff
+
+    def archive(self, cutoff: Optional[datetime] = None, batch_size: Optional[int] = None,
+                dry_run: bool = False) -> Dict:
+        cutoff = cutoff or self.cutoff()
+        if cutoff is None:
+            return {'articles': 0, 'days': 0, 'tickers': 0}
+
+        expired = News.objects.filter(date__lt=cutoff)
+        keys = list(expired.annotate(day=TruncDate('date')).values_list('ticker', 'day').distinct())
+        if dry_run:
+            return {'articles': expired.count(), 'days': len(keys), 'tickers': len({key[0] for key in keys})}
+
+        self.rollups.refresh(keys)
+
+        archived = 0
+        tickers = set()
+        while True:
+            with transaction.atomic(using=router.db_for_write(News)):
+                rows = list(expired.order_by('date').values(*ARCHIVE_FIELDS)[:batch_size or self.BATCH_SIZE])
+                if not rows:
+                    break
+                # Written before the delete commits: a failed delete leaves a
+                # duplicate in the archive, which reads skip, never a loss.
+                self.store.write(rows)
+                News.objects.filter(id__in=[row['id'] for row in rows]).delete()
+            archived += len(rows)
+            tickers.update(row['ticker'] for row in rows)
+
+        if tickers:
+            news_archived(tickers)
+        return {'articles': archived, 'days': len(keys), 'tickers': len(tickers)}
@@ -0,0 +1,99 @@
+import re
+from datetime import datetime
+from typing import Iterable, List, NamedTuple, Optional
+from django.db import connections, router
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+from api.models import News
+
+
+class SearchHit(NamedTuple):
+    id: str
+    title: str
+    snippet: str
+    score: float
+
+
+class NewsSearchService:
+    # Full-text search over the api_news_fts index (migration 0008). User
+    # input never reaches FTS5 as query syntax: every term is quoted, so
+    # only phrases ("...") and trailing-* prefixes are honoured.
+
+    # bm25 weights per indexed column: title, content, ticker
+    WEIGHTS = (10.0, 1.0, 0.0)
+    HIGHLIGHT = ('<mark>', '</mark>')
+    SNIPPET_TOKENS = 24
+    MAX_TERMS = 16
+
+    TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+    def match_expression(self, query: str, tickers: Iterable[str] = (),
+                         columns: Optional[str] = '{title content}') -> Optional[str]:
+        terms = []
+        for phrase, word in self.TERM_PATTERN.findall(query or '')[:self.MAX_TERMS]:
+            text = phrase or word
+            prefix = not phrase and text.endswith('*')
+            text = text.rstrip('*') if prefix else text
+            if not re.search(r'\w', text):
+                continue
+            terms.append(self._quote(text) + ('*' if prefix else ''))
+        if not terms:
+            return None
+
+        expression = ' '.join(terms)
+        if columns:
+            expression = f'{columns} : ({expression})'
+        tickers = [ticker for ticker in tickers if ticker]
+        if tickers:
+            expression = f"ticker : ({' OR '.join(self._quote(ticker) for ticker in tickers)}) AND {expression}"
+        return expression
+
+    def search(self, query: str, tickers: Iterable[str] = (), start: Optional[datetime] = None,
+               end: Optional[datetime] = None, limit: int = 20) -> List[SearchHit]:
+        expression = self.match_expression(query, tickers)
+        if expression is None:
+            return []
+
+        connection = connections[router.db_for_read(News)]
+        where = ['api_news_fts MATCH %s']
+        params = [expression]
+        if start is not None:
+            where.append('n.date >= %s')
+            params.append(connection.ops.adapt_datetimefield_value(start))
+        if end is not None:
+            where.append('n.date < %s')
+            params.append(connection.ops.adapt_datetimefield_value(end))
+
+        open_tag, close_tag = self.HIGHLIGHT
+        sql = f"""
+            SELECT n.id,
+                   highlight(api_news_fts, 0, %s, %s),
+                   snippet(api_news_fts, 1, %s, %s, '…', %s),
+                   bm25(api_news_fts, {', '.join(str(w) for w in self.WEIGHTS)}) AS score
+            FROM api_news_fts
+            JOIN api_news n ON n.rowid = api_news_fts.rowid
+            WHERE {' AND '.join(where)}
+            ORDER BY score, n.date DESC
+            LIMIT %s
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [open_tag, close_tag, open_tag, close_tag, self.SNIPPET_TOKENS] + params + [limit])
+            rows = cursor.fetchall()
+
+        # bm25 is lower-is-better; flip it so a higher score ranks first.
+        return [SearchHit(row_id, title, snippet, round(-score, 4)) for row_id, title, snippet, score in rows]
+
+    def filter(self, queryset, query: str):
+        # Narrows a News queryset to the articles matching query in any
+        # column, ticker included, for the admin.
+        expression = self.match_expression(query, columns=None)
+        if expression is None:
+            return queryset
+        return queryset.filter(RawSQL(
+            'api_news.rowid IN (SELECT rowid FROM api_news_fts WHERE api_news_fts MATCH %s)',
+            [expression],
+            output_field=BooleanField()
+        ))
+
+    def _quote(self, text: str) -> str:
+        return '"' + text.replace('"', '""') + '"'
@@ -193,26 +193,6 @@ class NewsService:
             print(f"Error fetching Twitter news: {str(e)}")
             return []
     
-    def get_news_buzz(self, limit: int = 10) -> List[Dict]:
-        popular_tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'TSLA', 'NVDA', 'AMD', 
-                          'NFLX', 'DIS', 'JPM', 'V', 'JNJ', 'WMT', 'PG', 'MA', 'UNH', 'HD', 
-                          'PYPL', 'BAC', 'INTC', 'CMCSA', 'XOM', 'VZ', 'ADBE', 'CSCO', 'NKE', 
-                          'MRVL', 'AVGO', 'QCOM']
-        
-        buzz_scores = []
-        for ticker in popular_tickers:
-            news = self.get_news_for_ticker(ticker, limit=5)
-            if news:
-                score = min(len(news) / 10.0, 0.999999)
-                buzz_scores.append({
-                    'ticker': ticker,
-                    'score': round(score, 6),
-                    'company_full_name': self._get_company_name(ticker)
-                })
-        
-        buzz_scores.sort(key=lambda x: x['score'], reverse=True)
-        return buzz_scores[:limit]
-    
     def _get_company_name(self, ticker: str) -> str:
         company_names = {
             'AAPL': 'Apple Inc.',
@@ -0,0 +1,230 @@
+import asyncio
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Set
+from asgiref.sync import sync_to_async
+from django.db.models import Max
+from django.utils import timezone
+from api.models import PriceHistory, PriceHistoryGap, Stock
+from api.services.single_flight import single_flight
+from api.services.stock_api_service import StockAPIService
+from api.services.trading_calendar import trading_days
+from api.services.price_store import PriceSeries, price_store
+from api.services.response_cache import history_updated
+
+
+class PriceHistoryService:
+
+    RANGES = {
+        '1M': 30,
+        '3M': 91,
+        '6M': 182,
+        '1Y': 365,
+        '5Y': 1826,
+        'max': None,
+    }
+
+    # A provider may publish the latest sessions late, so "no bar" answers for
+    # recent dates are only trusted for a while. Older gaps are permanent.
+    RECENT_GAP_DAYS = 3
+    RECENT_GAP_TTL = 3600
+
+    def __init__(self, stock_service: Optional[StockAPIService] = None):
+        self.stock_service = stock_service or StockAPIService()
+
+    def missing_dates(self, stock, start_date: date, end_date: date) -> Set[date]:
+        required_dates = set(trading_days(start_date, end_date))
+        if not required_dates:
+            return set()
+
+        # The price store mirrors PriceHistory, so this check costs no query.
+        stored_dates = self.series(stock).slice(start_date, end_date).dates
+        existing_dates = set(stored_dates.astype(object))
+
+        missing = required_dates - existing_dates
+        if missing:
+            missing -= self._known_gaps(stock, missing)
+        return missing
+
+    def ensure_history(self, stock, start_date: date, end_date: date) -> int:
+        if not self.missing_dates(stock, start_date, end_date):
+            return 0
+
+        stored = single_flight.do(
+            stock.ticker,
+            'history',
+            lambda: self._backfill(stock, start_date, end_date)
+        )
+        return stored or 0
+
+    async def aensure_history(self, stock, start_date: date, end_date: date) -> int:
+        if not await sync_to_async(self.missing_dates)(stock, start_date, end_date):
+            return 0
+
+        stored = await single_flight.ado(
+            stock.ticker,
+            'history',
+            lambda: self._abackfill(stock, start_date, end_date)
+        )
+        return stored or 0
+
+    async def aensure_history_many(self, stocks: List, start_date: date, end_date: date) -> int:
+        # aensure_history for several stocks, with one gap query between them.
+        # The provider calls for every stock run concurrently.
+        to_backfill = await sync_to_async(self._stocks_to_backfill)(stocks, start_date, end_date)
+        stored = await asyncio.gather(*[
+            single_flight.ado(
+                stock.ticker,
+                'history',
+                lambda stock=stock: self._abackfill(stock, start_date, end_date)
+            )
+            for stock in to_backfill
+        ])
+        return sum(count or 0 for count in stored)
+
+    def _stocks_to_backfill(self, stocks: List, start_date: date, end_date: date) -> List:
+        required_dates = set(trading_days(start_date, end_date))
+        missing = {}
+        for stock in stocks:
+            stored_dates = self.series(stock).slice(start_date, end_date).dates
+            dates = required_dates - set(stored_dates.astype(object))
+            if dates:
+                missing[stock] = dates
+        if not missing:
+            return []
+
+        known_gaps = self._known_gaps_many(missing)
+        return [stock for stock, dates in missing.items() if dates - known_gaps.get(stock.pk, set())]
+
+    def store_bars(self, stock, bars: Iterable[Dict]) -> int:
+        rows = [
+            PriceHistory(
+                stock=stock,
+                date=bar['date'],
+                price=bar['price'],
+                volume=bar.get('volume', 0)
+            )
+            for bar in bars
+        ]
+        if not rows:
+            return 0
+
+        PriceHistory.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['stock', 'date'],
+            update_fields=['price', 'volume']
+        )
+        PriceHistoryGap.objects.filter(
+            stock=stock,
+            date__in=[row.date for row in rows]
+        ).delete()
+
+        price_store.sync_from_db(stock)
+        history_updated([stock.ticker])
+        return len(rows)
+
+    def series(self, stock) -> PriceSeries:
+        series = price_store.load(stock.ticker)
+        if series is None:
+            price_store.sync_from_db(stock)
+            series = price_store.load(stock.ticker)
+        return series if series is not None else PriceSeries.empty()
+
+    def closes(self, stock, start_date: date, end_date: Optional[date] = None) -> List[float]:
+        return self.series(stock).slice(start_date, end_date).closes.tolist()
+
+    def ensure_full_history(self, stock) -> int:
+        if stock.history_backfilled_at is None:
+            stored = single_flight.do(
+                stock.ticker,
+                'full_history',
+                lambda: self._backfill_full(stock)
+            )
+            return stored or 0
+
+        latest = PriceHistory.objects.filter(stock=stock).aggregate(latest=Max('date'))['latest']
+        yesterday = date.today() - timedelta(days=1)
+        if latest is None or latest >= yesterday:
+            return 0
+        return self.ensure_history(stock, latest + timedelta(days=1), yesterday)
+
+    def range_start(self, range_key: str) -> Optional[date]:
+        days = self.RANGES[range_key]
+        if days is None:
+            return None
+        return date.today() - timedelta(days=days)
+
+    def _backfill(self, stock, start_date: date, end_date: date) -> int:
+        missing = self.missing_dates(stock, start_date, end_date)
+        if not missing:
+            return 0
+
+        days_to_fetch = (date.today() - min(missing)).days + 1
+        bars = self.stock_service.get_price_history(stock.ticker, days=days_to_fetch)
+        return self._store_backfill(stock, missing, bars)
+
+    async def _abackfill(self, stock, start_date: date, end_date: date) -> int:
+        missing = await sync_to_async(self.missing_dates)(stock, start_date, end_date)
+        if not missing:
+            return 0
+
+        days_to_fetch = (date.today() - min(missing)).days + 1
+        bars = await self.stock_service.aget_price_history(stock.ticker, days=days_to_fetch)
+        return await sync_to_async(self._store_backfill)(stock, missing, bars)
+
+    def _store_backfill(self, stock, missing: Set[date], bars: List[Dict]) -> int:
+        # An empty answer is indistinguishable from a provider failure, so it
+        # never confirms a gap.
+        if not bars:
+            return 0
+
+        stored = self.store_bars(stock, bars)
+
+        fetched_dates = {bar['date'] for bar in bars}
+        self._record_gaps(stock, [d for d in missing if d not in fetched_dates])
+        return stored
+
+    def _backfill_full(self, stock) -> int:
+        if Stock.objects.filter(pk=stock.pk, history_backfilled_at__isnull=False).exists():
+            return 0
+
+        bars = self.stock_service.get_price_history(stock.ticker, days=None)
+        if not bars:
+            return 0
+
+        stored = self.store_bars(stock, bars)
+        # update() rather than save() so the quote's updated_at is left alone.
+        Stock.objects.filter(pk=stock.pk).update(history_backfilled_at=timezone.now())
+        return stored
+
+    def _known_gaps(self, stock, dates: Set[date]) -> Set[date]:
+        return self._known_gaps_many({stock: dates}).get(stock.pk, set())
+
+    def _known_gaps_many(self, dates_by_stock: Dict) -> Dict[int, Set[date]]:
+        recent_cutoff = date.today() - timedelta(days=self.RECENT_GAP_DAYS)
+        stale_before = timezone.now() - timedelta(seconds=self.RECENT_GAP_TTL)
+
+        wanted = {stock.pk: dates for stock, dates in dates_by_stock.items()}
+        known = {}
+        gaps = PriceHistoryGap.objects.filter(
+            stock_id__in=list(wanted),
+            date__in=set().union(*wanted.values())
+        ).values_list('stock_id', 'date', 'checked_at')
+        for stock_id, gap_date, checked_at in gaps:
+            if gap_date not in wanted[stock_id]:
+                continue
+            if gap_date >= recent_cutoff and checked_at < stale_before:
+                continue
+            known.setdefault(stock_id, set()).add(gap_date)
+        return known
+
+    def _record_gaps(self, stock, dates: List[date]):
+        if not dates:
+            return
+
+        PriceHistoryGap.objects.bulk_create(
+            [PriceHistoryGap(stock=stock, date=d) for d in dates],
+            update_conflicts=True,
+            unique_fields=['stock', 'date'],
+            update_fields=['checked_at']
+        )
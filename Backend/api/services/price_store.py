@@ -0,0 +1,154 @@
+import os
+import tempfile
+import threading
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from django.conf import settings
+
+
+# File layout (little-endian, 8-byte words):
+#   [MAGIC][n][dates: int64 days since epoch x n][closes: float64 x n][volumes: int64 x n]
+# Each column is contiguous, so a range slice is two binary searches on the
+# date column and a view into the others.
+MAGIC = 0x31435850  # "PXC1"
+HEADER_WORDS = 2
+
+
+class PriceSeries:
+
+    def __init__(self, dates: np.ndarray, closes: np.ndarray, volumes: np.ndarray):
+        self.dates = dates
+        self.closes = closes
+        self.volumes = volumes
+
+    def __len__(self):
+        return len(self.dates)
+
+    @classmethod
+    def empty(cls) -> 'PriceSeries':
+        return cls(np.empty(0, dtype='M8[D]'), np.empty(0, dtype='<f8'), np.empty(0, dtype='<i8'))
+
+    def slice(self, start: Optional[date] = None, end: Optional[date] = None) -> 'PriceSeries':
+        lo = 0 if start is None else int(np.searchsorted(self.dates, np.datetime64(start, 'D'), side='left'))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, np.datetime64(end, 'D'), side='right'))
+        return PriceSeries(self.dates[lo:hi], self.closes[lo:hi], self.volumes[lo:hi])
+
+    def tail(self, count: int) -> 'PriceSeries':
+        return PriceSeries(self.dates[-count:], self.closes[-count:], self.volumes[-count:])
+
+    def returns(self, log: bool = False) -> np.ndarray:
+        if len(self.closes) < 2:
+            return np.empty(0)
+        if log:
+            return np.diff(np.log(self.closes))
+        return self.closes[1:] / self.closes[:-1] - 1.0
+
+    def rolling_mean(self, window: int) -> np.ndarray:
+        if window <= 0 or len(self.closes) < window:
+            return np.empty(0)
+        sums = np.cumsum(np.concatenate(([0.0], self.closes)))
+        return (sums[window:] - sums[:-window]) / window
+
+    def rolling_std(self, window: int) -> np.ndarray:
+        if window <= 0 or len(self.closes) < window:
+            return np.empty(0)
+        windows = np.lib.stride_tricks.sliding_window_view(self.closes, window)
+        return windows.std(axis=1)
+
+
+class PriceStore:
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or settings.PRICE_STORE_DIR)
+        self._lock = threading.Lock()
+        self._series: Dict[str, Tuple[Tuple[int, int], PriceSeries]] = {}
+
+    def path_for(self, ticker: str) -> Path:
+        return self.root / f'{ticker.upper()}.bin'
+
+    def load(self, ticker: str) -> Optional[PriceSeries]:
+        path = self.path_for(ticker)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._series.get(ticker)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        words = np.memmap(path, dtype='<i8', mode='r')
+        if len(words) < HEADER_WORDS or words[0] != MAGIC:
+            return None
+
+        n = int(words[1])
+        offset = HEADER_WORDS
+        series = PriceSeries(
+            words[offset:offset + n].view('M8[D]'),
+            words[offset + n:offset + 2 * n].view('<f8'),
+            words[offset + 2 * n:offset + 3 * n],
+        )
+        with self._lock:
+            self._series[ticker] = (version, series)
+        return series
+
+    def modified_at(self, ticker: str) -> Optional[datetime]:
+        try:
+            mtime = os.stat(self.path_for(ticker)).st_mtime
+        except FileNotFoundError:
+            return None
+        return datetime.fromtimestamp(mtime, tz=timezone.utc)
+
+    def write(self, ticker: str, rows: Iterable[Tuple[date, float, Optional[int]]]):
+        rows = sorted(rows, key=lambda row: row[0])
+        n = len(rows)
+
+        words = np.empty(HEADER_WORDS + 3 * n, dtype='<i8')
+        words[0] = MAGIC
+        words[1] = n
+        if n:
+            words[HEADER_WORDS:HEADER_WORDS + n] = np.array(
+                [row[0] for row in rows], dtype='M8[D]'
+            ).view('<i8')
+            words[HEADER_WORDS + n:HEADER_WORDS + 2 * n].view('<f8')[:] = [float(row[1]) for row in rows]
+            words[HEADER_WORDS + 2 * n:] = [row[2] or 0 for row in rows]
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(words.tobytes())
+            os.replace(tmp_path, self.path_for(ticker))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            self._series.pop(ticker, None)
+
+    def sync_from_db(self, stock):
+        from api.models import PriceHistory
+
+        rows = list(PriceHistory.objects.filter(stock=stock).order_by('date').values_list(
+            'date', 'price', 'volume'
+        ))
+        # Only stocks with bars get a file, so a read never leaves one behind.
+        if rows:
+            self.write(stock.ticker, rows)
+        else:
+            self.delete(stock.ticker)
+
+    def delete(self, ticker: str):
+        try:
+            os.unlink(self.path_for(ticker))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._series.pop(ticker, None)
+
+
+price_store = PriceStore()
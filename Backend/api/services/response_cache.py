@@ -0,0 +1,239 @@
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Dict, Iterable, List, Optional
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.response import Response
+from api.services.conditional_get import Validators, add_validators, is_conditional, not_modified, validators_for
+
+
+# Which cached endpoints each data change makes stale. Per-ticker endpoints
+# (stock-details) are additionally scoped to the tickers that changed.
+INVALIDATED_BY = {
+    'news.ingested': ['news', 'newsSearch', 'newsBuzz', 'sentimentMovers', 'stocks'],
+    'news.scored': ['news', 'newsSearch', 'sentimentMovers', 'stocks'],
+    'news.archived': ['news', 'newsSearch', 'newsArchive'],
+    'quote.updated': ['stocks', 'topMovers'],
+    'history.updated': [],
+}
+TICKER_SCOPED = ['stock-details']
+
+# Query params holding ticker lists; order and case do not change the result.
+TICKER_PARAMS = {'ticker', 'tickers', 'stocks'}
+
+
+class ResponseCache:
+    # Entries are never deleted one by one. Each endpoint (and each ticker of
+    # a ticker-scoped endpoint) has a generation number that is part of the
+    # key, and invalidation bumps it, orphaning every variant of the query
+    # string at once. Orphans simply expire.
+    #
+    # Generation counters live in the same cache as the payloads, so culling
+    # can drop one. A missing counter is therefore seeded from the clock
+    # rather than 0: the new value is always past any the dropped counter
+    # reached, and payloads keyed under the old numbers stay orphaned.
+
+    def __init__(self, alias: str = 'default'):
+        self.alias = alias
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {'hits': 0, 'misses': 0, 'invalidations': 0})
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def ttl(self, endpoint: str) -> int:
+        return settings.RESPONSE_CACHE_TTLS.get(endpoint, 0)
+
+    def key(self, endpoint: str, query_params, ticker: Optional[str] = None) -> str:
+        generation_keys = [self._generation_key(endpoint)]
+        if ticker:
+            generation_keys.append(self._generation_key(endpoint, ticker))
+        generations = self._generations(generation_keys)
+        parts = [str(generations[key]) for key in generation_keys]
+
+        return f"resp:{endpoint}:{ticker or '-'}:{':'.join(parts)}:{self._digest(query_params)}"
+
+    def get(self, key: str, endpoint: str):
+        data = self.cache.get(key)
+        with self._lock:
+            self._stats[endpoint]['hits' if data is not None else 'misses'] += 1
+        return data
+
+    def get_many(self, keys: Iterable[str], endpoint: str) -> Dict:
+        keys = list(keys)
+        found = self.cache.get_many(keys)
+        with self._lock:
+            self._stats[endpoint]['hits'] += len(found)
+            self._stats[endpoint]['misses'] += len(keys) - len(found)
+        return found
+
+    def stale_ttl(self, endpoint: str) -> int:
+        return settings.ADMISSION_LIMITS.get(endpoint, {}).get('stale', 0)
+
+    def set(self, key: str, endpoint: str, data, timeout: Optional[int] = None):
+        timeout = self.ttl(endpoint) if timeout is None else min(timeout, self.ttl(endpoint))
+        if timeout > 0:
+            self.cache.set(key, data, timeout)
+
+        # Endpoints that shed load also keep the last good payload per query,
+        # outside the generations, to serve when a request is turned away.
+        stale_timeout = self.stale_ttl(endpoint)
+        if stale_timeout > 0:
+            digest = key.rsplit(':', 1)[1]
+            self.cache.set(self._stale_key(endpoint, digest), data[0], stale_timeout)
+
+    def get_stale(self, endpoint: str, query_params):
+        if self.stale_ttl(endpoint) <= 0:
+            return None
+        return self.cache.get(self._stale_key(endpoint, self._digest(query_params)))
+
+    def invalidate(self, endpoint: str, tickers: Optional[Iterable[str]] = None):
+        if tickers is None:
+            keys = [self._generation_key(endpoint)]
+        else:
+            keys = [self._generation_key(endpoint, ticker) for ticker in set(tickers) if ticker]
+        for key in keys:
+            self._bump(key)
+        with self._lock:
+            self._stats[endpoint]['invalidations'] += len(keys)
+
+    def fire(self, event: str, tickers: Iterable[str] = ()):
+        tickers = {ticker.upper() for ticker in tickers if ticker}
+        for endpoint in INVALIDATED_BY[event]:
+            self.invalidate(endpoint)
+        if tickers:
+            for endpoint in TICKER_SCOPED:
+                self.invalidate(endpoint, tickers)
+
+    def stats(self) -> Dict[str, Dict]:
+        with self._lock:
+            stats = {endpoint: dict(counts) for endpoint, counts in self._stats.items()}
+        for counts in stats.values():
+            lookups = counts['hits'] + counts['misses']
+            counts['hitRate'] = round(counts['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def validators(self, endpoint: str, request, get_watermark) -> Optional[Validators]:
+        watermark = get_watermark(request)
+        if watermark is None:
+            return None
+        return validators_for(endpoint, self.normalize(request.query_params), watermark)
+
+    @staticmethod
+    def normalize(query_params) -> str:
+        parts = []
+        for name in sorted(query_params.keys()):
+            values = query_params.getlist(name) if hasattr(query_params, 'getlist') else [query_params[name]]
+            if name in TICKER_PARAMS:
+                tickers = {t.strip().upper() for value in values for t in value.split(',') if t.strip()}
+                values = [','.join(sorted(tickers))]
+            else:
+                values = sorted(value.strip() for value in values)
+            parts.append(f"{name}={'|'.join(values)}")
+        return '&'.join(parts)
+
+    def _digest(self, query_params) -> str:
+        return hashlib.sha1(self.normalize(query_params).encode()).hexdigest()
+
+    def _stale_key(self, endpoint: str, digest: str) -> str:
+        return f'resp-stale:{endpoint}:{digest}'
+
+    def _generation_key(self, endpoint: str, ticker: Optional[str] = None) -> str:
+        return f"resp-gen:{endpoint}:{ticker.upper() if ticker else '*'}"
+
+    def _generations(self, keys: List[str]) -> Dict[str, int]:
+        generations = self.cache.get_many(keys)
+        for key in keys:
+            if key not in generations:
+                # add() keeps whichever seed another worker stored first.
+                seed = time.time_ns()
+                generations[key] = seed if self.cache.add(key, seed, None) else self.cache.get(key, seed)
+        return generations
+
+    def _bump(self, key: str):
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            self.cache.add(key, time.time_ns(), None)
+
+
+response_cache = ResponseCache()
+
+
+def cached_response(endpoint: str):
+    # Views that define get_watermark(request) also answer conditional GETs.
+    # The validators are cached next to the payload, so a warm revalidation
+    # costs no queries; a cold one costs the watermark query only. A None
+    # watermark means the view has work to do (e.g. a backfill) and must run.
+    # Async views get the same behaviour, with the lookups run off the loop.
+    def lookup(self, request):
+        get_watermark = getattr(self, 'get_watermark', None)
+
+        key = response_cache.key(endpoint, request.query_params)
+        entry = response_cache.get(key, endpoint)
+        if entry is not None:
+            data, validators = entry
+            return key, not_modified(request, validators) or add_validators(
+                Response(data, status=status.HTTP_200_OK), validators
+            )
+
+        if get_watermark and is_conditional(request):
+            response = not_modified(request, response_cache.validators(endpoint, request, get_watermark))
+            if response is not None:
+                return key, response
+        return key, None
+
+    def store(self, request, key, response):
+        get_watermark = getattr(self, 'get_watermark', None)
+        # A Retry-After means the payload is partial and about to change.
+        if response.status_code == status.HTTP_200_OK and not response.has_header('Retry-After'):
+            validators = response_cache.validators(endpoint, request, get_watermark) if get_watermark else None
+            response_cache.set(key, endpoint, (response.data, validators))
+            add_validators(response, validators)
+        return response
+
+    def decorator(view_method):
+        if iscoroutinefunction(view_method):
+            @wraps(view_method)
+            async def async_wrapper(self, request, *args, **kwargs):
+                key, response = await sync_to_async(lookup)(self, request)
+                if response is not None:
+                    return response
+                response = await view_method(self, request, *args, **kwargs)
+                return await sync_to_async(store)(self, request, key, response)
+            return async_wrapper
+
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            key, response = lookup(self, request)
+            if response is not None:
+                return response
+            return store(self, request, key, view_method(self, request, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def news_ingested(tickers: Iterable[str]):
+    response_cache.fire('news.ingested', tickers)
+
+
+def news_scored(tickers: Iterable[str]):
+    response_cache.fire('news.scored', tickers)
+
+
+def news_archived(tickers: Iterable[str]):
+    response_cache.fire('news.archived', tickers)
+
+
+def quote_updated(tickers: Iterable[str]):
+    response_cache.fire('quote.updated', tickers)
+
+
+def history_updated(tickers: Iterable[str]):
+    response_cache.fire('history.updated', tickers)
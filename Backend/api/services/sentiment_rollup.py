@@ -0,0 +1,88 @@
+from datetime import date
+from typing import Iterable, Optional, Set, Tuple
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from api.models import News, NewsSentimentHistory, Stock
+
+
+class SentimentRollupService:
+
+    REFRESH_BATCH_SIZE = 500
+
+    def day_key(self, ticker: str, when) -> Tuple[str, date]:
+        if hasattr(when, 'hour'):
+            if timezone.is_naive(when):
+                when = timezone.make_aware(when)
+            when = timezone.localdate(when)
+        return ticker, when
+
+    def keys_for(self, news_items: Iterable) -> Set[Tuple[str, date]]:
+        return {self.day_key(news.ticker, news.date) for news in news_items}
+
+    def refresh(self, keys: Iterable[Tuple[str, date]]) -> int:
+        keys = list(set(keys))
+        refreshed = 0
+        for i in range(0, len(keys), self.REFRESH_BATCH_SIZE):
+            refreshed += self._refresh_batch(keys[i:i + self.REFRESH_BATCH_SIZE])
+        return refreshed
+
+    def rebuild(self, ticker: Optional[str] = None, since: Optional[date] = None) -> int:
+        queryset = News.objects.all()
+        if ticker:
+            queryset = queryset.filter(ticker=ticker)
+        if since:
+            queryset = queryset.filter(date__date__gte=since)
+
+        keys = queryset.annotate(day=TruncDate('date')).values_list('ticker', 'day').distinct()
+        return self.refresh(keys)
+
+    def _refresh_batch(self, keys) -> int:
+        tickers = {ticker for ticker, _ in keys}
+        days = {day for _, day in keys}
+
+        counts = {
+            (row['ticker'], row['day']): row
+            for row in News.objects.filter(
+                ticker__in=tickers,
+                date__date__in=days
+            ).annotate(
+                day=TruncDate('date')
+            ).values('ticker', 'day').annotate(
+                total=Count('id'),
+                bullish=Count('id', filter=Q(sentiment_analyzed=True, sentiment='Bullish')),
+                bearish=Count('id', filter=Q(sentiment_analyzed=True, sentiment='Bearish')),
+                neutral=Count('id', filter=Q(sentiment_analyzed=True, sentiment='Neutral')),
+            ).order_by()
+        }
+
+        # Rollups are kept for tracked stocks only. News may hold any ticker a
+        # client asked /news for; a Stock created later gets its rollups from
+        # api.signals.
+        stock_ids = dict(Stock.objects.filter(ticker__in=tickers).values_list('ticker', 'id'))
+        empty = {'total': 0, 'bullish': 0, 'bearish': 0, 'neutral': 0}
+
+        rows = []
+        for ticker, day in keys:
+            if ticker not in stock_ids:
+                continue
+            row = counts.get((ticker, day), empty)
+            rows.append(NewsSentimentHistory(
+                stock_id=stock_ids[ticker],
+                date=day,
+                bullish_count=row['bullish'],
+                bearish_count=row['bearish'],
+                neutral_count=row['neutral'],
+                total_news=row['total']
+            ))
+
+        if not rows:
+            return 0
+
+        NewsSentimentHistory.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['stock', 'date'],
+            update_fields=['bullish_count', 'bearish_count', 'neutral_count', 'total_news']
+        )
+        return len(rows)
@@ -0,0 +1,106 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from api.models import News, Stock
+
+
+SENTIMENT_VALUES = {'Bullish': 1.0, 'Bearish': -1.0, 'Neutral': 0.0}
+
+# (ticker, article date, sentiment, +1 to add the article / -1 to remove it)
+Contribution = Tuple[str, datetime, Optional[str], int]
+
+
+class SentimentScoreService:
+    # Stock.sentiment_score is 100 * sum(v_i * w_i) / sum(w_i), with v_i the
+    # article's sentiment (+1/0/-1) and w_i = 2 ** (-age_i / half_life).
+    # Decaying every weight by the same factor leaves the ratio unchanged, so
+    # the stored sums only need rescaling to "now" when a new article lands.
+
+    MIN_WEIGHT = 1e-12
+    SCORE_FIELDS = ['sentiment_score', 'sentiment_weighted_sum', 'sentiment_weight_total', 'sentiment_decayed_at']
+
+    def __init__(self, half_life_hours: Optional[float] = None):
+        self.half_life_seconds = (half_life_hours or settings.SENTIMENT_HALF_LIFE_HOURS) * 3600
+
+    def weight(self, article_date: datetime, now: datetime) -> float:
+        if timezone.is_naive(article_date):
+            article_date = timezone.make_aware(article_date)
+        age = max((now - article_date).total_seconds(), 0.0)
+        return 2.0 ** (-age / self.half_life_seconds)
+
+    def apply(self, contributions: Iterable[Contribution]) -> int:
+        now = timezone.now()
+
+        deltas = defaultdict(lambda: [0.0, 0.0])
+        for ticker, article_date, sentiment, sign in contributions:
+            if sentiment not in SENTIMENT_VALUES:
+                continue
+            w = self.weight(article_date, now) * sign
+            deltas[ticker][0] += SENTIMENT_VALUES[sentiment] * w
+            deltas[ticker][1] += w
+        if not deltas:
+            return 0
+
+        with transaction.atomic():
+            stocks = list(Stock.objects.select_for_update().filter(ticker__in=list(deltas)))
+            for stock in stocks:
+                factor = self._decay_factor(stock.sentiment_decayed_at, now)
+                weighted_delta, weight_delta = deltas[stock.ticker]
+                self._set_score(
+                    stock,
+                    stock.sentiment_weighted_sum * factor + weighted_delta,
+                    stock.sentiment_weight_total * factor + weight_delta,
+                    now
+                )
+            # bulk_update leaves updated_at alone, which the quote cache relies on.
+            Stock.objects.bulk_update(stocks, self.SCORE_FIELDS)
+        return len(stocks)
+
+    def rebuild(self, ticker: Optional[str] = None) -> int:
+        now = timezone.now()
+
+        articles = News.objects.filter(sentiment_analyzed=True, sentiment__in=list(SENTIMENT_VALUES))
+        if ticker:
+            articles = articles.filter(ticker=ticker)
+
+        sums = defaultdict(lambda: [0.0, 0.0])
+        for article_ticker, article_date, sentiment in articles.values_list(
+            'ticker', 'date', 'sentiment'
+        ).order_by().iterator(chunk_size=2000):
+            w = self.weight(article_date, now)
+            sums[article_ticker][0] += SENTIMENT_VALUES[sentiment] * w
+            sums[article_ticker][1] += w
+
+        stocks = Stock.objects.all()
+        if ticker:
+            stocks = stocks.filter(ticker=ticker)
+        stocks = list(stocks)
+        for stock in stocks:
+            weighted_sum, weight_total = sums.get(stock.ticker, (0.0, 0.0))
+            self._set_score(stock, weighted_sum, weight_total, now)
+
+        Stock.objects.bulk_update(stocks, self.SCORE_FIELDS, batch_size=500)
+        return len(stocks)
+
+    def _decay_factor(self, decayed_at: Optional[datetime], now: datetime) -> float:
+        if decayed_at is None:
+            return 1.0
+        elapsed = max((now - decayed_at).total_seconds(), 0.0)
+        return 2.0 ** (-elapsed / self.half_life_seconds)
+
+    def _set_score(self, stock, weighted_sum: float, weight_total: float, now: datetime):
+        if weight_total < self.MIN_WEIGHT:
+            weighted_sum = 0.0
+            weight_total = 0.0
+            score = None
+        else:
+            ratio = max(-1.0, min(1.0, weighted_sum / weight_total))
+            score = int(round(ratio * 100))
+
+        stock.sentiment_weighted_sum = weighted_sum
+        stock.sentiment_weight_total = weight_total
+        stock.sentiment_decayed_at = now
+        stock.sentiment_score = score
@@ -1,5 +1,12 @@
+import asyncio
 import os
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+
+# Model inference is CPU-bound and torch already uses every core, so async
+# views queue it on one dedicated thread rather than the event loop.
+inference_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sentiment')
 
 
 class SentimentService:
@@ -11,7 +18,9 @@ class SentimentService:
         if self.use_finbert:
             try:
                 from api.ai_model import predict_sentiment as finbert_predict
+                from api.ai_model import predict_sentiments as finbert_predict_many
                 self._finbert_predict = finbert_predict
+                self._finbert_predict_many = finbert_predict_many
                 self.finbert_available = True
             except Exception as e:
                 print(f"FinBERT model not available: {str(e)}")
@@ -30,4 +39,19 @@ class SentimentService:
         except Exception as e:
             print(f"Error analyzing sentiment: {str(e)}")
             return {'sentiment': 'Neutral'}
-
+    
+    def analyze_sentiments(self, texts: List[str]) -> List[Dict[str, str]]:
+        if not texts or not self.finbert_available:
+            return [{'sentiment': 'Neutral'} for _ in texts]
+        
+        try:
+            return [{'sentiment': sentiment} for sentiment in self._finbert_predict_many(texts)]
+        except Exception as e:
+            print(f"Error analyzing sentiments: {str(e)}")
+            return [{'sentiment': 'Neutral'} for _ in texts]
+    
+    async def aanalyze_sentiment(self, text: str) -> Dict[str, str]:
+        return await asyncio.get_running_loop().run_in_executor(inference_executor, self.analyze_sentiment, text)
+    
+    async def aanalyze_sentiments(self, texts: List[str]) -> List[Dict[str, str]]:
+        return await asyncio.get_running_loop().run_in_executor(inference_executor, self.analyze_sentiments, texts)
@@ -0,0 +1,223 @@
+import asyncio
+import threading
+import time
+import uuid
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+
+class _Call:
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.waiters = []
+
+
+class SingleFlight:
+    # One caller per (ticker, resource) key performs the fetch. Callers in the
+    # same process, sync or async and on any event loop, wait for its result;
+    # callers in other processes see the FetchLease row and wait for it to be
+    # released. Waiters give up after wait_timeout and get None back, meaning
+    # "use whatever is in the DB".
+
+    def __init__(self, wait_timeout: float = 10.0, lease_duration: float = 30.0,
+                 poll_interval: float = 0.2):
+        self.wait_timeout = wait_timeout
+        self.lease_duration = lease_duration
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, ticker: str, resource: str, fn: Callable[[], Any]) -> Optional[Any]:
+        key = f'{ticker}:{resource}'
+
+        call, is_leader = self._join(key)
+        if not is_leader:
+            call.done.wait(self.wait_timeout)
+            return call.result
+
+        try:
+            owner = self._acquire_lease(key)
+            if owner is None:
+                self._wait_for_lease(key)
+                return None
+
+            try:
+                call.result = fn()
+            finally:
+                self._release_lease(key, owner)
+            return call.result
+        finally:
+            self._finish(key, call)
+
+    async def ado(self, ticker: str, resource: str, fn: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        # do() for coroutines, sharing its flights: under WSGI every request
+        # runs its own event loop, so waiters are woken on whichever loop they
+        # are awaiting from instead of blocking a thread.
+        key = f'{ticker}:{resource}'
+
+        call, is_leader = self._join(key)
+        if not is_leader:
+            return await self._await_call(call)
+
+        try:
+            owner = await sync_to_async(self._acquire_lease)(key)
+            if owner is None:
+                await self._await_lease(key)
+                return None
+
+            try:
+                call.result = await fn()
+            finally:
+                await sync_to_async(self._release_lease)(key, owner)
+            return call.result
+        finally:
+            self._finish(key, call)
+
+    async def ado_many(self, tickers: List[str], resource: str,
+                       fn: Callable[[List[str]], Awaitable[Dict[str, Any]]]) -> Dict[str, Optional[Any]]:
+        # ado() for several tickers under the same per-ticker keys, so batches
+        # and single-ticker callers coalesce. fn is called once with the
+        # tickers this caller leads and holds the lease for, and returns a
+        # result per ticker; the other tickers are waited for as in ado().
+        keys = {ticker: f'{ticker}:{resource}' for ticker in tickers}
+        calls = {}
+        led = []
+        for ticker, key in keys.items():
+            calls[ticker], is_leader = self._join(key)
+            if is_leader:
+                led.append(ticker)
+
+        results = {}
+        try:
+            owners = await sync_to_async(self._acquire_leases)([keys[ticker] for ticker in led])
+            leading = [ticker for ticker in led if keys[ticker] in owners]
+            if leading:
+                try:
+                    fetched = await fn(leading)
+                finally:
+                    await sync_to_async(self._release_leases)(owners)
+                for ticker in leading:
+                    calls[ticker].result = results[ticker] = fetched.get(ticker)
+
+            waiting = [ticker for ticker in tickers if ticker not in leading]
+            waited = await asyncio.gather(*[
+                self._await_lease(keys[ticker]) if ticker in led else self._await_call(calls[ticker])
+                for ticker in waiting
+            ])
+            results.update(zip(waiting, waited))
+            return {ticker: results[ticker] for ticker in tickers}
+        finally:
+            for ticker in led:
+                self._finish(keys[ticker], calls[ticker])
+
+    def _join(self, key: str) -> Tuple[_Call, bool]:
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                return call, False
+            call = self._calls[key] = _Call()
+            return call, True
+
+    def _finish(self, key: str, call: _Call):
+        with self._lock:
+            self._calls.pop(key, None)
+            call.done.set()
+            waiters, call.waiters = call.waiters, []
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(self._resolve, future, call.result)
+            except RuntimeError:
+                # The waiter's loop is closed: it timed out and its request
+                # has finished.
+                pass
+
+    async def _await_call(self, call: _Call) -> Optional[Any]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if call.done.is_set():
+                return call.result
+            call.waiters.append((loop, future))
+
+        try:
+            return await asyncio.wait_for(future, self.wait_timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any):
+        if not future.done():
+            future.set_result(result)
+
+    def _acquire_lease(self, key: str) -> Optional[str]:
+        from api.models import FetchLease
+
+        owner = uuid.uuid4().hex
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=self.lease_duration)
+
+        taken_over = FetchLease.objects.filter(
+            key=key,
+            expires_at__lt=now
+        ).update(owner=owner, expires_at=expires_at)
+        if taken_over:
+            return owner
+
+        try:
+            with transaction.atomic():
+                FetchLease.objects.create(key=key, owner=owner, expires_at=expires_at)
+            return owner
+        except IntegrityError:
+            return None
+
+    def _release_lease(self, key: str, owner: str):
+        from api.models import FetchLease
+
+        FetchLease.objects.filter(key=key, owner=owner).delete()
+
+    def _acquire_leases(self, keys: List[str]) -> Dict[str, str]:
+        owners = {}
+        for key in keys:
+            owner = self._acquire_lease(key)
+            if owner is not None:
+                owners[key] = owner
+        return owners
+
+    def _release_leases(self, owners: Dict[str, str]):
+        for key, owner in owners.items():
+            self._release_lease(key, owner)
+
+    def _wait_for_lease(self, key: str):
+        from api.models import FetchLease
+
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            held = FetchLease.objects.filter(
+                key=key,
+                expires_at__gte=timezone.now()
+            ).exists()
+            if not held:
+                return
+            time.sleep(self.poll_interval)
+
+    async def _await_lease(self, key: str):
+        from api.models import FetchLease
+
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            held = await FetchLease.objects.filter(
+                key=key,
+                expires_at__gte=timezone.now()
+            ).aexists()
+            if not held:
+                return
+            await asyncio.sleep(self.poll_interval)
+
+
+single_flight = SingleFlight()
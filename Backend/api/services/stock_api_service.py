@@ -1,20 +1,29 @@
+import asyncio
 import os
-import time
+import httpx
 import requests
 from decimal import Decimal
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.utils import timezone
+from api.services.event_stream import stock_quotes_updated
+from api.services.response_cache import quote_updated
+from api.services.single_flight import single_flight
 
 
 class StockAPIService:
     
+    YAHOO_SPARK_BATCH_SIZE = 20
+    QUOTE_CACHE_DURATION = timedelta(hours=1)
+    
     def __init__(self):
         self.alpha_vantage_key = os.getenv('ALPHA_VANTAGE_API_KEY', 'demo')
         self.alpha_vantage_base_url = 'https://www.alphavantage.co/query'
         
         self.yahoo_finance_base_url = 'https://query1.finance.yahoo.com/v8/finance/chart'
+        self.yahoo_finance_spark_url = 'https://query1.finance.yahoo.com/v7/finance/spark'
     
     def get_stock_quote(self, ticker: str) -> Optional[Dict]:
         try:
@@ -25,18 +34,49 @@ class StockAPIService:
         except Exception as e:
             raise
     
+    async def aget_stock_quote(self, ticker: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Dict]:
+        if self.alpha_vantage_key != 'demo':
+            data = await self._aget_json(self.alpha_vantage_base_url, self._alpha_vantage_quote_params(ticker), client)
+            return self._parse_alpha_vantage_quote(ticker, data)
+        
+        data = await self._aget_json(f"{self.yahoo_finance_base_url}/{ticker}", {'interval': '1d', 'range': '1d'}, client)
+        return self._parse_yahoo_finance_quote(ticker, data)
+    
+    async def _aget_json(self, url: str, params: Dict, client: Optional[httpx.AsyncClient] = None) -> Dict:
+        try:
+            if client is None:
+                async with httpx.AsyncClient(timeout=10) as client:
+                    response = await client.get(url, params=params)
+            else:
+                response = await client.get(url, params=params)
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPError as e:
+            raise Exception(f"Network error: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"Data parsing error: {str(e)}")
+    
     def _get_alpha_vantage_quote(self, ticker: str) -> Optional[Dict]:
-        params = {
+        try:
+            response = requests.get(self.alpha_vantage_base_url, params=self._alpha_vantage_quote_params(ticker), timeout=10)
+            response.raise_for_status()
+            data = response.json()
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Network error: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"Data parsing error: {str(e)}")
+        
+        return self._parse_alpha_vantage_quote(ticker, data)
+    
+    def _alpha_vantage_quote_params(self, ticker: str) -> Dict:
+        return {
             'function': 'GLOBAL_QUOTE',
             'symbol': ticker,
             'apikey': self.alpha_vantage_key
         }
-        
+    
+    def _parse_alpha_vantage_quote(self, ticker: str, data: Dict) -> Optional[Dict]:
         try:
-            response = requests.get(self.alpha_vantage_base_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
             if 'Error Message' in data:
                 raise Exception(f"Alpha Vantage API error: {data['Error Message']}")
             if 'Note' in data:
@@ -59,8 +99,6 @@ class StockAPIService:
                 }
             else:
                 raise Exception("No quote data in response")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Network error: {str(e)}")
         except (KeyError, ValueError, TypeError) as e:
             raise Exception(f"Data parsing error: {str(e)}")
     
@@ -75,7 +113,15 @@ class StockAPIService:
             response = requests.get(url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
-            
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Network error: {str(e)}")
+        except ValueError as e:
+            raise Exception(f"Data parsing error: {str(e)}")
+        
+        return self._parse_yahoo_finance_quote(ticker, data)
+    
+    def _parse_yahoo_finance_quote(self, ticker: str, data: Dict) -> Optional[Dict]:
+        try:
             if 'chart' in data and 'result' in data['chart'] and len(data['chart']['result']) > 0:
                 result = data['chart']['result'][0]
                 
@@ -88,27 +134,70 @@ class StockAPIService:
                 if not meta.get('regularMarketPrice'):
                     raise Exception("No price data available")
                 
-                current_price = Decimal(str(meta.get('regularMarketPrice', 0)))
-                previous_close = Decimal(str(meta.get('previousClose', current_price)))
-                change = current_price - previous_close
-                change_percent = (change / previous_close * 100) if previous_close > 0 else Decimal(0)
-                
-                return {
-                    'ticker': ticker,
-                    'current_price': current_price,
-                    'change': change,
-                    'change_percent': change_percent,
-                    'volume': meta.get('regularMarketVolume', 0),
-                    'market_cap': meta.get('marketCap', None)
-                }
+                return self._quote_from_yahoo_meta(ticker, meta)
             else:
                 raise Exception("No chart data in response")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Network error: {str(e)}")
         except (KeyError, ValueError, TypeError) as e:
             raise Exception(f"Data parsing error: {str(e)}")
     
-    def get_price_history(self, ticker: str, days: int = 30) -> List[Dict]:
+    async def aget_stock_quotes(self, tickers: List[str]) -> Dict[str, Dict]:
+        # Alpha Vantage has no multi-symbol quote on the free tier, so it gets a
+        # call per ticker; Yahoo gets one per spark batch. All run concurrently.
+        async with httpx.AsyncClient(timeout=10) as client:
+            if self.alpha_vantage_key != 'demo':
+                calls = [self.aget_stock_quote(ticker, client) for ticker in tickers]
+                labels = tickers
+            else:
+                chunks = [tickers[i:i + self.YAHOO_SPARK_BATCH_SIZE] for i in range(0, len(tickers), self.YAHOO_SPARK_BATCH_SIZE)]
+                calls = [
+                    self._aget_json(self.yahoo_finance_spark_url, self._yahoo_spark_params(chunk), client)
+                    for chunk in chunks
+                ]
+                labels = [', '.join(chunk) for chunk in chunks]
+            results = await asyncio.gather(*calls, return_exceptions=True)
+        
+        quotes = {}
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                print(f"Error fetching quotes for {label}: {str(result)}")
+            elif self.alpha_vantage_key != 'demo':
+                quotes[label] = result
+            else:
+                quotes.update(self._parse_yahoo_finance_quotes(result))
+        return quotes
+    
+    def _yahoo_spark_params(self, tickers: List[str]) -> Dict:
+        return {
+            'symbols': ','.join(tickers),
+            'interval': '1d',
+            'range': '1d'
+        }
+    
+    def _parse_yahoo_finance_quotes(self, data: Dict) -> Dict[str, Dict]:
+        quotes = {}
+        for result in (data.get('spark') or {}).get('result') or []:
+            ticker = result.get('symbol')
+            meta = (result.get('response') or [{}])[0].get('meta', {})
+            if ticker and meta.get('regularMarketPrice'):
+                quotes[ticker] = self._quote_from_yahoo_meta(ticker, meta)
+        return quotes
+    
+    def _quote_from_yahoo_meta(self, ticker: str, meta: Dict) -> Dict:
+        current_price = Decimal(str(meta.get('regularMarketPrice', 0)))
+        previous_close = Decimal(str(meta.get('previousClose') or meta.get('chartPreviousClose') or current_price))
+        change = current_price - previous_close
+        change_percent = (change / previous_close * 100) if previous_close > 0 else Decimal(0)
+        
+        return {
+            'ticker': ticker,
+            'current_price': current_price,
+            'change': change,
+            'change_percent': change_percent,
+            'volume': meta.get('regularMarketVolume', 0),
+            'market_cap': meta.get('marketCap', None)
+        }
+    
+    def get_price_history(self, ticker: str, days: Optional[int] = 30) -> List[Dict]:
         try:
             if self.alpha_vantage_key != 'demo':
                 return self._get_alpha_vantage_history(ticker, days)
@@ -118,26 +207,40 @@ class StockAPIService:
             print(f"Error fetching price history for {ticker}: {str(e)}")
             return []
     
-    def _get_alpha_vantage_history(self, ticker: str, days: int) -> List[Dict]:
-        params = {
+    async def aget_price_history(self, ticker: str, days: Optional[int] = 30) -> List[Dict]:
+        try:
+            if self.alpha_vantage_key != 'demo':
+                data = await self._aget_json(self.alpha_vantage_base_url, self._alpha_vantage_history_params(ticker, days))
+                return self._parse_alpha_vantage_history(data, days)
+            else:
+                data = await self._aget_json(f"{self.yahoo_finance_base_url}/{ticker}", self._yahoo_history_params(days))
+                return self._parse_yahoo_finance_history(data)
+        except Exception as e:
+            print(f"Error fetching price history for {ticker}: {str(e)}")
+            return []
+    
+    def _get_alpha_vantage_history(self, ticker: str, days: Optional[int]) -> List[Dict]:
+        response = requests.get(self.alpha_vantage_base_url, params=self._alpha_vantage_history_params(ticker, days), timeout=10)
+        return self._parse_alpha_vantage_history(response.json(), days)
+    
+    def _alpha_vantage_history_params(self, ticker: str, days: Optional[int]) -> Dict:
+        return {
             'function': 'TIME_SERIES_DAILY',
             'symbol': ticker,
             'apikey': self.alpha_vantage_key,
-            'outputsize': 'compact' if days <= 100 else 'full'
+            'outputsize': 'compact' if days is not None and days <= 100 else 'full'
         }
-        
-        response = requests.get(self.alpha_vantage_base_url, params=params, timeout=10)
-        data = response.json()
-        
+    
+    def _parse_alpha_vantage_history(self, data: Dict, days: Optional[int]) -> List[Dict]:
         history = []
         if 'Time Series (Daily)' in data:
             time_series = data['Time Series (Daily)']
             end_date = datetime.now().date()
-            start_date = end_date - timedelta(days=days)
+            start_date = end_date - timedelta(days=days) if days is not None else None
             
             for date_str, values in time_series.items():
                 date = datetime.strptime(date_str, '%Y-%m-%d').date()
-                if date >= start_date:
+                if start_date is None or date >= start_date:
                     history.append({
                         'date': date,
                         'price': Decimal(values['4. close']),
@@ -147,16 +250,18 @@ class StockAPIService:
             history.sort(key=lambda x: x['date'])
         return history
     
-    def _get_yahoo_finance_history(self, ticker: str, days: int) -> List[Dict]:
+    def _get_yahoo_finance_history(self, ticker: str, days: Optional[int]) -> List[Dict]:
         url = f"{self.yahoo_finance_base_url}/{ticker}"
-        params = {
+        response = requests.get(url, params=self._yahoo_history_params(days), timeout=10)
+        return self._parse_yahoo_finance_history(response.json())
+    
+    def _yahoo_history_params(self, days: Optional[int]) -> Dict:
+        return {
             'interval': '1d',
-            'range': f'{days}d'
+            'range': f'{days}d' if days is not None else 'max'
         }
-        
-        response = requests.get(url, params=params, timeout=10)
-        data = response.json()
-        
+    
+    def _parse_yahoo_finance_history(self, data: Dict) -> List[Dict]:
         history = []
         if 'chart' in data and 'result' in data['chart'] and len(data['chart']['result']) > 0:
             result = data['chart']['result'][0]
@@ -175,7 +280,56 @@ class StockAPIService:
         
         return history
     
-    def get_top_movers(self, limit: int = 10) -> List[Dict]:
+    async def aget_top_movers(self, limit: int = 10) -> List[Dict]:
+        from api.models import Stock
+        
+        db_stock_dict, movers, stocks_to_update = await sync_to_async(self._top_mover_candidates)(limit)
+        
+        # Quotes are fetched in groups of max_concurrent, each group
+        # concurrently, with a pause between groups for the provider's rate
+        # limit. The pauses do not hold a worker thread.
+        max_concurrent = 5
+        delay_between_batches = 12
+        
+        async with httpx.AsyncClient(timeout=10) as client:
+            for i in range(0, len(stocks_to_update), max_concurrent):
+                if i:
+                    await asyncio.sleep(delay_between_batches)
+                
+                group = stocks_to_update[i:i + max_concurrent]
+                quotes = await asyncio.gather(*[
+                    single_flight.ado(ticker, 'quote', lambda ticker=ticker: self._afetch_and_store_quote(ticker, client))
+                    for ticker in group
+                ], return_exceptions=True)
+                
+                for ticker, quote in zip(group, quotes):
+                    if isinstance(quote, Exception):
+                        stock = db_stock_dict.get(ticker)
+                        if stock and stock.current_price and stock.change_in_day is not None:
+                            movers.append({
+                                'ticker': ticker,
+                                'change': stock.change_in_day,
+                                'current_price': stock.current_price
+                            })
+                    elif quote and quote.get('current_price') and quote['current_price'] > 0:
+                        movers.append({
+                            'ticker': ticker,
+                            'change': quote['change'],
+                            'current_price': quote['current_price']
+                        })
+                    elif quote is None:
+                        stock = await Stock.objects.filter(ticker=ticker).afirst()
+                        if stock and stock.current_price and stock.change_in_day is not None:
+                            movers.append({
+                                'ticker': ticker,
+                                'change': (stock.change_in_day / 100) * stock.current_price,
+                                'current_price': stock.current_price
+                            })
+        
+        movers.sort(key=lambda x: abs(x['change']), reverse=True)
+        return movers[:limit]
+    
+    def _top_mover_candidates(self, limit: int):
         from api.models import Stock
         
         popular_tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'TSLA', 'NVDA', 'AMD', 
@@ -186,7 +340,6 @@ class StockAPIService:
         tickers_to_check = popular_tickers[:limit * 3] if limit * 3 <= len(popular_tickers) else popular_tickers
         
         now = timezone.now()
-        cache_duration = timedelta(hours=1)
         
         db_stocks = Stock.objects.filter(ticker__in=tickers_to_check)
         db_stock_dict = {stock.ticker: stock for stock in db_stocks}
@@ -197,62 +350,52 @@ class StockAPIService:
         for ticker in tickers_to_check:
             stock = db_stock_dict.get(ticker)
             
-            if stock and stock.current_price and stock.change_in_day is not None:
-                if stock.updated_at:
-                    time_since_update = now - stock.updated_at
-                    if time_since_update < cache_duration:
-                        absolute_change = (stock.change_in_day / 100) * stock.current_price
-                        movers.append({
-                            'ticker': ticker,
-                            'change': absolute_change,
-                            'current_price': stock.current_price
-                        })
-                        continue
+            if stock and self._has_fresh_quote(stock, now):
+                absolute_change = (stock.change_in_day / 100) * stock.current_price
+                movers.append({
+                    'ticker': ticker,
+                    'change': absolute_change,
+                    'current_price': stock.current_price
+                })
+                continue
             
             stocks_to_update.append(ticker)
         
-        if stocks_to_update:
-            max_concurrent = 5
-            delay_between_batches = 12
-            
-            for i, ticker in enumerate(stocks_to_update):
-                try:
-                    quote = self.get_stock_quote(ticker)
-                    
-                    if quote and quote.get('current_price') and quote['current_price'] > 0:
-                        stock, created = Stock.objects.get_or_create(
-                            ticker=ticker,
-                            defaults={'company_full_name': f'{ticker} Corporation'}
-                        )
-                        stock.current_price = quote['current_price']
-                        stock.change_in_day = quote['change_percent']
-                        if quote.get('volume'):
-                            stock.volume = quote['volume']
-                        if quote.get('market_cap'):
-                            stock.market_cap = quote['market_cap']
-                        stock.save()
-                        
-                        movers.append({
-                            'ticker': ticker,
-                            'change': quote['change'],
-                            'current_price': quote['current_price']
-                        })
-                    
-                    if (i + 1) % max_concurrent == 0 and i < len(stocks_to_update) - 1:
-                        time.sleep(delay_between_batches)
-                    elif i < len(stocks_to_update) - 1:
-                        time.sleep(0.5)
-                        
-                except Exception as e:
-                    stock = db_stock_dict.get(ticker)
-                    if stock and stock.current_price and stock.change_in_day is not None:
-                        movers.append({
-                            'ticker': ticker,
-                            'change': stock.change_in_day,
-                            'current_price': stock.current_price
-                        })
-                    continue
+        return db_stock_dict, movers, stocks_to_update
+    
+    def _has_fresh_quote(self, stock, now) -> bool:
+        if not stock.current_price or stock.change_in_day is None or not stock.updated_at:
+            return False
+        return now - stock.updated_at < self.QUOTE_CACHE_DURATION
+    
+    async def _afetch_and_store_quote(self, ticker: str, client: Optional[httpx.AsyncClient] = None) -> Optional[Dict]:
+        from api.models import Stock
         
-        movers.sort(key=lambda x: abs(x['change']), reverse=True)
-        return movers[:limit]
-
+        # The flight's leader re-reads the row: another process may have
+        # refreshed the quote since the candidates were read. None means
+        # "use the stored quote".
+        stock = await Stock.objects.filter(ticker=ticker).afirst()
+        if stock and self._has_fresh_quote(stock, timezone.now()):
+            return None
+        
+        quote = await self.aget_stock_quote(ticker, client)
+        await sync_to_async(self._store_quote)(ticker, quote)
+        return quote
+    
+    def _store_quote(self, ticker: str, quote: Optional[Dict]):
+        from api.models import Stock
+        
+        if quote and quote.get('current_price') and quote['current_price'] > 0:
+            stock, created = Stock.objects.get_or_create(
+                ticker=ticker,
+                defaults={'company_full_name': f'{ticker} Corporation'}
+            )
+            stock.current_price = quote['current_price']
+            stock.change_in_day = quote['change_percent']
+            if quote.get('volume'):
+                stock.volume = quote['volume']
+            if quote.get('market_cap'):
+                stock.market_cap = quote['market_cap']
+            stock.save(update_fields=['current_price', 'change_in_day', 'market_cap', 'volume', 'updated_at'])
+            quote_updated([ticker])
+            stock_quotes_updated([stock])
@@ -0,0 +1,106 @@
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import FrozenSet, List
+
+
+# The holiday rules and closures below are only complete from this date on.
+# trading_days() never reaches further back, so older history (a 'max' range
+# backfill) is not checked for gaps against an incomplete calendar.
+CALENDAR_START = date(2000, 1, 1)
+
+# Unscheduled full-day closures that the holiday rules below cannot derive.
+SPECIAL_CLOSURES = {
+    date(2001, 9, 11),   # September 11 attacks
+    date(2001, 9, 12),   # September 11 attacks
+    date(2001, 9, 13),   # September 11 attacks
+    date(2001, 9, 14),   # September 11 attacks
+    date(2004, 6, 11),   # National Day of Mourning, Ronald Reagan
+    date(2007, 1, 2),    # National Day of Mourning, Gerald Ford
+    date(2012, 10, 29),  # Hurricane Sandy
+    date(2012, 10, 30),  # Hurricane Sandy
+    date(2018, 12, 5),   # National Day of Mourning, George H.W. Bush
+    date(2025, 1, 9),    # National Day of Mourning, Jimmy Carter
+}
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    if month == 12:
+        last = date(year, 12, 31)
+    else:
+        last = date(year, month + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter_sunday(year: int) -> date:
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(holiday: date) -> date:
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+@lru_cache(maxsize=None)
+def holidays_for_year(year: int) -> FrozenSet[date]:
+    holidays = set()
+
+    # NYSE does not close on Friday Dec 31 when New Year's Day is a Saturday.
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+
+    holidays.add(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+    holidays.add(_nth_weekday(year, 2, 0, 3))  # Washington's Birthday
+    holidays.add(_easter_sunday(year) - timedelta(days=2))  # Good Friday
+    holidays.add(_last_weekday(year, 5, 0))  # Memorial Day
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # Juneteenth
+    holidays.add(_observed(date(year, 7, 4)))  # Independence Day
+    holidays.add(_nth_weekday(year, 9, 0, 1))  # Labor Day
+    holidays.add(_nth_weekday(year, 11, 3, 4))  # Thanksgiving
+    holidays.add(_observed(date(year, 12, 25)))  # Christmas
+
+    holidays.update(d for d in SPECIAL_CLOSURES if d.year == year)
+    return frozenset(holidays)
+
+
+def is_trading_day(day: date) -> bool:
+    if day.weekday() >= 5:
+        return False
+    return day not in holidays_for_year(day.year)
+
+
+def trading_days(start_date: date, end_date: date) -> List[date]:
+    days = []
+    day = max(start_date, CALENDAR_START)
+    while day <= end_date:
+        if is_trading_day(day):
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+def previous_trading_day(day: date) -> date:
+    day -= timedelta(days=1)
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
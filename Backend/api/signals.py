@@ -0,0 +1,74 @@
+import weakref
+from typing import Iterable
+from django.db import router, transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from api.models import NewsSentimentHistory, PriceHistory, Stock
+from api.services.buzz_index import BuzzIndexService
+from api.services.price_store import price_store
+from api.services.response_cache import history_updated
+from api.services.sentiment_rollup import SentimentRollupService
+
+
+# Stocks whose price store file a PriceHistory queryset delete() has already
+# scheduled to drop, so a bulk delete schedules one drop per stock.
+_price_files_dropped = weakref.WeakKeyDictionary()
+
+
+def stocks_created(tickers: Iterable[str]):
+    # Rollups and buzz are only kept for tracked stocks, so a new stock gets
+    # them from the News already stored for its ticker. For bulk_create,
+    # which sends no post_save, callers call this themselves.
+    tickers = set(tickers)
+    rollups = SentimentRollupService()
+    for ticker in tickers:
+        rollups.rebuild(ticker=ticker)
+    BuzzIndexService().refresh(tickers)
+
+
+@receiver(post_save, sender=Stock)
+def build_sentiment_history(sender, instance, created, **kwargs):
+    if created:
+        ticker = instance.ticker
+        transaction.on_commit(lambda: stocks_created([ticker]), using=router.db_for_write(Stock))
+
+
+@receiver(post_delete, sender=Stock)
+def delete_sentiment_history(sender, instance, **kwargs):
+    # NewsSentimentHistory.stock has no cascade, as the rollups may live in
+    # the news database (api.routers). They are deleted once the stock's
+    # deletion commits, so a rolled-back delete keeps them.
+    stock_id = instance.pk
+    transaction.on_commit(
+        lambda: NewsSentimentHistory.objects.filter(stock_id=stock_id).delete(),
+        using=router.db_for_write(Stock)
+    )
+
+
+@receiver(post_delete, sender=Stock)
+def delete_price_store_file(sender, instance, **kwargs):
+    ticker = instance.ticker
+    transaction.on_commit(lambda: price_store.delete(ticker), using=router.db_for_write(Stock))
+
+
+@receiver(post_delete, sender=PriceHistory)
+def drop_price_store_file(sender, instance, origin=None, **kwargs):
+    # The file no longer mirrors the table. It is dropped rather than rebuilt
+    # here; the next read rebuilds it from whatever rows are left.
+    if isinstance(origin, Stock) or getattr(origin, 'model', None) is Stock:
+        return  # delete_price_store_file covers the whole stock
+    stock_id = instance.stock_id
+    if isinstance(origin, QuerySet):
+        scheduled = _price_files_dropped.setdefault(origin, set())
+        if stock_id in scheduled:
+            return
+        scheduled.add(stock_id)
+
+    def drop():
+        ticker = Stock.objects.filter(pk=stock_id).values_list('ticker', flat=True).first()
+        if ticker:
+            price_store.delete(ticker)
+            history_updated([ticker])
+
+    transaction.on_commit(drop, using=router.db_for_write(PriceHistory))
@@ -0,0 +1,42 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.utils import timezone
+from api.models import News
+from api.services.news_ingestion import NewsIngestionService
+
+
+class SaveArticlesTests(TestCase):
+    databases = '__all__'
+
+    def article(self, i, **overrides):
+        article = {
+            'ticker': 'AAPL',
+            'title': f'Article {i}',
+            'content': '',
+            'source': 'Test',
+            'date': timezone.now() - timedelta(hours=i),
+            'link': f'https://example.com/ingestion/{i}',
+        }
+        article.update(overrides)
+        return article
+
+    def test_invalid_articles_are_skipped(self):
+        articles = [
+            self.article(0),
+            self.article(1, title=None),
+            self.article(2, source=None),
+            self.article(3, title='x' * 501),
+            self.article(4, sentiment='Positive'),
+            self.article(5, date=None),
+            self.article(6, link=None),
+            self.article(7, sentiment='Bearish'),
+        ]
+        del articles[1]['title']
+
+        saved = NewsIngestionService().save_articles(articles)
+
+        self.assertEqual(saved, 2)
+        self.assertEqual(
+            sorted(News.objects.values_list('title', flat=True)),
+            ['Article 0', 'Article 7']
+        )
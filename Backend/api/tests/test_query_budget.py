@@ -0,0 +1,132 @@
+import shutil
+import tempfile
+from asgiref.sync import async_to_sync
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
+from decimal import Decimal
+from django.core.cache import cache
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from api.models import Stock, News
+from api.routers import news_database
+from api.services.price_history_service import PriceHistoryService
+from api.services.price_store import price_store
+from api.services.response_cache import response_cache
+from api.services.trading_calendar import trading_days
+from api.views import StockDetailsBatchView, StockDetailsView
+
+
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'query-budget-tests',
+    }
+}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class QueryBudgetTests(TestCase):
+    databases = '__all__'
+
+    # Queries per request on each database, with News in the default
+    # database or in its own (api.routers). Split, the validators take one
+    # query per database instead of a single subquery.
+    STOCK_DETAILS_BUDGET = {'shared': {'default': 4}, 'split': {'default': 2, 'news': 3}}
+    REVALIDATION_BUDGET = {'shared': {'default': 1}, 'split': {'default': 1, 'news': 1}}
+    # Independent of the number of tickers
+    BATCH_BUDGET = {'shared': {'default': 4}, 'split': {'default': 1, 'news': 3}}
+    TICKER = 'QBUDGET'
+    BATCH_TICKERS = [f'QBATCH{i}' for i in range(10)]
+
+    def setUp(self):
+        self.original_root = price_store.root
+        price_store.root = type(self.original_root)(tempfile.mkdtemp())
+        cache.clear()
+        for ticker in [self.TICKER] + self.BATCH_TICKERS:
+            self._seed_ticker(ticker)
+
+    def tearDown(self):
+        shutil.rmtree(price_store.root, ignore_errors=True)
+        price_store.root = self.original_root
+
+    def test_stock_details(self):
+        view = StockDetailsView.as_view()
+
+        with self.assertQueryBudget(self.STOCK_DETAILS_BUDGET):
+            response = async_to_sync(view)(self._get('/stock-details', ticker=self.TICKER))
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        with self.assertQueryBudget(None):
+            response = async_to_sync(view)(self._get('/stock-details', ticker=self.TICKER))
+        self.assertEqual(response.status_code, 200)
+
+        with self.assertQueryBudget(None):
+            response = async_to_sync(view)(self._get('/stock-details', etag, ticker=self.TICKER))
+        self.assertEqual(response.status_code, 304)
+
+        response_cache.invalidate('stock-details', [self.TICKER])
+        with self.assertQueryBudget(self.REVALIDATION_BUDGET):
+            response = async_to_sync(view)(self._get('/stock-details', etag, ticker=self.TICKER))
+        self.assertEqual(response.status_code, 304)
+
+    def test_stock_details_batch(self):
+        view = StockDetailsBatchView.as_view()
+        tickers = ','.join(self.BATCH_TICKERS)
+
+        with self.assertQueryBudget(self.BATCH_BUDGET):
+            response = async_to_sync(view)(self._get('/stock-details/batch', tickers=tickers))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data), self.BATCH_TICKERS)
+
+        with self.assertQueryBudget(None):
+            response = async_to_sync(view)(self._get('/stock-details/batch', tickers=tickers))
+        self.assertEqual(response.status_code, 200)
+
+    @contextmanager
+    def assertQueryBudget(self, budget):
+        # None means no query at all, on any database.
+        layout = 'shared' if news_database() == 'default' else 'split'
+        counts = budget[layout] if budget else {}
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(self.assertNumQueries(counts.get(alias, 0), using=alias))
+            yield
+
+    def _get(self, path, etag=None, **params):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return APIRequestFactory().get(path, params, **headers)
+
+    def _seed_ticker(self, ticker):
+        stock = Stock.objects.create(
+            ticker=ticker,
+            company_full_name='Query Budget Inc.',
+            current_price=Decimal('100.00'),
+            change_in_day=Decimal('1.00'),
+            market_cap=1_000_000_000,
+            volume=1_000_000
+        )
+
+        today = timezone.localdate()
+        bars = [
+            {'date': day, 'price': Decimal('100.00') + i, 'volume': 1000}
+            for i, day in enumerate(trading_days(today - timedelta(days=30), today - timedelta(days=1)))
+        ]
+        PriceHistoryService().store_bars(stock, bars)
+
+        now = timezone.now()
+        News.objects.bulk_create([
+            News(
+                ticker=ticker,
+                title=f'Query budget article {i}',
+                content='Body',
+                source='Budget',
+                date=now - timedelta(hours=i),
+                link=f'https://example.com/query-budget/{ticker}/{i}',
+                sentiment=['Bullish', 'Bearish', 'Neutral'][i % 3],
+                sentiment_analyzed=True
+            )
+            for i in range(15)
+        ])
@@ -0,0 +1,248 @@
+import os
+import re
+import shutil
+import tempfile
+import warnings
+from contextlib import ExitStack
+from io import StringIO
+from unittest import mock
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from datetime import timedelta
+from decimal import Decimal
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from api.models import Stock, News
+from api.services.news_archive import news_archive
+from api.services.news_ingestion import NewsIngestionService
+from api.services.news_retention import NewsRetentionService
+from api.services.price_history_service import PriceHistoryService
+from api.services.price_store import price_store
+from api.services.response_cache import response_cache
+from api.services.trading_calendar import trading_days
+from api.views import (
+    NewsArticleView,
+    NewsBuzzView,
+    NewsSearchView,
+    NewsView,
+    SentimentMoversView,
+    SentimentView,
+    StockDetailsBatchView,
+    StockDetailsView,
+    StocksView,
+)
+
+
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'query-plan-tests',
+    }
+}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class QueryPlanTests(TestCase):
+    databases = '__all__'
+
+    # Scans of these are expected: they hold one row per ticker (and period),
+    # and /stocks, /newsBuzz and the score and buzz rebuilds read them whole.
+    FULL_SCAN_ALLOWED = {'api_stock', 'api_newsbuzz'}
+    TICKERS = ['QPLAN0', 'QPLAN1', 'QPLAN2']
+    ARTICLES_PER_TICKER = 40
+    RETENTION_DAYS = 90
+
+    # "SCAN api_news", "SCAN n" (an alias); an index walk reads
+    # "SCAN ... USING INDEX" and a virtual table "SCAN ... VIRTUAL TABLE".
+    # Subqueries are scanned under the name of their CO-ROUTINE/MATERIALIZE step.
+    FULL_SCAN = re.compile(r'^SCAN (\S+)$')
+    DERIVED_TABLE = re.compile(r'^(?:CO-ROUTINE|MATERIALIZE) (\S+)$')
+    CHECKED_STATEMENTS = ('SELECT', 'WITH', 'UPDATE', 'DELETE')
+
+    def setUp(self):
+        if any(connections[alias].vendor != 'sqlite' for alias in connections):
+            self.skipTest('Query plans are checked against SQLite only')
+
+        self.original_root = price_store.root
+        self.original_archive_root = news_archive.root
+        price_store.root = type(self.original_root)(tempfile.mkdtemp())
+        news_archive.root = type(self.original_archive_root)(tempfile.mkdtemp())
+        cache.clear()
+        # analyze_sentiments is run for its queries, not its scores.
+        environ = mock.patch.dict(os.environ, {'USE_FINBERT': 'false'})
+        environ.start()
+        self.addCleanup(environ.stop)
+        self._seed()
+
+    def tearDown(self):
+        shutil.rmtree(price_store.root, ignore_errors=True)
+        shutil.rmtree(news_archive.root, ignore_errors=True)
+        price_store.root = self.original_root
+        news_archive.root = self.original_archive_root
+
+    def test_no_full_table_scans(self):
+        with warnings.catch_warnings():
+            # /news filters on naive datetimes.
+            warnings.filterwarnings('ignore', message='DateTimeField .* received a naive datetime')
+            for label, run in self._scenarios():
+                with self.subTest(label):
+                    scans = self._full_scans(run)
+                    if scans:
+                        self.fail('\n'.join(
+                            f'{detail} in: {sql}\n' + '\n'.join(f'    {step}' for step in plan)
+                            for detail, sql, plan in scans
+                        ))
+
+    def _seed(self):
+        now = timezone.now()
+        today = timezone.localdate()
+        for ticker in self.TICKERS:
+            stock = Stock.objects.create(
+                ticker=ticker,
+                company_full_name='Query Plan Inc.',
+                current_price=Decimal('100.00'),
+                change_in_day=Decimal('1.00'),
+                market_cap=1_000_000_000,
+                volume=1_000_000
+            )
+            bars = [
+                {'date': day, 'price': Decimal('100.00') + i, 'volume': 1000}
+                for i, day in enumerate(trading_days(today - timedelta(days=30), today - timedelta(days=1)))
+            ]
+            PriceHistoryService().store_bars(stock, bars)
+
+        # Enough articles per ticker within a day that no /news request below
+        # is short and starts a provider backfill; every fifth is unscored.
+        News.objects.bulk_create([
+            News(
+                ticker=ticker,
+                title=f'Query plan article {i} on earnings',
+                content='Body',
+                source='Plan',
+                date=now - timedelta(minutes=20 * i),
+                link=f'https://example.com/query-plan/{ticker}/{i}',
+                sentiment=None if i % 5 == 4 else ['Bullish', 'Bearish', 'Neutral'][i % 3],
+                sentiment_analyzed=i % 5 != 4
+            )
+            for ticker in self.TICKERS
+            for i in range(self.ARTICLES_PER_TICKER)
+        ])
+        # And a few past the retention horizon, for archive_news to move.
+        cutoff = NewsRetentionService().cutoff(self.RETENTION_DAYS)
+        News.objects.bulk_create([
+            News(
+                ticker=ticker,
+                title=f'Query plan archived article {i}',
+                content='Body',
+                source='Plan',
+                date=cutoff - timedelta(days=i + 1),
+                link=f'https://example.com/query-plan/{ticker}/archived/{i}',
+                sentiment='Neutral',
+                sentiment_analyzed=True
+            )
+            for ticker in self.TICKERS
+            for i in range(3)
+        ])
+        call_command('rebuild_sentiment_rollups', stdout=StringIO())
+
+    def _scenarios(self):
+        tickers = ','.join(self.TICKERS)
+        article = News.objects.filter(ticker=self.TICKERS[0], sentiment_analyzed=True).first()
+        return [
+            ('/news', lambda: self._get(NewsView, 'news', '/news', {})),
+            ('/news?stocks', lambda: self._get(NewsView, 'news', '/news', {'stocks': tickers, 'limit': 5})),
+            ('/news?stocks&sentiment', lambda: self._get(
+                NewsView, 'news', '/news', {'stocks': self.TICKERS[0], 'sentiment': 'Bullish', 'limit': 5}
+            )),
+            ('/news?sentiment', lambda: self._get(NewsView, 'news', '/news', {'sentiment': 'Bearish'})),
+            ('/news?cursor', lambda: self._get(
+                NewsView, 'news', '/news', {'stocks': self.TICKERS[0], 'cursor': '', 'limit': 5}
+            )),
+            ('/news/search', lambda: self._get(
+                NewsSearchView, 'newsSearch', '/news/search', {'q': 'earnings', 'stocks': self.TICKERS[0]}
+            )),
+            ('/news/:id', lambda: self._get(NewsArticleView, None, f'/news/{article.id}', {}, id=article.id)),
+            ('/sentiment/:id', lambda: self._get(SentimentView, None, f'/sentiment/{article.id}', {}, id=article.id)),
+            ('/stocks', lambda: self._get(StocksView, 'stocks', '/stocks', {})),
+            ('/newsBuzz', lambda: self._get(NewsBuzzView, 'newsBuzz', '/newsBuzz', {})),
+            ('/sentimentMovers', lambda: self._get(SentimentMoversView, 'sentimentMovers', '/sentimentMovers', {})),
+            ('/stock-details', lambda: self._get(
+                StockDetailsView, 'stock-details', '/stock-details', {'ticker': self.TICKERS[0]}
+            )),
+            ('/stock-details/batch', lambda: self._get(
+                StockDetailsBatchView, 'stock-details', '/stock-details/batch', {'tickers': tickers}
+            )),
+            ('populate_news (ingestion)', self._ingest),
+            ('analyze_sentiments', lambda: call_command('analyze_sentiments', delay=0, stdout=StringIO())),
+            ('rebuild_sentiment_rollups', lambda: call_command('rebuild_sentiment_rollups', stdout=StringIO())),
+            ('rebuild_sentiment_scores', lambda: call_command('rebuild_sentiment_scores', stdout=StringIO())),
+            ('refresh_buzz_index', lambda: call_command('refresh_buzz_index', stdout=StringIO())),
+            ('archive_news', lambda: call_command('archive_news', days=self.RETENTION_DAYS, stdout=StringIO())),
+        ]
+
+    def _get(self, view_class, endpoint, path, params, **kwargs):
+        # Each request must reach the DB, not the response cache.
+        if endpoint:
+            response_cache.invalidate(endpoint)
+        if endpoint == 'stock-details':
+            response_cache.invalidate(endpoint, self.TICKERS)
+
+        view = view_class.as_view()
+        if iscoroutinefunction(view):
+            view = async_to_sync(view)
+        response = view(APIRequestFactory().get(path, params), **kwargs)
+        self.assertEqual(response.status_code, 200, getattr(response, 'data', ''))
+
+    def _ingest(self):
+        now = timezone.now()
+        NewsIngestionService().save_articles([
+            {
+                'ticker': self.TICKERS[0],
+                'title': f'Query plan ingested article {i}',
+                'content': 'Body',
+                'source': 'Plan',
+                'date': now - timedelta(minutes=i),
+                'link': f'https://example.com/query-plan/ingested/{i}',
+            }
+            for i in range(5)
+        ])
+
+    def _full_scans(self, run):
+        statements = []
+
+        def record(execute, sql, params, many, context):
+            if not many and sql.lstrip().upper().startswith(self.CHECKED_STATEMENTS):
+                statements.append((context['connection'].alias, sql, params))
+            return execute(sql, params, many, context)
+
+        # News may be in its own database (api.routers); watch every one.
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(record))
+            run()
+
+        scans = []
+        seen = set()
+        for alias, sql, params in statements:
+            if sql in seen:
+                continue
+            seen.add(sql)
+            with connections[alias].cursor() as cursor:
+                cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+                plan = [row[-1] for row in cursor.fetchall()]
+            derived = {match.group(1) for match in map(self.DERIVED_TABLE.match, plan) if match}
+            for detail in plan:
+                match = self.FULL_SCAN.match(detail)
+                if not match or match.group(1) in derived:
+                    continue
+                if self._table(match.group(1), sql) not in self.FULL_SCAN_ALLOWED:
+                    scans.append((detail, sql, plan))
+        return scans
+
+    def _table(self, name, sql):
+        # Resolves a table alias from its FROM/JOIN clause.
+        match = re.search(rf'(?:FROM|JOIN)\s+"?(\w+)"?\s+(?:AS\s+)?"?{re.escape(name)}"?(?:\s|$)', sql)
+        return match.group(1) if match else name
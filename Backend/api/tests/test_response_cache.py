@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase, override_settings
+from api.services.response_cache import ResponseCache
+
+
+TEST_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'response-cache-tests',
+    }
+}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class GenerationTests(SimpleTestCase):
+
+    def setUp(self):
+        self.responses = ResponseCache()
+        self.responses.cache.clear()
+
+    def test_culled_generation_does_not_revive_old_payloads(self):
+        params = {'ticker': 'AAPL'}
+        old_key = self.responses.key('stocks', params)
+        self.responses.set(old_key, 'stocks', (['old'], None))
+
+        self.responses.invalidate('stocks')
+        # Simulate the cache culling the counter but not the old payload.
+        self.responses.cache.delete(self.responses._generation_key('stocks'))
+
+        new_key = self.responses.key('stocks', params)
+        self.assertNotEqual(new_key, old_key)
+        self.assertIsNone(self.responses.get(new_key, 'stocks'))
+        self.assertEqual(self.responses.key('stocks', params), new_key)
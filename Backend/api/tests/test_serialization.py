@@ -0,0 +1,68 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from api.models import Stock, News
+from api.renderers import FastJSONRenderer
+from api.serializers.row_serializers import row_serializer
+from api.serializers.stock_serializers import NewsSerializer, StockSerializer
+
+
+class FastSerializationTests(TestCase):
+    # /news and /stocks serialize .values() rows and render them with orjson;
+    # the bytes must match what the DRF serializers and renderer produce.
+
+    databases = '__all__'
+    ROWS = 60
+
+    @classmethod
+    def setUpTestData(cls):
+        Stock.objects.bulk_create([
+            Stock(
+                ticker=f'ZS{i:04d}',
+                company_full_name=f'Serial Company {i} \u2013 Holdings',
+                current_price=Decimal(100 + i) / 7 if i % 5 else None,
+                change_in_day=Decimal(i % 13 - 6) / 3,
+                sentiment_score=(i % 201) - 100 if i % 4 else None
+            )
+            for i in range(cls.ROWS)
+        ])
+
+        now = timezone.now()
+        News.objects.bulk_create([
+            News(
+                ticker=f'ZS{i % 10:04d}',
+                title=f'Headline {i} \u2014 \u201cquoted\u201d \u00fcn\u00efc\u00f6d\u00e9 \u2028 separator',
+                content='Lorem ipsum dolor sit amet. ' * 4,
+                source='Serial Wire',
+                author=f'Reporter {i}' if i % 3 else None,
+                date=now - timedelta(minutes=7 * i, microseconds=i),
+                link=f'https://example.com/serial/{i}',
+                sentiment=['Bullish', 'Bearish', 'Neutral', None][i % 4],
+                sentiment_analyzed=i % 4 != 3
+            )
+            for i in range(cls.ROWS)
+        ])
+
+    def assertSameBytes(self, serializer_class, queryset, fields=None):
+        kwargs = {'fields': list(fields)} if fields else {}
+        rows = row_serializer(serializer_class, fields)
+
+        expected = JSONRenderer().render(serializer_class(queryset.all(), many=True, **kwargs).data)
+        actual = FastJSONRenderer().render(rows.serialize(queryset.values(*rows.sources)))
+        self.assertEqual(actual, expected)
+
+    def test_news(self):
+        self.assertSameBytes(NewsSerializer, News.objects.order_by('-date', '-id'))
+
+    def test_news_summary(self):
+        self.assertSameBytes(
+            NewsSerializer, News.objects.order_by('-date', '-id'), tuple(NewsSerializer.SUMMARY_FIELDS)
+        )
+
+    def test_news_fields(self):
+        self.assertSameBytes(NewsSerializer, News.objects.order_by('-date', '-id'), ('id', 'title', 'author'))
+
+    def test_stocks(self):
+        self.assertSameBytes(StockSerializer, Stock.objects.order_by('ticker'))
@@ -0,0 +1,119 @@
+import shutil
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+from django.test import TestCase
+from django.utils import timezone
+from api.models import News, NewsSentimentHistory, PriceHistory, Stock
+from api.services.news_ingestion import NewsIngestionService
+from api.services.price_history_service import PriceHistoryService
+from api.services.price_store import price_store
+
+
+class StockDeletionTests(TestCase):
+    # NewsSentimentHistory.stock has no cascade; api.signals deletes the rows.
+
+    databases = '__all__'
+
+    def setUp(self):
+        self.stock = Stock.objects.create(ticker='AAPL', company_full_name='Apple Inc.')
+        self.other = Stock.objects.create(ticker='MSFT', company_full_name='Microsoft Corporation')
+        for stock in (self.stock, self.other):
+            NewsSentimentHistory.objects.create(stock=stock, date=date(2026, 1, 2), bullish_count=1, total_news=1)
+
+    def test_deleting_a_stock_deletes_its_rollups(self):
+        stock_id = self.stock.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            self.stock.delete()
+
+        self.assertFalse(NewsSentimentHistory.objects.filter(stock_id=stock_id).exists())
+        self.assertTrue(NewsSentimentHistory.objects.filter(stock_id=self.other.pk).exists())
+
+    def test_queryset_delete_deletes_rollups(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Stock.objects.filter(ticker__in=['AAPL', 'MSFT']).delete()
+
+        self.assertFalse(NewsSentimentHistory.objects.exists())
+
+    def test_rollups_stay_until_the_delete_commits(self):
+        stock_id = self.stock.pk
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            self.stock.delete()
+
+        self.assertEqual(len(callbacks), 2)
+        self.assertTrue(NewsSentimentHistory.objects.filter(stock_id=stock_id).exists())
+
+
+class StockCreationTests(TestCase):
+    # Ingestion never creates stocks; a new stock gets its rollups from
+    # api.signals.
+
+    databases = '__all__'
+
+    def setUp(self):
+        now = timezone.now()
+        NewsIngestionService().save_articles([
+            {
+                'ticker': 'NEWCO',
+                'title': f'Article {i}',
+                'content': 'Body',
+                'source': 'Test',
+                'date': now - timedelta(days=i),
+                'link': f'https://example.com/signals/{i}',
+                'sentiment': 'Bullish',
+            }
+            for i in range(3)
+        ])
+
+    def test_ingestion_does_not_create_stocks(self):
+        self.assertEqual(News.objects.filter(ticker='NEWCO').count(), 3)
+        self.assertFalse(Stock.objects.filter(ticker='NEWCO').exists())
+        self.assertFalse(NewsSentimentHistory.objects.exists())
+
+    def test_new_stock_gets_rollups(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            stock = Stock.objects.create(ticker='NEWCO', company_full_name='NewCo')
+
+        rollups = NewsSentimentHistory.objects.filter(stock_id=stock.pk)
+        self.assertEqual(sum(rollups.values_list('bullish_count', flat=True)), 3)
+
+
+class PriceStoreCleanupTests(TestCase):
+    # The price store mirrors PriceHistory; api.signals drops a stock's file
+    # when its rows or the stock itself are deleted.
+
+    databases = '__all__'
+
+    def setUp(self):
+        self.original_root = price_store.root
+        price_store.root = type(self.original_root)(tempfile.mkdtemp())
+        self.stock = Stock.objects.create(ticker='AAPL', company_full_name='Apple Inc.')
+        PriceHistoryService().store_bars(self.stock, [
+            {'date': date(2026, 1, 2) + timedelta(days=i), 'price': Decimal('100.00'), 'volume': 1000}
+            for i in range(3)
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(price_store.root, ignore_errors=True)
+        price_store.root = self.original_root
+
+    def test_deleting_a_stock_deletes_its_file(self):
+        self.assertTrue(price_store.path_for('AAPL').exists())
+        with self.captureOnCommitCallbacks(execute=True):
+            self.stock.delete()
+
+        self.assertFalse(price_store.path_for('AAPL').exists())
+
+    def test_deleting_bars_rebuilds_the_series(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            PriceHistory.objects.filter(stock=self.stock, date__gte=date(2026, 1, 3)).delete()
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(price_store.path_for('AAPL').exists())
+        self.assertEqual(len(PriceHistoryService().series(self.stock)), 1)
+
+    def test_reading_an_unknown_ticker_writes_no_file(self):
+        stock = Stock.objects.create(ticker='NOBARS', company_full_name='No Bars')
+
+        self.assertEqual(len(PriceHistoryService().series(stock)), 0)
+        self.assertFalse(price_store.path_for('NOBARS').exists())
@@ -5,8 +5,16 @@ from api.views import (
     SentimentMoversView,
     StocksView,
     NewsView,
+    NewsArticleView,
+    NewsSearchView,
+    NewsArchiveView,
     SentimentView,
-    StockDetailsView
+    SentimentBatchView,
+    StockDetailsView,
+    StockDetailsBatchView,
+    PriceHistoryView,
+    EventsView,
+    MetricsView
 )
 
 urlpatterns = [
@@ -15,7 +23,15 @@ urlpatterns = [
     path('sentimentMovers', SentimentMoversView.as_view(), name='sentiment-movers'),
     path('stocks', StocksView.as_view(), name='stocks'),
     path('news', NewsView.as_view(), name='news'),
+    path('news/search', NewsSearchView.as_view(), name='news-search'),
+    path('news/archive', NewsArchiveView.as_view(), name='news-archive'),
+    path('news/<uuid:id>', NewsArticleView.as_view(), name='news-article'),
     path('sentiment/<uuid:id>', SentimentView.as_view(), name='sentiment'),
+    path('sentiment/batch', SentimentBatchView.as_view(), name='sentiment-batch'),
     path('stock-details', StockDetailsView.as_view(), name='stock-details'),
+    path('stock-details/batch', StockDetailsBatchView.as_view(), name='stock-details-batch'),
+    path('price-history', PriceHistoryView.as_view(), name='price-history'),
+    path('events', EventsView.as_view(), name='events'),
+    path('metrics', MetricsView.as_view(), name='metrics'),
 ]
 
@@ -3,8 +3,16 @@ from .news_buzz_view import NewsBuzzView
 from .sentiment_movers_view import SentimentMoversView
 from .stocks_view import StocksView
 from .news_view import NewsView
+from .news_article_view import NewsArticleView
+from .news_search_view import NewsSearchView
+from .news_archive_view import NewsArchiveView
 from .sentiment_view import SentimentView
+from .sentiment_batch_view import SentimentBatchView
 from .stock_details_view import StockDetailsView
+from .stock_details_batch_view import StockDetailsBatchView
+from .price_history_view import PriceHistoryView
+from .events_view import EventsView
+from .metrics_view import MetricsView
 
 __all__ = [
     'TopMoversView',
@@ -12,7 +20,15 @@ __all__ = [
     'SentimentMoversView',
     'StocksView',
     'NewsView',
+    'NewsArticleView',
+    'NewsSearchView',
+    'NewsArchiveView',
     'SentimentView',
+    'SentimentBatchView',
     'StockDetailsView',
+    'StockDetailsBatchView',
+    'PriceHistoryView',
+    'EventsView',
+    'MetricsView',
 ]
 
@@ -0,0 +1,137 @@
+from rest_framework.response import Response
+from rest_framework import status
+import asyncio
+import queue
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from api.renderers import EventStreamRenderer, FastJSONRenderer
+from api.services.event_stream import event_stream, news_event_feed
+from api.views.async_api_view import AsyncAPIView
+
+
+class EventsView(AsyncAPIView):
+    
+    renderer_classes = [FastJSONRenderer, EventStreamRenderer]
+    
+    HEARTBEAT_SECONDS = 15
+    RETRY_MILLISECONDS = 3000
+    SENTIMENTS = ['Bullish', 'Bearish', 'Neutral']
+    
+    @extend_schema(
+        summary="Stream news and quote events",
+        description="Server-sent events for newly ingested articles (news.created), newly scored articles "
+                    "(news.scored) and refreshed quotes (stock.quote_updated). Reconnect with the Last-Event-ID "
+                    "header to resume; a stream.reset event means some events were missed and the client "
+                    "should reload its data once",
+        parameters=[
+            OpenApiParameter(
+                name='tickers',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated stock tickers to receive events for (e.g., "AAPL,MSFT"); all if omitted',
+                required=False
+            ),
+            OpenApiParameter(
+                name='sentiment',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Only news events with this sentiment; quote events are not filtered',
+                required=False,
+                enum=['Bullish', 'Bearish', 'Neutral']
+            ),
+            OpenApiParameter(
+                name='lastEventId',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Resume after this event id, for clients that cannot send the Last-Event-ID header',
+                required=False
+            ),
+        ],
+        responses={(200, 'text/event-stream'): {'type': 'string'}},
+    )
+    async def get(self, request):
+        sentiment = request.query_params.get('sentiment')
+        if sentiment and sentiment not in self.SENTIMENTS:
+            return Response(
+                {'error': 'Invalid sentiment. Use Bullish, Bearish, or Neutral'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        tickers = {t.strip().upper() for t in request.query_params.get('tickers', '').split(',') if t.strip()}
+        
+        def matches(event):
+            if tickers and event.ticker not in tickers:
+                return False
+            if sentiment and event.type != 'stock.quote_updated' and event.sentiment != sentiment:
+                return False
+            return True
+        
+        last_event_id = request.headers.get('Last-Event-ID') or request.query_params.get('lastEventId')
+        
+        # Under WSGI an async iterator is consumed whole before anything is
+        # sent, so the stream blocks its worker thread on the queue instead.
+        stream = self._stream if isinstance(request._request, ASGIRequest) else self._blocking_stream
+        response = StreamingHttpResponse(stream(matches, last_event_id), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # Keep reverse proxies from buffering the stream.
+        response['X-Accel-Buffering'] = 'no'
+        return response
+    
+    async def _stream(self, matches, last_event_id):
+        # Subscribing here rather than in get() ties the subscription to the
+        # generator, whose finally runs when the client disconnects.
+        news_event_feed.start()
+        subscription, replay = event_stream.subscribe(matches, last_event_id)
+        try:
+            for message in self._opening(replay):
+                yield message
+            
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), self.HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ': keep-alive\n\n'
+                    continue
+                
+                if event is None:
+                    yield self._reset()
+                    return
+                yield self._format(event)
+        finally:
+            event_stream.unsubscribe(subscription)
+    
+    def _blocking_stream(self, matches, last_event_id):
+        news_event_feed.start()
+        subscription, replay = event_stream.subscribe(matches, last_event_id, blocking=True)
+        try:
+            yield from self._opening(replay)
+            
+            while True:
+                try:
+                    event = subscription.queue.get(timeout=self.HEARTBEAT_SECONDS)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                
+                if event is None:
+                    yield self._reset()
+                    return
+                yield self._format(event)
+        finally:
+            event_stream.unsubscribe(subscription)
+    
+    def _opening(self, replay):
+        messages = [f'retry: {self.RETRY_MILLISECONDS}\n\n']
+        if replay is None:
+            messages.append(self._reset())
+        else:
+            messages.extend(self._format(event) for event in replay)
+        return messages
+    
+    def _format(self, event):
+        return f'id: {event.id}\nevent: {event.type}\ndata: {event.data}\n\n'
+    
+    def _reset(self):
+        # Carries the current id, so the client resumes from here after reloading.
+        return f'id: {event_stream.last_event_id}\nevent: stream.reset\ndata: {{}}\n\n'
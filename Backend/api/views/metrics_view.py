@@ -0,0 +1,21 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from drf_spectacular.utils import extend_schema
+from api.services.response_cache import response_cache
+from api.services.admission import admission
+
+
+class MetricsView(APIView):
+    
+    @extend_schema(
+        summary="Get service metrics",
+        description="Returns per-endpoint response cache hits, misses, hit rate and invalidations, and admission control "
+                    "slots, queue depth and shed requests, for this worker process",
+        responses={200: {'type': 'object'}},
+    )
+    def get(self, request):
+        return Response({
+            'responseCache': response_cache.stats(),
+            'admission': admission.stats()
+        }, status=status.HTTP_200_OK)
@@ -0,0 +1,111 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from datetime import datetime, time, timedelta
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.utils import timezone
+from api.serializers.row_serializers import row_serializer
+from api.serializers.stock_serializers import NewsSerializer
+from api.services.news_archive import news_archive
+from api.services.response_cache import cached_response
+
+
+class NewsArchiveView(APIView):
+    
+    MAX_LIMIT = 100
+    
+    @extend_schema(
+        summary="Get archived news articles",
+        description="Returns articles older than the retention horizon (NEWS_RETENTION_DAYS), which `archive_news` "
+                    "has moved out of the News table, newest first. Their sentiment stays counted in the daily rollups",
+        parameters=[
+            OpenApiParameter(
+                name='stocks',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated list of stock tickers (e.g., "AAPL,MSFT")',
+                required=False
+            ),
+            OpenApiParameter(
+                name='sentiment',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Filter by sentiment: Bullish, Bearish, or Neutral',
+                required=False,
+                enum=['Bullish', 'Bearish', 'Neutral']
+            ),
+            OpenApiParameter(
+                name='from',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Only articles published on or after this date (YYYY-MM-DD)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='to',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Only articles published on or before this date (YYYY-MM-DD)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='limit',
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description='Number of articles to return (max 100)',
+                required=False,
+                default=20
+            ),
+            OpenApiParameter(
+                name='view',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='summary leaves out `content`',
+                required=False,
+                default='full',
+                enum=['full', 'summary']
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated article fields to return (e.g., "title,date,sentiment"); id is always included',
+                required=False
+            ),
+        ],
+        responses={200: NewsSerializer(many=True)},
+    )
+    @cached_response('newsArchive')
+    def get(self, request):
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 20)), self.MAX_LIMIT))
+            start = self._day(request.query_params.get('from'))
+            end = self._day(request.query_params.get('to'))
+        except ValueError:
+            return Response(
+                {'error': 'from and to must be formatted as YYYY-MM-DD, limit as an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            fields = NewsSerializer.requested_fields(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        tickers = [t.strip().upper() for t in request.query_params.get('stocks', '').split(',') if t.strip()]
+        
+        rows = news_archive.read(
+            tickers=tickers,
+            sentiment=request.query_params.get('sentiment') or None,
+            start=start,
+            end=end + timedelta(days=1) if end else None,
+            limit=limit
+        )
+        
+        news_rows = row_serializer(NewsSerializer, tuple(fields) if fields else None)
+        return Response(news_rows.serialize(rows), status=status.HTTP_200_OK)
+    
+    def _day(self, value):
+        if not value:
+            return None
+        return timezone.make_aware(datetime.combine(datetime.strptime(value, '%Y-%m-%d').date(), time.min))
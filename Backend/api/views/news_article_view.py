@@ -0,0 +1,38 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from api.models import News
+from api.serializers.stock_serializers import NewsSerializer
+
+
+class NewsArticleView(APIView):
+    
+    @extend_schema(
+        summary="Get a news article",
+        description="Returns one news article including its content, for clients that list articles with view=summary",
+        parameters=[
+            OpenApiParameter(
+                name='id',
+                type=str,
+                location=OpenApiParameter.PATH,
+                description='UUID of the news article',
+                required=True
+            ),
+        ],
+        responses={
+            200: NewsSerializer,
+            404: {'description': 'News article not found'}
+        },
+    )
+    def get(self, request, id):
+        try:
+            news = News.objects.get(id=id)
+        except News.DoesNotExist:
+            return Response(
+                {'error': 'News article not found'},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        serializer = NewsSerializer(news)
+        return Response(serializer.data, status=status.HTTP_200_OK)
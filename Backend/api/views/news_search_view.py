@@ -0,0 +1,113 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from datetime import datetime, time, timedelta
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.utils import timezone
+from api.models import News
+from api.serializers.row_serializers import row_serializer
+from api.serializers.stock_serializers import NewsSerializer
+from api.services.news_search import NewsSearchService
+from api.services.response_cache import cached_response
+import uuid
+
+
+class NewsSearchView(APIView):
+    
+    MAX_LIMIT = 100
+    
+    @extend_schema(
+        summary="Search news articles",
+        description="Full-text search over article titles and content, ranked by relevance (title matches weigh more). "
+                    "Each result is the summary article plus `titleHighlight` and a `snippet` of the content, with "
+                    "matches wrapped in <mark></mark>, and its `score`",
+        parameters=[
+            OpenApiParameter(
+                name='q',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Search terms; all must match. Use "..." for phrases and a trailing * for prefixes',
+                required=True
+            ),
+            OpenApiParameter(
+                name='stocks',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated list of stock tickers (e.g., "AAPL,MSFT")',
+                required=False
+            ),
+            OpenApiParameter(
+                name='from',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Only articles published on or after this date (YYYY-MM-DD)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='to',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Only articles published on or before this date (YYYY-MM-DD)',
+                required=False
+            ),
+            OpenApiParameter(
+                name='limit',
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description='Number of results to return (max 100)',
+                required=False,
+                default=20
+            ),
+        ],
+        responses={200: {'type': 'array', 'items': {'type': 'object'}}},
+    )
+    @cached_response('newsSearch')
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response(
+                {'error': 'q parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            limit = max(1, min(int(request.query_params.get('limit', 20)), self.MAX_LIMIT))
+            start = self._day(request.query_params.get('from'))
+            end = self._day(request.query_params.get('to'))
+        except ValueError:
+            return Response(
+                {'error': 'from and to must be formatted as YYYY-MM-DD, limit as an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        tickers = [t.strip().upper() for t in request.query_params.get('stocks', '').split(',') if t.strip()]
+        
+        hits = NewsSearchService().search(
+            query,
+            tickers=tickers,
+            start=start,
+            end=end + timedelta(days=1) if end else None,
+            limit=limit
+        )
+        
+        news_rows = row_serializer(NewsSerializer, tuple(NewsSerializer.SUMMARY_FIELDS))
+        articles = {
+            row['id']: row
+            for row in News.objects.filter(id__in=[uuid.UUID(hit.id) for hit in hits]).values(*news_rows.sources)
+        }
+        
+        results = []
+        for hit in hits:
+            row = articles.get(uuid.UUID(hit.id))
+            if row is None:
+                continue
+            article = news_rows.serialize([row])[0]
+            article.update(titleHighlight=hit.title, snippet=hit.snippet, score=hit.score)
+            results.append(article)
+        
+        return Response(results, status=status.HTTP_200_OK)
+    
+    def _day(self, value):
+        if not value:
+            return None
+        return timezone.make_aware(datetime.combine(datetime.strptime(value, '%Y-%m-%d').date(), time.min))
@@ -3,16 +3,23 @@ from rest_framework.response import Response
 from rest_framework import status
 from datetime import datetime, timedelta
 from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.db.models import Count, Max, Min
 from api.models import News
+from api.serializers.row_serializers import row_serializer
 from api.serializers.stock_serializers import NewsSerializer
-from api.services.news_service import NewsService
+from api.services.news_backfill import news_backfill
+from api.services.keyset_pagination import InvalidCursor, KeysetPaginator
+from api.services.response_cache import cached_response
+from api.services.admission import shed_load
 
 
 class NewsView(APIView):
     
     @extend_schema(
         summary="Get news articles",
-        description="Returns news articles with optional filtering by sentiment, stocks, and time period",
+        description="Returns news articles with optional filtering by sentiment, stocks, and time period. "
+                    "When fewer than `limit` articles are stored for the requested stocks, more are fetched in the "
+                    "background and the response carries `X-Backfill-Pending: true` and `Retry-After`",
         parameters=[
             OpenApiParameter(
                 name='limit',
@@ -46,10 +53,114 @@ class NewsView(APIView):
                 default='7d',
                 enum=['1d', '7d', '30d']
             ),
+            OpenApiParameter(
+                name='view',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='summary leaves out `content`; fetch it from /news/{id} when an article is opened',
+                required=False,
+                default='full',
+                enum=['full', 'summary']
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated article fields to return (e.g., "title,date,sentiment"); id is always included',
+                required=False
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Opaque page cursor from a previous `next`/`prev`. Pass it empty for the first page. '
+                            'When present, the response is {results, next, prev} and `limit` is the page size (max 100)',
+                required=False
+            ),
         ],
-        responses={200: NewsSerializer(many=True)},
+        responses={
+            200: NewsSerializer(many=True),
+            503: {'description': 'Too many requests in progress; retry after Retry-After seconds'}
+        },
     )
+    @cached_response('news')
+    @shed_load('news')
     def get(self, request):
+        limit, sentiment, ticker_list, time_period, start_date = self._filters(request)
+        
+        try:
+            paginator = self._paginator(request, limit)
+            fields = NewsSerializer.requested_fields(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        if paginator:
+            limit = paginator.page_size
+        
+        backfill_pending = False
+        if paginator is None or paginator.is_first_page:
+            news_count = self._filtered_queryset(start_date, ticker_list, sentiment).count()
+            
+            if news_count < limit and ticker_list:
+                backfill_pending = news_backfill.request(
+                    ticker_list[:3],
+                    limit=limit // len(ticker_list),
+                    sentiment=sentiment,
+                    time_period=time_period
+                )
+        
+        news_rows = row_serializer(NewsSerializer, tuple(fields) if fields else None)
+        news_queryset = self._filtered_queryset(start_date, ticker_list, sentiment).values(
+            *NewsSerializer.model_fields(fields or NewsSerializer.Meta.fields)
+        )
+        
+        if paginator:
+            data = paginator.envelope(news_rows.serialize(paginator.paginate(news_queryset)))
+            if backfill_pending:
+                data.update(backfillPending=True, retryAfter=news_backfill.RETRY_AFTER)
+            response = Response(data, status=status.HTTP_200_OK)
+        else:
+            news_queryset = news_queryset.order_by('-date')[:limit]
+            response = Response(news_rows.serialize(news_queryset), status=status.HTTP_200_OK)
+        
+        if backfill_pending:
+            response['X-Backfill-Pending'] = 'true'
+            response['Retry-After'] = str(news_backfill.RETRY_AFTER)
+        return response
+    
+    def get_watermark(self, request):
+        limit, sentiment, ticker_list, time_period, start_date = self._filters(request)
+        news_queryset = self._filtered_queryset(start_date, ticker_list, sentiment)
+        
+        try:
+            paginator = self._paginator(request, limit)
+        except InvalidCursor:
+            return None
+        
+        if paginator:
+            limit = paginator.page_size
+            page = paginator.page_queryset(news_queryset)
+        else:
+            page = news_queryset.order_by('-date')[:limit]
+        
+        watermark = page.aggregate(
+            count=Count('id'),
+            updated=Max('updated_at'),
+            oldest=Min('date'),
+            newest=Max('date')
+        )
+        
+        # A short first page may start a provider backfill, so it cannot be validated.
+        if ticker_list and watermark['count'] < limit and (paginator is None or paginator.is_first_page):
+            return None
+        return watermark.values()
+    
+    def _paginator(self, request, limit):
+        if 'cursor' not in request.query_params:
+            return None
+        return KeysetPaginator(request.query_params['cursor'], limit)
+    
+    def _filters(self, request):
         limit = int(request.query_params.get('limit', 20))
         sentiment = request.query_params.get('sentiment', None)
         stocks = request.query_params.get('stocks', None)
@@ -68,48 +179,12 @@ class NewsView(APIView):
         else:
             start_date = datetime.now() - timedelta(days=7)
         
-        news_queryset = News.objects.filter(date__gte=start_date)
-        
-        if ticker_list:
-            news_queryset = news_queryset.filter(ticker__in=ticker_list)
-        
-        if sentiment:
-            news_queryset = news_queryset.filter(sentiment=sentiment)
-        
-        news_count = news_queryset.count()
-        
-        if news_count < limit and ticker_list:
-            news_service = NewsService()
-            for ticker in ticker_list[:3]:
-                external_news = news_service.get_news_for_ticker(
-                    ticker, 
-                    limit=limit // len(ticker_list) if ticker_list else limit,
-                    sentiment=sentiment,
-                    time_period=time_period
-                )
-                
-                for article in external_news:
-                    News.objects.update_or_create(
-                        link=article['link'],
-                        defaults={
-                            'ticker': article['ticker'],
-                            'title': article['title'],
-                            'content': article['content'],
-                            'source': article['source'],
-                            'author': article.get('author'),
-                            'date': article['date'],
-                            'sentiment': article.get('sentiment'),
-                            'sentiment_analyzed': article.get('sentiment') is not None
-                        }
-                    )
-        
+        return limit, sentiment, ticker_list, time_period, start_date
+    
+    def _filtered_queryset(self, start_date, ticker_list, sentiment):
         news_queryset = News.objects.filter(date__gte=start_date)
         if ticker_list:
             news_queryset = news_queryset.filter(ticker__in=ticker_list)
         if sentiment:
             news_queryset = news_queryset.filter(sentiment=sentiment)
-        news_queryset = news_queryset.order_by('-date')[:limit]
-        
-        serializer = NewsSerializer(news_queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-
+        return news_queryset
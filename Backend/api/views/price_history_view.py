@@ -0,0 +1,116 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from api.models import Stock
+from api.serializers.stock_serializers import PriceHistoryResponseSerializer
+from api.services.downsampling import lttb
+from api.services.price_history_service import PriceHistoryService
+from api.services.admission import shed_load
+
+
+class PriceHistoryView(APIView):
+    
+    DEFAULT_POINTS = 200
+    MAX_POINTS = 2000
+    
+    @extend_schema(
+        summary="Get price history",
+        description="Returns daily closes for a ticker over a range, downsampled server-side to at most `points` points",
+        parameters=[
+            OpenApiParameter(
+                name='ticker',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Stock ticker symbol (e.g., AAPL, MSFT)',
+                required=True
+            ),
+            OpenApiParameter(
+                name='range',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='History range (default: 1Y)',
+                required=False,
+                enum=list(PriceHistoryService.RANGES)
+            ),
+            OpenApiParameter(
+                name='points',
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description='Maximum number of points to return (default: 200, max: 2000)',
+                required=False,
+                default=200
+            ),
+            OpenApiParameter(
+                name='method',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Downsampling method. Only lttb: history holds daily closes, not open/high/low',
+                required=False,
+                enum=['lttb']
+            ),
+        ],
+        responses={
+            200: PriceHistoryResponseSerializer,
+            503: {'description': 'Too many requests in progress; retry after Retry-After seconds'}
+        },
+    )
+    @shed_load('price-history')
+    def get(self, request):
+        ticker = request.query_params.get('ticker', '').upper()
+        range_key = request.query_params.get('range', '1Y')
+        method = request.query_params.get('method', 'lttb')
+        
+        if not ticker:
+            return Response(
+                {'error': 'Ticker parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if range_key not in PriceHistoryService.RANGES:
+            return Response(
+                {'error': f"Invalid range. Use one of: {', '.join(PriceHistoryService.RANGES)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if method != 'lttb':
+            return Response(
+                {'error': 'Invalid method. Use lttb; only daily closes are stored, so candles cannot be built'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            points = int(request.query_params.get('points', self.DEFAULT_POINTS))
+        except ValueError:
+            return Response(
+                {'error': 'points must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        points = max(3, min(points, self.MAX_POINTS))
+        
+        try:
+            stock, created = Stock.objects.get_or_create(
+                ticker=ticker,
+                defaults={'company_full_name': f'{ticker} Corporation'}
+            )
+            
+            history_service = PriceHistoryService()
+            history_service.ensure_full_history(stock)
+            
+            series = history_service.series(stock).slice(history_service.range_start(range_key))
+            
+            data = lttb(series, points)
+            
+            return Response({
+                'ticker': ticker,
+                'range': range_key,
+                'method': method,
+                'totalPoints': len(series),
+                'points': data
+            }, status=status.HTTP_200_OK)
+            
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,125 @@
+from rest_framework.response import Response
+from rest_framework import status
+from asgiref.sync import sync_to_async
+from drf_spectacular.utils import extend_schema
+from django.core.cache import cache
+from api.models import News
+from api.services.sentiment_service import SentimentService
+from api.services.news_ingestion import NewsIngestionService
+from api.views.async_api_view import AsyncAPIView
+import hashlib
+import uuid
+
+
+class SentimentBatchView(AsyncAPIView):
+    
+    MAX_ITEMS = 100
+    TEXT_CACHE_TIMEOUT = 60 * 60 * 24
+    
+    @extend_schema(
+        summary="Score sentiment for several articles or texts",
+        description="Scores up to 100 news article IDs and raw texts in one request. "
+                    "Articles that are already scored and recently scored texts are returned as stored; "
+                    "the rest are scored in one batched model pass and the articles are saved with one bulk update",
+        request={
+            'application/json': {
+                'type': 'object',
+                'properties': {
+                    'ids': {'type': 'array', 'items': {'type': 'string', 'format': 'uuid'}},
+                    'texts': {'type': 'array', 'items': {'type': 'string'}},
+                },
+            }
+        },
+        responses={
+            200: {'type': 'object'},
+            400: {'description': 'Invalid request body'}
+        },
+    )
+    async def post(self, request):
+        data = request.data if isinstance(request.data, dict) else {}
+        ids = data.get('ids') or []
+        texts = data.get('texts') or []
+        
+        if not isinstance(ids, list) or not isinstance(texts, list):
+            return Response(
+                {'error': 'ids and texts must be lists'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if not ids and not texts:
+            return Response(
+                {'error': 'Provide ids or texts to score'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if len(ids) + len(texts) > self.MAX_ITEMS:
+            return Response(
+                {'error': f'At most {self.MAX_ITEMS} ids and texts per request'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            news_ids = list(dict.fromkeys(uuid.UUID(str(news_id)) for news_id in ids))
+        except ValueError:
+            return Response(
+                {'error': 'Invalid UUID format'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if not all(isinstance(text, str) for text in texts):
+            return Response(
+                {'error': 'texts must be strings'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            articles = {news.id: news async for news in News.objects.filter(id__in=news_ids)}
+            article_results = {
+                str(news.id): news.sentiment
+                for news in articles.values() if news.sentiment_analyzed and news.sentiment
+            }
+            unscored = [news for news in articles.values() if str(news.id) not in article_results]
+            
+            text_keys = [self._text_key(text) for text in texts]
+            cached_texts = await cache.aget_many(text_keys)
+            unscored_texts = list(dict.fromkeys(
+                (key, text) for key, text in zip(text_keys, texts) if key not in cached_texts
+            ))
+            
+            # Every miss goes through the model in one batched call
+            batch = [f"{news.title} {news.content}" for news in unscored] + [text for _, text in unscored_texts]
+            if batch:
+                scores = await SentimentService().aanalyze_sentiments(batch)
+                
+                for news, result in zip(unscored, scores):
+                    news.sentiment = result['sentiment']
+                    news.sentiment_analyzed = True
+                    article_results[str(news.id)] = news.sentiment
+                await sync_to_async(NewsIngestionService().save_sentiments)(unscored)
+                
+                scored_texts = {
+                    key: result['sentiment']
+                    for (key, _), result in zip(unscored_texts, scores[len(unscored):])
+                }
+                await cache.aset_many(scored_texts, self.TEXT_CACHE_TIMEOUT)
+                cached_texts.update(scored_texts)
+            
+            return Response({
+                'data': {
+                    'articles': {
+                        str(news_id): {'sentiment': article_results[str(news_id)]}
+                        for news_id in news_ids if news_id in articles
+                    },
+                    'texts': [{'sentiment': cached_texts[key]} for key in text_keys],
+                    'notFound': [str(news_id) for news_id in news_ids if news_id not in articles]
+                }
+            }, status=status.HTTP_200_OK)
+        
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    def _text_key(self, text):
+        return 'sentiment-text:' + hashlib.sha1(text.encode()).hexdigest()
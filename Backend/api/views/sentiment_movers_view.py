@@ -2,17 +2,19 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from datetime import datetime, timedelta
+from django.db.models import Q, Sum
+from django.db.models.functions import Coalesce
 from drf_spectacular.utils import extend_schema, OpenApiParameter
-from api.models import Stock, News
+from api.models import NewsSentimentHistory, Stock
 from api.serializers.stock_serializers import SentimentMoverSerializer
-from api.services.stock_api_service import StockAPIService
+from api.services.response_cache import cached_response
 
 
 class SentimentMoversView(APIView):
     
     @extend_schema(
         summary="Get sentiment movers",
-        description="Returns stocks with significant sentiment changes based on news analysis",
+        description="Returns stocks with significant sentiment changes based on news analysis, ranked across every ticker with recent news",
         parameters=[
             OpenApiParameter(
                 name='limit',
@@ -25,54 +27,57 @@ class SentimentMoversView(APIView):
         ],
         responses={200: SentimentMoverSerializer(many=True)},
     )
+    @cached_response('sentimentMovers')
     def get(self, request):
         limit = int(request.query_params.get('limit', 10))
         
-        stocks = Stock.objects.all()[:limit * 3]
-        
-        sentiment_movers = []
         today = datetime.now().date()
         yesterday = today - timedelta(days=1)
         week_ago = today - timedelta(days=7)
         
-        for stock in stocks:
-            recent_news = News.objects.filter(
-                ticker=stock.ticker,
-                date__date__gte=yesterday,
-                sentiment_analyzed=True
-            )
+        recent = Q(date__gte=yesterday)
+        previous = Q(date__lt=yesterday)
+        
+        ticker_counts = NewsSentimentHistory.objects.filter(
+            date__gte=week_ago
+        ).values(
+            'stock_id'
+        ).annotate(
+            bullish=Coalesce(Sum('bullish_count', filter=recent), 0),
+            bearish=Coalesce(Sum('bearish_count', filter=recent), 0),
+            neutral=Coalesce(Sum('neutral_count', filter=recent), 0),
+            prev_bullish=Coalesce(Sum('bullish_count', filter=previous), 0),
+            prev_bearish=Coalesce(Sum('bearish_count', filter=previous), 0),
+            prev_neutral=Coalesce(Sum('neutral_count', filter=previous), 0),
+        ).filter(
+            Q(bullish__gt=0) | Q(bearish__gt=0) | Q(neutral__gt=0)
+        ).order_by()
+        
+        # Rollups may live in another database than Stock; no join.
+        ticker_counts = list(ticker_counts)
+        tickers = dict(Stock.objects.filter(
+            id__in=[row['stock_id'] for row in ticker_counts]
+        ).values_list('id', 'ticker'))
+        
+        sentiment_movers = []
+        for row in ticker_counts:
+            if row['stock_id'] not in tickers:
+                continue
+            total = row['bullish'] + row['bearish'] + row['neutral']
+            sentiment_score = int(((row['bullish'] - row['bearish']) / total) * 100)
+            
+            prev_total = row['prev_bullish'] + row['prev_bearish'] + row['prev_neutral']
+            if prev_total > 0:
+                prev_sentiment_score = int(((row['prev_bullish'] - row['prev_bearish']) / prev_total) * 100)
+                change = sentiment_score - prev_sentiment_score
+            else:
+                change = 0
             
-            if recent_news.exists():
-                bullish = recent_news.filter(sentiment='Bullish').count()
-                bearish = recent_news.filter(sentiment='Bearish').count()
-                neutral = recent_news.filter(sentiment='Neutral').count()
-                total = bullish + bearish + neutral
-                
-                if total > 0:
-                    sentiment_score = int(((bullish - bearish) / total) * 100)
-                    
-                    previous_news = News.objects.filter(
-                        ticker=stock.ticker,
-                        date__date__gte=week_ago,
-                        date__date__lt=yesterday,
-                        sentiment_analyzed=True
-                    )
-                    
-                    prev_bullish = previous_news.filter(sentiment='Bullish').count()
-                    prev_bearish = previous_news.filter(sentiment='Bearish').count()
-                    prev_total = prev_bullish + prev_bearish + previous_news.filter(sentiment='Neutral').count()
-                    
-                    if prev_total > 0:
-                        prev_sentiment_score = int(((prev_bullish - prev_bearish) / prev_total) * 100)
-                        change = sentiment_score - prev_sentiment_score
-                    else:
-                        change = 0
-                    
-                    sentiment_movers.append({
-                        'ticker': stock.ticker,
-                        'sentiment_score': sentiment_score,
-                        'change': change
-                    })
+            sentiment_movers.append({
+                'ticker': tickers[row['stock_id']],
+                'sentiment_score': sentiment_score,
+                'change': change
+            })
         
         sentiment_movers.sort(key=lambda x: abs(x['change']), reverse=True)
         sentiment_movers = sentiment_movers[:limit]
@@ -1,14 +1,16 @@
-from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from asgiref.sync import sync_to_async
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from api.models import News
 from api.serializers.stock_serializers import SentimentResponseSerializer
 from api.services.sentiment_service import SentimentService
+from api.services.news_ingestion import NewsIngestionService
+from api.views.async_api_view import AsyncAPIView
 import uuid
 
 
-class SentimentView(APIView):
+class SentimentView(AsyncAPIView):
     
     @extend_schema(
         summary="Get sentiment analysis",
@@ -28,12 +30,12 @@ class SentimentView(APIView):
             400: {'description': 'Invalid UUID format'}
         },
     )
-    def get(self, request, id):
+    async def get(self, request, id):
         try:
             news_id = uuid.UUID(str(id))
             
             try:
-                news = News.objects.get(id=news_id)
+                news = await News.objects.aget(id=news_id)
             except News.DoesNotExist:
                 return Response(
                     {'error': 'News article not found'},
@@ -49,11 +51,11 @@ class SentimentView(APIView):
             
             sentiment_service = SentimentService()
             text_to_analyze = f"{news.title} {news.content}"
-            sentiment_result = sentiment_service.analyze_sentiment(text_to_analyze)
+            sentiment_result = await sentiment_service.aanalyze_sentiment(text_to_analyze)
             
             news.sentiment = sentiment_result['sentiment']
             news.sentiment_analyzed = True
-            news.save()
+            await sync_to_async(NewsIngestionService().save_sentiments)([news])
             
             serializer = SentimentResponseSerializer(sentiment_result)
             return Response({
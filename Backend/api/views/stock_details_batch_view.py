@@ -0,0 +1,228 @@
+from rest_framework.response import Response
+from rest_framework import status
+from datetime import datetime, timedelta
+from asgiref.sync import sync_to_async
+from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.db.models import Count, F, Max
+from django.db.models.functions import RowNumber
+from django.db.models.expressions import Window
+from django.utils import timezone
+from api.models import Stock, News, NewsSentimentHistory
+from api.serializers.row_serializers import row_serializer
+from api.serializers.stock_serializers import NewsSerializer
+from api.services.conditional_get import validators_for
+from api.services.event_stream import stock_quotes_updated
+from api.services.stock_api_service import StockAPIService
+from api.services.price_history_service import PriceHistoryService
+from api.services.response_cache import quote_updated, response_cache
+from api.services.single_flight import single_flight
+from api.services.admission import shed_load
+from api.signals import stocks_created
+from api.views.stock_details_view import StockDetailsView
+
+
+class StockDetailsBatchView(StockDetailsView):
+    
+    MAX_TICKERS = 50
+    
+    @extend_schema(
+        summary="Get stock details for several tickers",
+        description="Returns the /stock-details payload for each requested ticker, keyed by ticker in request order. "
+                    "Stale quotes are refreshed in one batched provider call and the rest is loaded with grouped queries",
+        parameters=[
+            OpenApiParameter(
+                name='tickers',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated stock tickers (e.g., "AAPL,MSFT"), at most 50',
+                required=True
+            ),
+            OpenApiParameter(
+                name='view',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='summary leaves `content` out of recentNews',
+                required=False,
+                default='full',
+                enum=['full', 'summary']
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated recentNews fields to return; id is always included',
+                required=False
+            ),
+        ],
+        responses={
+            200: {'type': 'object'},
+            503: {'description': 'Too many requests in progress; retry after Retry-After seconds'}
+        },
+    )
+    async def get(self, request):
+        tickers = list(dict.fromkeys(
+            t.strip().upper() for t in request.query_params.get('tickers', '').split(',') if t.strip()
+        ))
+        
+        if not tickers:
+            return Response(
+                {'error': 'Tickers parameter is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if len(tickers) > self.MAX_TICKERS:
+            return Response(
+                {'error': f'At most {self.MAX_TICKERS} tickers per request'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        try:
+            news_fields = NewsSerializer.requested_fields(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Each ticker shares its cache entry with GET /stock-details?ticker=...
+        params = {name: request.query_params[name] for name in ('view', 'fields') if name in request.query_params}
+        ticker_params = {ticker: dict(params, ticker=ticker) for ticker in tickers}
+        cache_keys, results = await sync_to_async(self._cached_many)(tickers, ticker_params)
+        
+        if len(results) < len(tickers):
+            return await self._load_missing(request, tickers, results, cache_keys, news_fields, ticker_params)
+        return Response({ticker: results[ticker] for ticker in tickers}, status=status.HTTP_200_OK)
+    
+    @shed_load('stock-details-batch')
+    async def _load_missing(self, request, tickers, results, cache_keys, news_fields, ticker_params):
+        missing = [ticker for ticker in tickers if ticker not in results]
+        try:
+            details = await self._details(missing, news_fields, ticker_params)
+            await sync_to_async(self._store_many)(cache_keys, details)
+            results.update({ticker: data for ticker, (data, validators, timeout) in details.items()})
+        except Exception as e:
+            return Response(
+                {'error': str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        return Response({ticker: results[ticker] for ticker in tickers}, status=status.HTTP_200_OK)
+    
+    def _cached_many(self, tickers, ticker_params):
+        cache_keys = {
+            ticker: response_cache.key('stock-details', ticker_params[ticker], ticker=ticker)
+            for ticker in tickers
+        }
+        cached = response_cache.get_many(cache_keys.values(), 'stock-details')
+        
+        results = {
+            ticker: cached[cache_keys[ticker]][0]
+            for ticker in tickers if cache_keys[ticker] in cached
+        }
+        return cache_keys, results
+    
+    def _store_many(self, cache_keys, details):
+        for ticker, (data, validators, timeout) in details.items():
+            response_cache.set(cache_keys[ticker], 'stock-details', (data, validators), timeout)
+    
+    async def _details(self, tickers, news_fields, ticker_params):
+        stocks = await sync_to_async(self._stocks)(tickers)
+        stock_service = StockAPIService()
+        now = datetime.now()
+        
+        stale = [ticker for ticker in tickers if self._should_update_stock_quote(stocks[ticker], now)]
+        if stale:
+            await single_flight.ado_many(stale, 'quote', lambda leading: self._arefresh_quotes(stock_service, leading))
+            stocks.update({stock.ticker: stock async for stock in Stock.objects.filter(ticker__in=stale)})
+        
+        today = now.date()
+        start_date = today - timedelta(days=self.HISTORY_DAYS)
+        
+        history_service = PriceHistoryService(stock_service)
+        await history_service.aensure_history_many(list(stocks.values()), start_date, today - timedelta(days=1))
+        
+        return await sync_to_async(self._assemble)(tickers, stocks, history_service, start_date, news_fields, ticker_params)
+    
+    def _assemble(self, tickers, stocks, history_service, start_date, news_fields, ticker_params):
+        stock_ids = {stock.pk: ticker for ticker, stock in stocks.items()}
+        empty_counts = {'total': 0, 'bullish': 0, 'bearish': 0, 'neutral': 0}
+        news_counts = {
+            stock_ids[row.pop('stock_id')]: row
+            for row in NewsSentimentHistory.objects.filter(
+                stock_id__in=list(stock_ids)
+            ).values('stock_id').annotate(
+                **self._news_count_aggregates(start_date)
+            ).order_by()
+        }
+        
+        news_rows = row_serializer(NewsSerializer, tuple(news_fields) if news_fields else None)
+        recent_news = {ticker: [] for ticker in tickers}
+        for row in News.objects.filter(ticker__in=tickers).annotate(
+            rank=Window(RowNumber(), partition_by=[F('ticker')], order_by=F('date').desc())
+        ).filter(
+            rank__lte=self.RECENT_NEWS_LIMIT
+        ).values(
+            *dict.fromkeys(NewsSerializer.model_fields(news_fields or NewsSerializer.Meta.fields) + ['ticker'])
+        ).order_by('ticker', 'rank'):
+            recent_news[row['ticker']].append(row)
+        
+        news_marks = {
+            row['ticker']: row
+            for row in News.objects.filter(ticker__in=tickers).values('ticker').annotate(
+                count=Count('id'),
+                updated=Max('updated_at')
+            ).order_by()
+        }
+        
+        details = {}
+        for ticker in tickers:
+            stock = stocks[ticker]
+            data = self._payload(
+                stock,
+                history_service.closes(stock, start_date)[:self.HISTORY_DAYS],
+                news_counts.get(ticker, empty_counts),
+                news_rows.serialize(recent_news[ticker]),
+                news_fields
+            )
+            
+            marks = news_marks.get(ticker, {})
+            watermark = self._watermark(stock, marks.get('count'), marks.get('updated'))
+            validators = None
+            if watermark is not None:
+                validators = validators_for('stock-details', response_cache.normalize(ticker_params[ticker]), watermark)
+            
+            details[ticker] = (data, validators, self._cache_timeout(stock))
+        return details
+    
+    def _stocks(self, tickers):
+        stocks = {stock.ticker: stock for stock in Stock.objects.filter(ticker__in=tickers)}
+        missing = [ticker for ticker in tickers if ticker not in stocks]
+        if missing:
+            Stock.objects.bulk_create(
+                [Stock(ticker=ticker, company_full_name=f'{ticker} Corporation') for ticker in missing],
+                ignore_conflicts=True
+            )
+            stocks.update({stock.ticker: stock for stock in Stock.objects.filter(ticker__in=missing)})
+            stocks_created(missing)
+        return stocks
+    
+    async def _arefresh_quotes(self, stock_service, tickers):
+        now = datetime.now()
+        stale = [
+            stock async for stock in Stock.objects.filter(ticker__in=tickers)
+            if self._should_update_stock_quote(stock, now)
+        ]
+        if not stale:
+            return {}
+        
+        quotes = await stock_service.aget_stock_quotes([stock.ticker for stock in stale])
+        updated_at = timezone.now()
+        updated = []
+        for stock in stale:
+            quote = quotes.get(stock.ticker)
+            if quote:
+                self._apply_quote(stock, quote)
+                stock.updated_at = updated_at
+                updated.append(stock)
+        
+        await Stock.objects.abulk_update(updated, self.QUOTE_FIELDS)
+        await sync_to_async(quote_updated)([stock.ticker for stock in updated])
+        stock_quotes_updated(updated)
+        return quotes
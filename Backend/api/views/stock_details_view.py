@@ -1,17 +1,31 @@
-from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from datetime import datetime, timedelta
+from asgiref.sync import sync_to_async
 from drf_spectacular.utils import extend_schema, OpenApiParameter
-from api.models import Stock, PriceHistory, NewsSentimentHistory, News
+from django.db import router
+from django.db.models import Count, Max, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from api.models import Stock, News, NewsSentimentHistory
 from api.serializers.stock_serializers import StockDetailsSerializer, NewsSentimentHistorySerializer, NewsSerializer
 from api.services.stock_api_service import StockAPIService
-from api.services.news_service import NewsService
+from api.services.price_history_service import PriceHistoryService
+from api.services.price_store import price_store
+from api.services.event_stream import stock_quotes_updated
+from api.services.conditional_get import add_validators, is_conditional, not_modified
+from api.services.response_cache import quote_updated, response_cache
+from api.services.single_flight import single_flight
+from api.services.admission import shed_load
+from api.views.async_api_view import AsyncAPIView
 
 
-class StockDetailsView(APIView):
+class StockDetailsView(AsyncAPIView):
     
     QUOTE_CACHE_DURATION = 3600
+    QUOTE_FIELDS = ['current_price', 'change_in_day', 'market_cap', 'volume', 'updated_at']
+    HISTORY_DAYS = 30
+    RECENT_NEWS_LIMIT = 10
     
     @extend_schema(
         summary="Get stock details",
@@ -24,10 +38,29 @@ class StockDetailsView(APIView):
                 description='Stock ticker symbol (e.g., AAPL, MSFT)',
                 required=True
             ),
+            OpenApiParameter(
+                name='view',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='summary leaves `content` out of recentNews; fetch it from /news/{id} when an article is opened',
+                required=False,
+                default='full',
+                enum=['full', 'summary']
+            ),
+            OpenApiParameter(
+                name='fields',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Comma-separated recentNews fields to return (e.g., "title,date,sentiment"); id is always included',
+                required=False
+            ),
         ],
-        responses={200: StockDetailsSerializer},
+        responses={
+            200: StockDetailsSerializer,
+            503: {'description': 'Too many requests in progress; retry after Retry-After seconds'}
+        },
     )
-    def get(self, request):
+    async def get(self, request):
         ticker = request.query_params.get('ticker', '').upper()
         
         if not ticker:
@@ -37,7 +70,20 @@ class StockDetailsView(APIView):
             )
         
         try:
-            stock, created = Stock.objects.get_or_create(
+            news_fields = NewsSerializer.requested_fields(request.query_params)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        cache_key, response = await sync_to_async(self._cached)(request, ticker)
+        if response is not None:
+            return response
+        
+        return await self._load(request, ticker, news_fields, cache_key)
+    
+    @shed_load('stock-details')
+    async def _load(self, request, ticker, news_fields, cache_key):
+        try:
+            stock, created = await Stock.objects.aget_or_create(
                 ticker=ticker,
                 defaults={'company_full_name': f'{ticker} Corporation'}
             )
@@ -48,109 +94,159 @@ class StockDetailsView(APIView):
             should_update_quote = self._should_update_stock_quote(stock, now)
             
             if should_update_quote:
-                quote = stock_service.get_stock_quote(ticker)
-                if quote:
-                    stock.current_price = quote['current_price']
-                    stock.change_in_day = quote['change_percent']
-                    if quote.get('market_cap'):
-                        stock.market_cap = quote['market_cap']
-                    if quote.get('volume'):
-                        stock.volume = quote['volume']
-                    stock.save()
-            
-            if not stock.company_full_name or stock.company_full_name == f'{ticker} Corporation':
-                news_service = NewsService()
+                await single_flight.ado(ticker, 'quote', lambda: self._arefresh_quote(stock_service, ticker))
+                await stock.arefresh_from_db()
             
             today = now.date()
-            start_date = today - timedelta(days=30)
-            
-            existing_history = PriceHistory.objects.filter(
-                stock=stock,
-                date__gte=start_date
-            ).values_list('date', flat=True)
-            existing_dates = set(existing_history)
-            
-            required_dates = set()
-            for i in range(30):
-                date = start_date + timedelta(days=i)
-                required_dates.add(date)
+            start_date = today - timedelta(days=self.HISTORY_DAYS)
             
-            missing_dates = required_dates - existing_dates
+            history_service = PriceHistoryService(stock_service)
+            await history_service.aensure_history(stock, start_date, today - timedelta(days=1))
             
-            if missing_dates:
-                oldest_missing = min(missing_dates)
-                days_to_fetch = (today - oldest_missing).days + 1
-                
-                price_history_data = stock_service.get_price_history(ticker, days=days_to_fetch)
-                
-                for price_data in price_history_data:
-                    if price_data['date'] in missing_dates:
-                        PriceHistory.objects.update_or_create(
-                            stock=stock,
-                            date=price_data['date'],
-                            defaults={
-                                'price': price_data['price'],
-                                'volume': price_data.get('volume', 0)
-                            }
-                        )
+            prices_history_list = (await sync_to_async(history_service.closes)(stock, start_date))[:self.HISTORY_DAYS]
             
-            price_history = PriceHistory.objects.filter(
-                stock=stock,
-                date__gte=start_date
-            ).order_by('date')[:30]
-            prices_history_list = [float(ph.price) for ph in price_history]
-            
-            end_date = datetime.now().date()
-            start_date = end_date - timedelta(days=30)
-            
-            news_with_sentiment = News.objects.filter(
-                ticker=ticker,
-                date__date__gte=start_date,
-                sentiment_analyzed=True
+            news_counts = await NewsSentimentHistory.objects.filter(stock=stock).aaggregate(
+                **self._news_count_aggregates(start_date)
             )
             
-            total_bullish = news_with_sentiment.filter(sentiment='Bullish').count()
-            total_bearish = news_with_sentiment.filter(sentiment='Bearish').count()
-            total_neutral = news_with_sentiment.filter(sentiment='Neutral').count()
-            
-            news_sentiment_data = {
-                'bullish': total_bullish,
-                'bearish': total_bearish,
-                'neutral': total_neutral
-            }
-            
-            news_sentiment_serializer = NewsSentimentHistorySerializer(news_sentiment_data)
-            
-            recent_news = News.objects.filter(ticker=ticker).order_by('-date')[:10]
-            recent_news_serializer = NewsSerializer(recent_news, many=True)
-            
-            total_news = News.objects.filter(ticker=ticker).count()
-            news_buzz_score = min(total_news / 100.0, 0.999999)
-            
-            market_cap_str = self._format_number(stock.market_cap) if stock.market_cap else 'N/A'
-            volume_str = self._format_number(stock.volume) if stock.volume else 'N/A'
-            
-            response_data = {
-                'companyFullName': stock.company_full_name,
-                'price': float(stock.current_price) if stock.current_price else 0.0,
-                'changeInDay': float(stock.change_in_day) if stock.change_in_day else 0.0,
-                'marketCap': market_cap_str,
-                'volume': volume_str,
-                'newsBuzz': f"{news_buzz_score:.6f}",
-                'pricesHistory': prices_history_list,
-                'newsSentiment': news_sentiment_serializer.data,
-                'recentNews': recent_news_serializer.data
-            }
-            
-            serializer = StockDetailsSerializer(response_data)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            recent_news = News.objects.filter(ticker=ticker)
+            if news_fields is not None:
+                recent_news = recent_news.only(*NewsSerializer.model_fields(news_fields))
+            recent_news = [news async for news in recent_news.order_by('-date')[:self.RECENT_NEWS_LIMIT]]
+            recent_news_serializer = NewsSerializer(recent_news, many=True, fields=news_fields)
             
+            data = self._payload(stock, prices_history_list, news_counts, recent_news_serializer.data, news_fields)
+            validators = await sync_to_async(self._store)(request, cache_key, stock, data)
+            return add_validators(Response(data, status=status.HTTP_200_OK), validators)
+        
         except Exception as e:
             return Response(
                 {'error': str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    def _cached(self, request, ticker):
+        cache_key = response_cache.key('stock-details', request.query_params, ticker=ticker)
+        cached = response_cache.get(cache_key, 'stock-details')
+        if cached is not None:
+            data, validators = cached
+            return cache_key, not_modified(request, validators) or add_validators(
+                Response(data, status=status.HTTP_200_OK), validators
+            )
+        
+        if is_conditional(request):
+            return cache_key, not_modified(request, response_cache.validators('stock-details', request, self.get_watermark))
+        return cache_key, None
+    
+    def _store(self, request, cache_key, stock, data):
+        validators = response_cache.validators('stock-details', request, self.get_watermark)
+        response_cache.set(cache_key, 'stock-details', (data, validators), self._cache_timeout(stock))
+        return validators
+    
+    def get_watermark(self, request):
+        ticker = request.query_params.get('ticker', '').upper()
+        
+        if router.db_for_read(News) != router.db_for_read(Stock):
+            # News is in its own database (api.routers): one query each.
+            stock = Stock.objects.filter(ticker=ticker).first()
+            if stock is None:
+                return None
+            news = News.objects.filter(ticker=ticker).aggregate(count=Count('id'), updated=Max('updated_at'))
+            return self._watermark(stock, news['count'], news['updated'])
+        
+        news = News.objects.filter(ticker=OuterRef('ticker')).order_by().values('ticker')
+        stock = Stock.objects.filter(ticker=ticker).annotate(
+            news_count=Subquery(news.annotate(count=Count('id')).values('count')),
+            news_updated=Subquery(news.annotate(updated=Max('updated_at')).values('updated'))
+        ).first()
+        
+        if stock is None:
+            return None
+        return self._watermark(stock, stock.news_count, stock.news_updated)
+    
+    def _watermark(self, stock, news_count, news_updated):
+        # A stale quote is refreshed by the request itself, so it cannot be validated.
+        if self._should_update_stock_quote(stock, datetime.now()):
+            return None
+        
+        # The 30-day windows move at midnight even when no row changes.
+        day_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        return [
+            day_start,
+            stock.updated_at,
+            stock.sentiment_decayed_at,
+            news_count,
+            news_updated,
+            price_store.modified_at(stock.ticker)
+        ]
+    
+    def _news_count_aggregates(self, start_date):
+        in_window = Q(date__gte=start_date)
+        return {
+            'total': Coalesce(Sum('total_news'), 0),
+            'bullish': Coalesce(Sum('bullish_count', filter=in_window), 0),
+            'bearish': Coalesce(Sum('bearish_count', filter=in_window), 0),
+            'neutral': Coalesce(Sum('neutral_count', filter=in_window), 0),
+        }
+    
+    def _payload(self, stock, prices_history_list, news_counts, recent_news, news_fields):
+        news_sentiment_data = {
+            'bullish': news_counts['bullish'],
+            'bearish': news_counts['bearish'],
+            'neutral': news_counts['neutral']
+        }
+        
+        news_sentiment_serializer = NewsSentimentHistorySerializer(news_sentiment_data)
+        
+        news_buzz_score = min(news_counts['total'] / 100.0, 0.999999)
+        
+        market_cap_str = self._format_number(stock.market_cap) if stock.market_cap else 'N/A'
+        volume_str = self._format_number(stock.volume) if stock.volume else 'N/A'
+        
+        response_data = {
+            'companyFullName': stock.company_full_name,
+            'price': float(stock.current_price) if stock.current_price else 0.0,
+            'changeInDay': float(stock.change_in_day) if stock.change_in_day else 0.0,
+            'marketCap': market_cap_str,
+            'volume': volume_str,
+            'newsBuzz': f"{news_buzz_score:.6f}",
+            'pricesHistory': prices_history_list,
+            'newsSentiment': news_sentiment_serializer.data,
+            'recentNews': recent_news
+        }
+        
+        serializer = StockDetailsSerializer(response_data, news_fields=news_fields)
+        return serializer.data
+    
+    async def _arefresh_quote(self, stock_service, ticker):
+        stock = await Stock.objects.aget(ticker=ticker)
+        if not self._should_update_stock_quote(stock, datetime.now()):
+            return stock
+        
+        quote = await stock_service.aget_stock_quote(ticker)
+        if quote:
+            self._apply_quote(stock, quote)
+            await stock.asave(update_fields=self.QUOTE_FIELDS)
+            await sync_to_async(quote_updated)([ticker])
+            stock_quotes_updated([stock])
+        return stock
+    
+    def _apply_quote(self, stock, quote):
+        stock.current_price = quote['current_price']
+        stock.change_in_day = quote['change_percent']
+        if quote.get('market_cap'):
+            stock.market_cap = quote['market_cap']
+        if quote.get('volume'):
+            stock.volume = quote['volume']
+    
+    def _cache_timeout(self, stock):
+        # Never serve a cached payload past the point where the quote itself
+        # would have been refreshed.
+        if not stock.current_price or not stock.updated_at:
+            return 0
+        age = (timezone.now() - stock.updated_at).total_seconds()
+        return int(self.QUOTE_CACHE_DURATION - age)
+    
     def _should_update_stock_quote(self, stock, now):
         if not stock.updated_at:
             return True
@@ -2,8 +2,11 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiParameter
+from django.db.models import Count, Max
 from api.models import Stock
+from api.serializers.row_serializers import row_serializer
 from api.serializers.stock_serializers import StockSerializer
+from api.services.response_cache import cached_response
 
 
 class StocksView(APIView):
@@ -23,11 +26,21 @@ class StocksView(APIView):
         ],
         responses={200: StockSerializer(many=True)},
     )
+    @cached_response('stocks')
     def get(self, request):
         limit = int(request.query_params.get('limit', 50))
         
-        stocks = Stock.objects.all()[:limit]
-        serializer = StockSerializer(stocks, many=True)
+        stock_rows = row_serializer(StockSerializer)
+        stocks = Stock.objects.values(*stock_rows.sources)[:limit]
         
-        return Response(serializer.data, status=status.HTTP_200_OK)
-
+        return Response(stock_rows.serialize(stocks), status=status.HTTP_200_OK)
+    
+    def get_watermark(self, request):
+        limit = int(request.query_params.get('limit', 50))
+        
+        watermark = Stock.objects.all()[:limit].aggregate(
+            count=Count('id'),
+            updated=Max('updated_at'),
+            scored=Max('sentiment_decayed_at')
+        )
+        return watermark.values()
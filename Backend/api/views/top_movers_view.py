@@ -1,16 +1,20 @@
-from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from api.services.stock_api_service import StockAPIService
 from api.serializers.stock_serializers import TopMoverSerializer
+from api.services.response_cache import cached_response
+from api.services.admission import shed_load
+from api.views.async_api_view import AsyncAPIView
 
 
-class TopMoversView(APIView):
+class TopMoversView(AsyncAPIView):
     
     @extend_schema(
         summary="Get top movers",
-        description="Returns stocks with the highest price changes",
+        description="Returns stocks with the highest price changes. While one refresh is running, further uncached "
+                    "requests get the last list computed for the same query, marked `X-Served-Stale: true`, "
+                    "or a 503 when there is none; both carry `Retry-After`",
         parameters=[
             OpenApiParameter(
                 name='limit',
@@ -21,13 +25,18 @@ class TopMoversView(APIView):
                 default=10
             ),
         ],
-        responses={200: TopMoverSerializer(many=True)},
+        responses={
+            200: TopMoverSerializer(many=True),
+            503: {'description': 'Too many requests in progress; retry after Retry-After seconds'}
+        },
     )
-    def get(self, request):
+    @cached_response('topMovers')
+    @shed_load('topMovers')
+    async def get(self, request):
         limit = int(request.query_params.get('limit', 10))
         
         stock_service = StockAPIService()
-        movers = stock_service.get_top_movers(limit=limit)
+        movers = await stock_service.aget_top_movers(limit=limit)
         
         serializer = TopMoverSerializer(movers, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)